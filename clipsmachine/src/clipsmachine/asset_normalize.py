@@ -0,0 +1,144 @@
+"""
+One-time normalization of intro/outro assets for stream-copy concatenation.
+
+The concat demuxer can only join files whose streams share codec, size,
+frame rate and timing parameters. Assets that differ from the main clip are
+re-encoded once into the cache and reused for every clip after that.
+"""
+
+import os
+import json
+import hashlib
+import subprocess
+import threading
+from typing import Dict, Any
+
+from .brand_cache import cache_dir
+from .ffprobe_cache import probe
+
+
+# Stream parameters that must match for the concat demuxer to stream-copy
+# intro/main/outro into one file without re-encoding.
+_CONCAT_VIDEO_KEYS = ("codec_name", "profile", "level", "width", "height", "pix_fmt", "r_frame_rate", "time_base")
+_CONCAT_AUDIO_KEYS = ("codec_name", "sample_rate", "channels")
+
+# Clips are encoded concurrently; the first ones to finish must not all
+# normalize the same asset at once
+_normalize_lock = threading.Lock()
+
+# CPU encoder used to re-encode an asset to the main clip's codec
+_NORMALIZE_ENCODERS = {"h264": "libx264", "hevc": "libx265"}
+
+def probe_concat_params(path: str) -> Dict[str, Any]:
+    """
+    Probe the stream parameters relevant to concat demuxer compatibility.
+
+    The underlying ffprobe call is cached per file version, so intro/outro
+    assets are probed once per run.
+
+    Args:
+        path: Path to video file
+
+    Returns:
+        Dict with 'video' and 'audio' parameter dicts (audio is None if absent)
+    """
+    streams = probe(path).get("streams", [])
+
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    if video is None:
+        raise RuntimeError(f"No video stream found in {path}")
+
+    return {
+        "video": {key: video.get(key) for key in _CONCAT_VIDEO_KEYS},
+        "audio": {key: audio.get(key) for key in _CONCAT_AUDIO_KEYS} if audio else None,
+    }
+
+
+def _normalize_for_concat(src: str, target: Dict[str, Any], dst: str) -> None:
+    """Re-encode src so its streams match the target concat parameters."""
+    video = target["video"]
+    audio = target["audio"]
+    width, height = video["width"], video["height"]
+    timescale = str(video["time_base"]).split("/")[-1]
+
+    cmd = ["ffmpeg", "-y", "-i", src]
+
+    # Sources without audio get a silent track so every concat input has the same streams
+    silent_audio = audio is not None and probe_concat_params(src)["audio"] is None
+    if silent_audio:
+        layout = "mono" if int(audio["channels"]) == 1 else "stereo"
+        cmd.extend([
+            "-f", "lavfi",
+            "-i", f"anullsrc=channel_layout={layout}:sample_rate={audio['sample_rate']}",
+            "-shortest",
+        ])
+
+    cmd.extend(["-map", "0:v:0"])
+    if audio is not None:
+        cmd.extend(["-map", "1:a:0" if silent_audio else "0:a:0"])
+
+    cmd.extend([
+        "-vf",
+        f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black,"
+        f"setsar=1,fps={video['r_frame_rate']}",
+        "-c:v", _NORMALIZE_ENCODERS.get(video["codec_name"], "libx264"),
+        "-preset", "medium",
+        "-crf", "23",
+        "-pix_fmt", video["pix_fmt"],
+        "-video_track_timescale", timescale,
+    ])
+    if video.get("profile"):
+        cmd.extend(["-profile:v", str(video["profile"]).lower()])
+    if video.get("level") and video["codec_name"] == "h264":
+        cmd.extend(["-level", f"{int(video['level']) / 10:.1f}"])
+
+    if audio is not None:
+        cmd.extend([
+            "-c:a", "aac",
+            "-b:a", "128k",
+            "-ar", str(audio["sample_rate"]),
+            "-ac", str(audio["channels"]),
+        ])
+    else:
+        cmd.append("-an")
+
+    cmd.append(dst)
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def ensure_normalized(src: str, target: Dict[str, Any]) -> str:
+    """
+    Return a version of an intro/outro asset that can be stream-copied alongside target.
+
+    If the asset already matches the target parameters it is returned as-is.
+    Otherwise it is re-encoded once into the cache, keyed by the asset path,
+    its mtime and the target parameters, so every later clip (and later run)
+    reuses the normalized file instead of re-encoding per clip.
+
+    Args:
+        src: Path to intro/outro video
+        target: Parameters from probe_concat_params() for the main clip
+
+    Returns:
+        Path to a concat-compatible version of the asset
+    """
+    if probe_concat_params(src) == target:
+        return src
+
+    key_source = f"{os.path.abspath(src)}:{os.path.getmtime(src)}:{json.dumps(target, sort_keys=True)}"
+    key = hashlib.sha1(key_source.encode("utf-8")).hexdigest()
+
+    normalized_dir = cache_dir("assets")
+    normalized_path = os.path.join(normalized_dir, f"{key}.mp4")
+
+    with _normalize_lock:
+        if not os.path.exists(normalized_path):
+            print(f"[brand] Normalizing {os.path.basename(src)} for stream-copy concat (one-time)...")
+            os.makedirs(normalized_dir, exist_ok=True)
+            tmp_path = f"{normalized_path}.{os.getpid()}.tmp.mp4"
+            _normalize_for_concat(src, target, tmp_path)
+            os.replace(tmp_path, normalized_path)
+
+    return normalized_path
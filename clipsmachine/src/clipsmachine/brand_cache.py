@@ -0,0 +1,125 @@
+"""
+On-disk cache of prebaked brand assets for ClipsMachine.
+
+The logo is static, so it is scaled and faded once with Pillow and saved as a
+PNG; FFmpeg then only has to overlay it, with no per-clip scale or alpha work.
+"""
+
+import os
+import hashlib
+import threading
+
+
+def cache_root() -> str:
+    """ClipsMachine's cache directory ($XDG_CACHE_HOME/clipsmachine)."""
+    xdg_cache = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(xdg_cache, "clipsmachine")
+
+
+def cache_dir(name: str) -> str:
+    """Directory for one kind of cached asset ($XDG_CACHE_HOME/clipsmachine/<name>)."""
+    return os.path.join(cache_root(), name)
+
+
+def logo_target_size(
+    logo_width: int,
+    logo_height: int,
+    video_width: int,
+    size_percent: int,
+) -> tuple[int, int]:
+    """
+    On-video logo size: width rounded up to a multiple of 16, even height.
+
+    16-pixel-aligned widths line up with FFmpeg's SIMD blending, and
+    an even height (like scale=W:-2) avoids odd chroma rows in yuv420p.
+
+    Args:
+        logo_width: Source logo width in pixels
+        logo_height: Source logo height in pixels
+        video_width: Target video width in pixels
+        size_percent: Logo size as percentage of video width
+
+    Returns:
+        (width, height) in pixels
+    """
+    width = ((video_width * size_percent // 100) + 15) & ~15
+    # Nearest even height, halves rounded up, as FFmpeg's av_rescale does
+    height = max((width * logo_height + logo_width) // (2 * logo_width) * 2, 2)
+    return width, height
+
+
+def bake_logo(
+    logo_path: str,
+    video_width: int,
+    size_percent: int,
+    opacity: float,
+    premultiply: bool = True,
+) -> str:
+    """
+    Scale a logo to its on-video size and apply opacity, caching the result.
+
+    The cache key covers the logo path, its mtime and the bake parameters,
+    so editing the logo or changing settings produces a fresh file.
+
+    With premultiply=True the RGB channels are multiplied by alpha, so the PNG
+    must be overlaid with alpha=premultiplied (create_logo_overlay_filter does
+    this on the CPU path). The GPU overlays expect straight alpha.
+
+    Args:
+        logo_path: Path to logo image (PNG with transparency recommended)
+        video_width: Target video width in pixels
+        size_percent: Logo size as percentage of video width
+        opacity: Logo opacity 0.0-1.0
+        premultiply: Store premultiplied instead of straight alpha
+
+    Returns:
+        Path to the prebaked RGBA PNG
+    """
+    if not os.path.exists(logo_path):
+        raise FileNotFoundError(f"Logo file not found: {logo_path}")
+
+    key_source = (
+        f"{os.path.abspath(logo_path)}:{os.path.getmtime(logo_path)}:"
+        f"{video_width}:{size_percent}:{opacity}:{premultiply}"
+    )
+    key = hashlib.sha1(key_source.encode("utf-8")).hexdigest()
+
+    logos_dir = cache_dir("logos")
+    baked_path = os.path.join(logos_dir, f"{key}.png")
+    if os.path.exists(baked_path):
+        return baked_path
+
+    try:
+        from PIL import Image, ImageChops
+    except ImportError:
+        print("[brand] Pillow not installed. Install: pip install Pillow")
+        raise
+
+    os.makedirs(logos_dir, exist_ok=True)
+
+    logo = Image.open(logo_path).convert("RGBA")
+
+    # Scale to target width with Lanczos for sharp edges, maintaining aspect ratio
+    target_size = logo_target_size(logo.width, logo.height, video_width, size_percent)
+    logo = logo.resize(target_size, Image.Resampling.LANCZOS)
+
+    if opacity < 1.0:
+        alpha = logo.getchannel("A").point(lambda v: int(v * opacity))
+        logo.putalpha(alpha)
+
+    if premultiply:
+        # Opacity is already folded into alpha, so one multiply per channel bakes it all in
+        red, green, blue, alpha = logo.split()
+        logo = Image.merge("RGBA", (
+            ImageChops.multiply(red, alpha),
+            ImageChops.multiply(green, alpha),
+            ImageChops.multiply(blue, alpha),
+            alpha,
+        ))
+
+    # Write to a temp name first so concurrent runs never read a partial PNG
+    tmp_path = f"{baked_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    logo.save(tmp_path, "PNG")
+    os.replace(tmp_path, baked_path)
+
+    return baked_path
@@ -8,19 +8,26 @@ Supports:
 """
 
 import os
-from typing import Dict, Any, Optional
+import subprocess
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional, List, Tuple
 from dataclasses import dataclass
 
+from .asset_normalize import probe_concat_params, ensure_normalized
+from .brand_cache import bake_logo
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class BrandTemplate:
-    """Configuration for brand elements on clips."""
+    """Configuration for brand elements on clips (immutable, so it can key caches)."""
     logo_path: Optional[str] = None
     logo_position: str = "top-right"  # top-left, top-right, bottom-left, bottom-right
     logo_size: int = 15  # Percentage of video width
     logo_opacity: float = 1.0  # 0.0 to 1.0
     intro_path: Optional[str] = None
     outro_path: Optional[str] = None
+    hw_accel: Optional[str] = None  # "cuda", "qsv", or None for CPU filters
 
 
 # Position mappings for logo overlay (x, y coordinates in FFmpeg format)
@@ -32,55 +39,221 @@ LOGO_POSITIONS = {
     "center": "(W-w)/2:(H-h)/2",
 }
 
+# Precomputed once: membership set and the "Choose from" list used in errors
+_POS_KEYS = frozenset(LOGO_POSITIONS)
+_POS_KEYS_STR = ", ".join(LOGO_POSITIONS)
+
+
+# GPU overlay filters per hardware backend
+HW_OVERLAY_FILTERS = {
+    "cuda": "overlay_cuda",
+    "qsv": "overlay_qsv",
+}
+
+
+# Appended after a GPU overlay when the frames go to a CPU encoder
+HW_DOWNLOAD_FILTER = "hwdownload,format=nv12"
+
+
+@lru_cache(maxsize=None)
+def _ffmpeg_components(kind: str) -> frozenset:
+    """Names listed by 'ffmpeg -hide_banner -<kind>' (filters, encoders), queried once per process."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", f"-{kind}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    return frozenset(
+        parts[1]
+        for parts in (line.split() for line in result.stdout.splitlines())
+        if len(parts) > 1
+    )
+
+
+def ffmpeg_has_filter(filter_name: str) -> bool:
+    """
+    Check whether the local FFmpeg build provides a filter.
+
+    The filter list is queried once per process and cached.
+
+    Args:
+        filter_name: FFmpeg filter name (e.g., 'overlay_cuda')
+
+    Returns:
+        True if the filter is available
+    """
+    return filter_name in _ffmpeg_components("filters")
+
+
+def ffmpeg_has_encoder(encoder_name: str) -> bool:
+    """
+    Check whether the local FFmpeg build provides an encoder.
+
+    Args:
+        encoder_name: FFmpeg encoder name (e.g., 'h264_nvenc')
+
+    Returns:
+        True if the encoder is available
+    """
+    return encoder_name in _ffmpeg_components("encoders")
+
+
+def resolve_hw_accel(hw_accel: Optional[str]) -> Optional[str]:
+    """
+    Return hw_accel if FFmpeg supports its overlay filter, otherwise None (CPU fallback).
+
+    Args:
+        hw_accel: Requested backend ("cuda", "qsv") or None
+
+    Returns:
+        Usable backend name, or None
+    """
+    if not hw_accel:
+        return None
+
+    overlay_filter = HW_OVERLAY_FILTERS.get(hw_accel)
+    if overlay_filter is None:
+        raise ValueError(f"Invalid hw_accel: {hw_accel}. Choose from: {list(HW_OVERLAY_FILTERS.keys())}")
+
+    if not ffmpeg_has_filter(overlay_filter):
+        print(f"[brand] Warning: FFmpeg has no {overlay_filter} filter, using CPU logo overlay")
+        return None
+
+    return hw_accel
+
+
+def hw_accel_input_args(hw_accel: Optional[str]) -> List[str]:
+    """
+    FFmpeg global arguments needed by the GPU overlay chain.
+
+    Args:
+        hw_accel: Resolved backend from resolve_hw_accel()
+
+    Returns:
+        Arguments to place before the inputs
+    """
+    if hw_accel == "qsv":
+        return ["-init_hw_device", "qsv=hw", "-filter_hw_device", "hw"]
+    return []
+
 
 def create_logo_overlay_filter(
     logo_path: str,
     position: str = "top-right",
-    size_percent: int = 15,
-    opacity: float = 1.0,
-    video_width: int = 1080,
-) -> str:
+    base_label: str = "0:v",
+    hw_accel: Optional[str] = None,
+    logo_label: str = "1:v",
+) -> Tuple[str, str]:
     """
-    Create FFmpeg filter for logo overlay.
+    Create FFmpeg filters for logo overlay.
+
+    The logo input ([1:v]) must already be scaled and faded (see
+    brand_cache.bake_logo), so the filter graph only composites it. The CPU
+    overlay expects premultiplied alpha; the GPU overlays expect straight alpha.
+
+    With hw_accel set, the returned pre-filter uploads the main video once,
+    at the end of its CPU chain, and the overlay output stays on the GPU.
+    The caller appends HW_DOWNLOAD_FILTER only if a CPU encoder follows.
 
     Args:
-        logo_path: Path to logo image (PNG with transparency recommended)
+        logo_path: Path to the prebaked logo PNG
         position: Logo position - top-left, top-right, bottom-left, bottom-right, center
-        size_percent: Logo size as percentage of video width (default: 15%)
-        opacity: Logo opacity 0.0-1.0 (default: 1.0)
-        video_width: Target video width for scaling calculation
+        base_label: Filter graph label of the main video (default: input 0)
+        hw_accel: GPU backend - "cuda", "qsv", or None for CPU filters
+        logo_label: Filter graph label of the logo (default: input 1)
 
     Returns:
-        FFmpeg filter string for logo overlay
+        (pre_filter, overlay_filter): filters to append to the main video
+        chain before it is labelled base_label (empty for CPU), and the
+        filter_complex fragment consuming [base_label] and [logo_label]
     """
     if not os.path.exists(logo_path):
         raise FileNotFoundError(f"Logo file not found: {logo_path}")
 
-    if position not in LOGO_POSITIONS:
-        raise ValueError(f"Invalid position: {position}. Choose from: {list(LOGO_POSITIONS.keys())}")
-
-    # Calculate logo width based on percentage
-    logo_width = int(video_width * (size_percent / 100))
+    if position not in _POS_KEYS:
+        raise ValueError(f"Invalid position: {position}. Choose from: {_POS_KEYS_STR}")
 
     # Get position coordinates
     position_coords = LOGO_POSITIONS[position]
 
-    # Build overlay filter with scaling and opacity
-    # Format: [logo][main]overlay=x:y
-    overlay_parts = [
-        # Scale logo to target width, maintaining aspect ratio
-        f"scale={logo_width}:-1",
-    ]
+    if hw_accel == "cuda":
+        # overlay_cuda takes yuva420p for the overlay and nv12 for the main video
+        x, y = position_coords.split(":")
+        return (
+            "format=nv12,hwupload_cuda",
+            f"[{logo_label}]format=yuva420p,hwupload_cuda[{base_label}_logo];"
+            f"[{base_label}][{base_label}_logo]overlay_cuda=x={x}:y={y}",
+        )
+
+    if hw_accel == "qsv":
+        # Requires the device from hw_accel_input_args()
+        x, y = position_coords.split(":")
+        return (
+            "format=nv12,hwupload=extra_hw_frames=64",
+            f"[{logo_label}]format=bgra,hwupload=extra_hw_frames=64[{base_label}_logo];"
+            f"[{base_label}][{base_label}_logo]overlay_qsv=x={x}:y={y}",
+        )
 
-    # Add opacity if less than 1.0
-    if opacity < 1.0:
-        # Use format filter to add alpha channel, then colorchannelmixer to adjust opacity
-        overlay_parts.append(f"format=rgba,colorchannelmixer=aa={opacity}")
+    return "", f"[{base_label}][{logo_label}]overlay={position_coords}:format=auto:alpha=premultiplied"
 
-    # Combine scaling and opacity into logo input filter
-    logo_filter = ",".join(overlay_parts)
 
-    return f"[1:v]{logo_filter}[logo];[0:v][logo]overlay={position_coords}"
+@dataclass(slots=True, frozen=True)
+class LogoOverlay:
+    """Everything cut_clip_ffmpeg needs to overlay a template's logo."""
+    input_path: str  # Prebaked logo to pass as FFmpeg input 1
+    pre_filter: str  # Appended to the main video chain before [base_label] ("" for CPU)
+    filter: str  # filter_complex fragment consuming [base_label] and [logo_label]
+    hw_accel: Optional[str]  # Resolved GPU backend, or None for CPU
+
+
+@lru_cache(maxsize=64)
+def prepare_logo_overlay(
+    template: BrandTemplate,
+    video_width: int,
+    base_label: str = "0:v",
+    logo_label: str = "1:v",
+) -> LogoOverlay:
+    """
+    Validate a template, prebake its logo and build the overlay filter.
+
+    Memoized per (template, video_width, labels), so a batch of clips
+    sharing one template validates and bakes once instead of once per clip.
+
+    Args:
+        template: BrandTemplate with logo_path set
+        video_width: Target video width in pixels
+        base_label: Filter graph label of the main video
+        logo_label: Filter graph label of the logo input
+
+    Returns:
+        LogoOverlay with the input path, filters and GPU backend
+    """
+    validate_template(template)
+    hw_accel = resolve_hw_accel(template.hw_accel)
+
+    # Scale + opacity are baked into a cached PNG once instead of filtered per clip
+    logo_path = bake_logo(
+        template.logo_path,
+        video_width,
+        template.logo_size,
+        template.logo_opacity,
+        premultiply=hw_accel is None,
+    )
+
+    pre_filter, overlay_filter = create_logo_overlay_filter(
+        logo_path, template.logo_position, base_label, hw_accel, logo_label
+    )
+    return LogoOverlay(
+        input_path=logo_path,
+        pre_filter=pre_filter,
+        filter=overlay_filter,
+        hw_accel=hw_accel,
+    )
 
 
 def requires_concat(template: BrandTemplate) -> bool:
@@ -96,34 +269,112 @@ def requires_concat(template: BrandTemplate) -> bool:
     return bool(template.intro_path or template.outro_path)
 
 
+def _concat_quote(path: str) -> str:
+    """Quote a path for an FFmpeg concat list (' becomes '\\'')."""
+    return "'" + path.replace("'", "'\\''") + "'"
+
+
 def build_concat_file_list(
     main_clip: str,
     template: BrandTemplate,
     temp_dir: str,
+    *,
+    validated: bool = False,
 ) -> str:
     """
     Build FFmpeg concat file list for intro/main/outro assembly.
 
+    Intro/outro assets are swapped for versions normalized to the main clip's
+    stream parameters (see asset_normalize.ensure_normalized), so the list can
+    always be joined with the concat demuxer and stream copy.
+
     Args:
         main_clip: Path to main clip video
         template: BrandTemplate configuration
         temp_dir: Directory for temporary concat file
+        validated: Template already passed validate_template, so intro/outro
+            are known to exist and are not checked again
 
     Returns:
         Path to concat file list
     """
-    concat_file = os.path.join(temp_dir, "concat_list.txt")
+    main_name = os.path.splitext(os.path.basename(main_clip))[0]
+    concat_file = os.path.join(temp_dir, f"{main_name}_concat_list.txt")
+
+    if validated:
+        has_intro = bool(template.intro_path)
+        has_outro = bool(template.outro_path)
+    else:
+        has_intro = bool(template.intro_path and os.path.exists(template.intro_path))
+        has_outro = bool(template.outro_path and os.path.exists(template.outro_path))
+    target = probe_concat_params(main_clip) if has_intro or has_outro else None
+
+    entries = []
+    if has_intro:
+        entries.append(ensure_normalized(template.intro_path, target))
+    entries.append(main_clip)
+    if has_outro:
+        entries.append(ensure_normalized(template.outro_path, target))
+
+    # Assemble the whole list up front and write it with a single write(2)
+    payload = "".join(
+        f"file {_concat_quote(os.path.abspath(path))}\n" for path in entries
+    ).encode("utf-8")
+
+    fd = os.open(concat_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
 
-    with open(concat_file, "w") as f:
-        if template.intro_path and os.path.exists(template.intro_path):
-            f.write(f"file '{template.intro_path}'\n")
+    return concat_file
 
-        f.write(f"file '{main_clip}'\n")
 
-        if template.outro_path and os.path.exists(template.outro_path):
-            f.write(f"file '{template.outro_path}'\n")
+def concat_intro_outro(
+    main_clip: str,
+    template: BrandTemplate,
+    output_path: str,
+    temp_dir: str,
+    *,
+    validated: bool = False,
+) -> str:
+    """
+    Assemble intro + main clip + outro with the concat demuxer (stream copy).
 
-    return concat_file
+    Intro/outro assets are normalized once to match the main clip's stream
+    parameters, so each clip is remuxed instead of decoded and re-encoded.
+
+    Args:
+        main_clip: Path to main clip video
+        template: BrandTemplate with intro_path and/or outro_path
+        output_path: Where to save the assembled clip
+        temp_dir: Directory for the temporary concat list
+        validated: Template already passed validate_template
+
+    Returns:
+        Path to the assembled clip
+    """
+    concat_file = build_concat_file_list(main_clip, template, temp_dir, validated=validated)
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", concat_file,
+        "-c", "copy",
+        "-movflags", "+faststart",
+        output_path,
+    ]
+
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    finally:
+        try:
+            os.remove(concat_file)
+        except OSError:
+            pass
+
+    return output_path
 
 
 def validate_template(template: BrandTemplate) -> None:
@@ -137,19 +388,11 @@ def validate_template(template: BrandTemplate) -> None:
         ValueError: If template configuration is invalid
         FileNotFoundError: If referenced files don't exist
     """
-    if template.logo_path and not os.path.exists(template.logo_path):
-        raise FileNotFoundError(f"Logo file not found: {template.logo_path}")
-
-    if template.intro_path and not os.path.exists(template.intro_path):
-        raise FileNotFoundError(f"Intro video not found: {template.intro_path}")
-
-    if template.outro_path and not os.path.exists(template.outro_path):
-        raise FileNotFoundError(f"Outro video not found: {template.outro_path}")
-
-    if template.logo_position not in LOGO_POSITIONS:
+    # Cheap value checks first so bad settings fail before any filesystem access
+    if template.logo_position not in _POS_KEYS:
         raise ValueError(
             f"Invalid logo position: {template.logo_position}. "
-            f"Choose from: {list(LOGO_POSITIONS.keys())}"
+            f"Choose from: {_POS_KEYS_STR}"
         )
 
     if not 0.0 <= template.logo_opacity <= 1.0:
@@ -157,3 +400,24 @@ def validate_template(template: BrandTemplate) -> None:
 
     if not 5 <= template.logo_size <= 50:
         raise ValueError(f"Logo size must be between 5% and 50%, got: {template.logo_size}%")
+
+    # Brand assets usually live in one folder: list each directory once and
+    # check membership instead of stat-ing every file. Unset fields cost nothing.
+    by_dir = defaultdict(list)
+    for path, label in (
+        (template.logo_path, "Logo file"),
+        (template.intro_path, "Intro video"),
+        (template.outro_path, "Outro video"),
+    ):
+        if path:
+            by_dir[os.path.dirname(path) or "."].append((path, label))
+
+    for directory, entries in by_dir.items():
+        try:
+            with os.scandir(directory) as it:
+                present = {entry.name for entry in it}
+        except OSError:
+            present = frozenset()
+        for path, label in entries:
+            if os.path.basename(path) not in present:
+                raise FileNotFoundError(f"{label} not found: {path}")
@@ -1,49 +1,72 @@
 import argparse
 import os
+import re
+import sys
+from functools import lru_cache
+
+from typing import TYPE_CHECKING
 
-from .pipeline import process_video, extract_video_id
-from .metadata import enhance_manifest
-from .uploader import upload_clips_for_video
 from .config import OUTPUT_ROOT
-from .subtitle_styles import get_available_fonts
-from .brand_templates import BrandTemplate
-from .multi_uploader import MultiPlatformUploader, print_platform_info
-from .platforms import get_all_platforms
-from .thumbnail_generator import ThumbnailGenerator
-from .cloud_storage import CloudStorageManager
-from .scheduler import PostScheduler, process_pending_posts
 from datetime import datetime, timedelta
 
+if TYPE_CHECKING:
+    from .brand_templates import BrandTemplate
+
 
 def _build_style_config(args: argparse.Namespace) -> dict:
-    """Extract subtitle style configuration from CLI arguments."""
+    """Extract subtitle style configuration from CLI arguments (defaults come from _add_style_args)."""
     return {
-        'font_preset': getattr(args, 'font', 'montserrat'),
-        'font_size': getattr(args, 'font_size', 68),
-        'text_color': getattr(args, 'text_color', 'white'),
-        'outline_color': getattr(args, 'outline_color', 'black'),
-        'outline_width': getattr(args, 'outline_width', 7),
-        'shadow_depth': getattr(args, 'shadow_depth', 3),
-        'glow': getattr(args, 'glow', True),
+        'font_preset': args.font,
+        'font_size': args.font_size,
+        'text_color': args.text_color,
+        'outline_color': args.outline_color,
+        'outline_width': args.outline_width,
+        'shadow_depth': args.shadow_depth,
+        'glow': args.glow,
     }
 
 
-def _build_brand_template(args: argparse.Namespace) -> BrandTemplate | None:
+def _build_brand_template(args: argparse.Namespace) -> "BrandTemplate | None":
     """Extract brand template configuration from CLI arguments."""
-    if not getattr(args, 'logo', None):
+    if not (args.logo or args.intro or args.outro):
         return None
 
+    from .brand_templates import BrandTemplate
+
     return BrandTemplate(
         logo_path=args.logo,
-        logo_position=getattr(args, 'logo_position', 'top-right'),
-        logo_size=getattr(args, 'logo_size', 15),
-        logo_opacity=getattr(args, 'logo_opacity', 1.0),
-        intro_path=getattr(args, 'intro', None),
-        outro_path=getattr(args, 'outro', None),
+        logo_position=args.logo_position,
+        logo_size=args.logo_size,
+        logo_opacity=args.logo_opacity,
+        intro_path=args.intro,
+        outro_path=args.outro,
+        hw_accel=args.hw_accel,
     )
 
 
+_PLATFORMS_SPLIT = re.compile(r'\s*,\s*')
+
+
+@lru_cache(maxsize=1)
+def _all_platforms() -> tuple:
+    """Names of all supported platforms, looked up once per process."""
+    from .platforms import get_all_platforms
+
+    return tuple(get_all_platforms())
+
+
+def _parse_platforms(value: str | None) -> list[str]:
+    """Split a comma-separated --platforms value (empty entries dropped), defaulting to all platforms."""
+    if not value:
+        return list(_all_platforms())
+    return list(filter(None, _PLATFORMS_SPLIT.split(value.strip())))
+
+
 def cmd_run(args: argparse.Namespace) -> None:
+    from .pipeline import process_video, extract_video_id
+    from .metadata import enhance_manifest
+    from .uploader import upload_clips_for_video
+
     url = args.youtube_url
     video_id = extract_video_id(url)
 
@@ -53,11 +76,11 @@ def cmd_run(args: argparse.Namespace) -> None:
 
     print("\n[1/3] Generating clips…")
     enable_subtitles = not args.skip_subtitles
-    subtitle_type = args.subtitle_type if hasattr(args, 'subtitle_type') else "transcription"
+    subtitle_type = args.subtitle_type
 
     # Build configuration from CLI arguments
     style_config = _build_style_config(args)
-    aspect_ratio = getattr(args, 'aspect_ratio', '9:16')
+    aspect_ratio = args.aspect_ratio
     brand_template = _build_brand_template(args)
 
     clips = process_video(
@@ -66,7 +89,9 @@ def cmd_run(args: argparse.Namespace) -> None:
         subtitle_type=subtitle_type,
         style_config=style_config,
         aspect_ratio=aspect_ratio,
-        brand_template=brand_template
+        brand_template=brand_template,
+        encoder=args.encoder,
+        single_pass=args.single_pass,
     )
     print(f"[1/3] Generated {len(clips)} clips.")
 
@@ -100,27 +125,64 @@ def cmd_run(args: argparse.Namespace) -> None:
 
 
 def cmd_clip_only(args: argparse.Namespace) -> None:
+    from .pipeline import process_video
+
     url = args.youtube_url
     os.makedirs(OUTPUT_ROOT, exist_ok=True)
     enable_subtitles = not args.skip_subtitles
-    subtitle_type = args.subtitle_type if hasattr(args, 'subtitle_type') else "transcription"
+    subtitle_type = args.subtitle_type
 
     # Build configuration from CLI arguments
     style_config = _build_style_config(args)
-    aspect_ratio = getattr(args, 'aspect_ratio', '9:16')
+    aspect_ratio = args.aspect_ratio
     brand_template = _build_brand_template(args)
 
-    process_video(
-        url,
-        enable_subtitles=enable_subtitles,
-        subtitle_type=subtitle_type,
-        style_config=style_config,
-        aspect_ratio=aspect_ratio,
-        brand_template=brand_template
-    )
+    if not args.cloud_provider:
+        process_video(
+            url,
+            enable_subtitles=enable_subtitles,
+            subtitle_type=subtitle_type,
+            style_config=style_config,
+            aspect_ratio=aspect_ratio,
+            brand_template=brand_template,
+            encoder=args.encoder,
+            single_pass=args.single_pass,
+        )
+        return
+
+    # Upload each clip while the next one encodes
+    import queue
+    from concurrent.futures import ThreadPoolExecutor
+    from .cloud_storage import CloudStorageManager
+
+    manager = CloudStorageManager(provider=args.cloud_provider)
+    clip_queue = queue.Queue()
+    with ThreadPoolExecutor(max_workers=1) as consumer:
+        uploads = consumer.submit(manager.upload_from_queue, clip_queue)
+        try:
+            process_video(
+                url,
+                enable_subtitles=enable_subtitles,
+                subtitle_type=subtitle_type,
+                style_config=style_config,
+                aspect_ratio=aspect_ratio,
+                brand_template=brand_template,
+                encoder=args.encoder,
+                single_pass=args.single_pass,
+                on_clip_ready=lambda path, clip: clip_queue.put((clip.clip_index, path, None)),
+            )
+        finally:
+            clip_queue.put(None)
+        urls = uploads.result()
+
+    print(f"\n[CloudUpload] Uploaded {len(urls)} clips")
+    for clip_idx, url_dict in urls.items():
+        print(f"  Clip #{clip_idx}: {url_dict['video']}")
 
 
 def cmd_enhance(args: argparse.Namespace) -> None:
+    from .metadata import enhance_manifest
+
     enhance_manifest(
         video_id=args.video_id,
         channel_positioning=args.positioning,
@@ -131,6 +193,8 @@ def cmd_enhance(args: argparse.Namespace) -> None:
 
 
 def cmd_upload(args: argparse.Namespace) -> None:
+    from .uploader import upload_clips_for_video
+
     upload_clips_for_video(
         video_id=args.video_id,
         privacy_status=args.privacy,
@@ -142,8 +206,9 @@ def cmd_upload(args: argparse.Namespace) -> None:
 
 def cmd_post(args: argparse.Namespace) -> None:
     """Post clips to multiple social media platforms."""
-    platforms = args.platforms.split(',') if args.platforms else get_all_platforms()
-    platforms = [p.strip() for p in platforms]
+    from .multi_uploader import MultiPlatformUploader
+
+    platforms = _parse_platforms(args.platforms)
 
     uploader = MultiPlatformUploader(platforms)
 
@@ -154,17 +219,21 @@ def cmd_post(args: argparse.Namespace) -> None:
         start_index=args.start_index,
         max_clips=args.max_clips,
         parallel_platforms=not args.sequential,
-        privacy_status=getattr(args, 'privacy', 'public'),
+        privacy_status=args.privacy,
     )
 
 
 def cmd_platforms(args: argparse.Namespace) -> None:
     """List all supported social media platforms."""
+    from .multi_uploader import print_platform_info
+
     print_platform_info()
 
 
 def cmd_thumbnails(args: argparse.Namespace) -> None:
     """Generate thumbnails for all clips."""
+    from .thumbnail_generator import ThumbnailGenerator
+
     generator = ThumbnailGenerator(
         add_logo=args.logo is not None,
         logo_path=args.logo
@@ -179,6 +248,8 @@ def cmd_thumbnails(args: argparse.Namespace) -> None:
 
 def cmd_cloud_upload(args: argparse.Namespace) -> None:
     """Upload clips to cloud storage (S3 or Cloudinary)."""
+    from .cloud_storage import CloudStorageManager
+
     manager = CloudStorageManager(provider=args.provider)
 
     urls = manager.upload_clips_for_video(
@@ -195,6 +266,8 @@ def cmd_cloud_upload(args: argparse.Namespace) -> None:
 
 def cmd_schedule(args: argparse.Namespace) -> None:
     """Schedule clips for automated posting."""
+    from .scheduler import PostScheduler
+
     scheduler = PostScheduler()
 
     # Parse start time
@@ -205,8 +278,7 @@ def cmd_schedule(args: argparse.Namespace) -> None:
         start_time = datetime.now() + timedelta(hours=1)
 
     # Parse platforms
-    platforms = args.platforms.split(',') if args.platforms else get_all_platforms()
-    platforms = [p.strip() for p in platforms]
+    platforms = _parse_platforms(args.platforms)
 
     post_ids = scheduler.schedule_batch(
         video_id=args.video_id,
@@ -224,6 +296,8 @@ def cmd_schedule(args: argparse.Namespace) -> None:
 
 def cmd_schedule_list(args: argparse.Namespace) -> None:
     """List upcoming scheduled posts."""
+    from .scheduler import PostScheduler
+
     scheduler = PostScheduler()
     posts = scheduler.list_upcoming(limit=args.limit)
 
@@ -241,18 +315,23 @@ def cmd_schedule_list(args: argparse.Namespace) -> None:
 
 def cmd_schedule_run(args: argparse.Namespace) -> None:
     """Process pending scheduled posts (run this with cron)."""
+    from .scheduler import PostScheduler, process_pending_posts
+
     scheduler = PostScheduler()
     stats = process_pending_posts(
         scheduler=scheduler,
         clips_output_root=OUTPUT_ROOT,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        max_workers=args.max_workers,
     )
 
-    print(f"\n[Schedule] Posted: {stats['posted']}, Failed: {stats['failed']}")
+    print(f"\n[Schedule] Posted: {stats['posted']}, Failed: {stats['failed']}, Deferred: {stats['deferred']}")
 
 
 def cmd_schedule_stats(args: argparse.Namespace) -> None:
     """Show scheduling statistics."""
+    from .scheduler import PostScheduler
+
     scheduler = PostScheduler()
     stats = scheduler.get_stats()
 
@@ -262,276 +341,226 @@ def cmd_schedule_stats(args: argparse.Namespace) -> None:
     print()
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="clipsmachine",
-        description="Automated YouTube clips generator/uploader.",
-    )
-    subparsers = parser.add_subparsers(dest="command", required=True)
+class _LazyFontChoices:
+    """argparse choices for --font that only load the font presets when first consulted."""
 
-    # run
-    p_run = subparsers.add_parser(
-        "run", help="Download → clip → LLM metadata → upload."
-    )
-    p_run.add_argument("youtube_url", help="YouTube URL of long-form video.")
-    p_run.add_argument(
-        "--privacy",
-        choices=["public", "unlisted", "private"],
-        default="unlisted",
-        help="YouTube privacy for uploads (default: unlisted).",
-    )
-    p_run.add_argument(
-        "--max-clips",
-        type=int,
-        default=None,
-        help="Limit number of clips to process/upload.",
-    )
-    p_run.add_argument(
-        "--start-index",
-        type=int,
-        default=1,
-        help="Start from this clip_index (1-based).",
-    )
-    p_run.add_argument(
-        "--positioning",
-        type=str,
-        default=(
-            "We run a clips channel that curates short, high-impact moments "
-            "from long-form conversations about business, psychology, performance, and self-improvement."
-        ),
-        help="Channel positioning string for LLM prompts.",
-    )
-    p_run.add_argument(
-        "--tags",
-        type=str,
-        default="clips,podcast,business,mindset,self improvement",
-        help="Comma-separated base tags (LLM context only).",
-    )
-    p_run.add_argument(
-        "--skip-llm",
-        action="store_true",
-        help="Skip LLM metadata enhancement.",
-    )
-    p_run.add_argument(
-        "--skip-upload",
-        action="store_true",
-        help="Skip YouTube upload.",
-    )
-    p_run.add_argument(
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _keys() -> tuple:
+        from .subtitle_styles import get_available_fonts
+
+        return tuple(get_available_fonts())
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._keys()
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __repr__(self) -> str:
+        return ", ".join(self._keys())
+
+    __str__ = __repr__
+
+
+def _add_source_args(parser: argparse.ArgumentParser) -> None:
+    """Source video and subtitle options shared by the 'run' and 'clip' subcommands."""
+    parser.add_argument("youtube_url", help="YouTube URL of long-form video.")
+    parser.add_argument(
         "--skip-subtitles",
         action="store_true",
         help="Skip text overlay generation (faster but less engaging).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--subtitle-type",
         choices=["keywords", "transcription", "both"],
         default="transcription",
         help="Type of subtitles: 'keywords' (LLM-selected key words), 'transcription' (full Whisper AI captions), or 'both' (default: transcription).",
     )
-    p_run.add_argument(
-        "--sleep-between-uploads",
-        type=int,
-        default=5,
-        help="Seconds between uploads (default: 5).",
-    )
-    # Font and styling options
-    p_run.add_argument(
+
+
+def _add_style_args(parser: argparse.ArgumentParser) -> None:
+    """Subtitle style, aspect ratio and encoding options shared by the 'run' and 'clip' subcommands."""
+    parser.add_argument(
         "--font",
-        choices=list(get_available_fonts().keys()),
+        choices=_LazyFontChoices(),
         default="montserrat",
         help="Font preset: impact, arial, montserrat, bebas, bangers, oswald, roboto, poppins (default: montserrat).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--font-size",
         type=int,
         default=68,
         help="Font size in pixels (default: 68 - optimized for impact and readability).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--text-color",
         type=str,
         default="white",
         help="Text color: white, black, red, blue, yellow, green, cyan, magenta, orange, purple (default: white).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--outline-color",
         type=str,
         default="black",
         help="Outline/border color (default: black).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--outline-width",
         type=int,
         default=7,
         help="Outline thickness in pixels (default: 7 - thicker for better pop and contrast).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--shadow-depth",
         type=int,
         default=3,
         help="Shadow depth in pixels (default: 3 - deeper for 3D effect).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--no-glow",
         action="store_false",
         dest="glow",
         help="Disable glow effect on text (enabled by default for modern aesthetic).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--aspect-ratio",
         choices=["9:16", "1:1", "16:9"],
         default="9:16",
         help="Output aspect ratio: 9:16 (Shorts/Reels/TikTok), 1:1 (Instagram), 16:9 (YouTube) (default: 9:16).",
     )
-    # Brand template options
-    p_run.add_argument(
+    parser.add_argument(
+        "--encoder",
+        choices=["auto", "libx264", "h264_nvenc", "hevc_nvenc"],
+        default="auto",
+        help="Video encoder: auto uses NVIDIA NVENC when available, else libx264 (default: auto).",
+    )
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="Cut neighbouring clips in batches from one decode of the source video.",
+    )
+
+
+def _add_brand_args(parser: argparse.ArgumentParser) -> None:
+    """Brand template options shared by the 'run' and 'clip' subcommands."""
+    parser.add_argument(
         "--logo",
         type=str,
         default=None,
         help="Path to logo image file (PNG with transparency recommended).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--logo-position",
         choices=["top-left", "top-right", "bottom-left", "bottom-right", "center"],
         default="top-right",
         help="Logo position on video (default: top-right).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--logo-size",
         type=int,
         default=15,
         help="Logo size as percentage of video width, 5-50 (default: 15).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--logo-opacity",
         type=float,
         default=1.0,
         help="Logo opacity, 0.0-1.0 (default: 1.0).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--intro",
         type=str,
         default=None,
         help="Path to intro video clip (will be prepended to each clip).",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--outro",
         type=str,
         default=None,
         help="Path to outro video clip (will be appended to each clip).",
     )
-    p_run.set_defaults(func=cmd_run)
-
-    # clip
-    p_clip = subparsers.add_parser(
-        "clip", help="Only download and generate clips + manifest."
-    )
-    p_clip.add_argument("youtube_url", help="YouTube URL of long-form video.")
-    p_clip.add_argument(
-        "--skip-subtitles",
-        action="store_true",
-        help="Skip text overlay generation.",
+    parser.add_argument(
+        "--hw-accel",
+        choices=["cuda", "qsv"],
+        default=None,
+        help="Composite the logo on the GPU (cuda or qsv); falls back to CPU if FFmpeg lacks support.",
     )
-    p_clip.add_argument(
-        "--subtitle-type",
-        choices=["keywords", "transcription", "both"],
-        default="transcription",
-        help="Type of subtitles (default: transcription).",
+
+
+def _add_run_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'run' subcommand."""
+    _add_source_args(parser)
+    _add_style_args(parser)
+    _add_brand_args(parser)
+    parser.add_argument(
+        "--privacy",
+        choices=["public", "unlisted", "private"],
+        default="unlisted",
+        help="YouTube privacy for uploads (default: unlisted).",
     )
-    # Font and styling options
-    p_clip.add_argument(
-        "--font",
-        choices=list(get_available_fonts().keys()),
-        default="montserrat",
-        help="Font preset: impact, arial, montserrat, bebas, bangers, oswald, roboto, poppins (default: montserrat).",
+    parser.add_argument(
+        "--max-clips",
+        type=int,
+        default=None,
+        help="Limit number of clips to process/upload.",
     )
-    p_clip.add_argument(
-        "--font-size",
+    parser.add_argument(
+        "--start-index",
         type=int,
-        default=68,
-        help="Font size in pixels (default: 68 - optimized for impact and readability).",
+        default=1,
+        help="Start from this clip_index (1-based).",
     )
-    p_clip.add_argument(
-        "--text-color",
+    parser.add_argument(
+        "--positioning",
         type=str,
-        default="white",
-        help="Text color: white, black, red, blue, yellow, green, cyan, magenta, orange, purple (default: white).",
+        default=(
+            "We run a clips channel that curates short, high-impact moments "
+            "from long-form conversations about business, psychology, performance, and self-improvement."
+        ),
+        help="Channel positioning string for LLM prompts.",
     )
-    p_clip.add_argument(
-        "--outline-color",
+    parser.add_argument(
+        "--tags",
         type=str,
-        default="black",
-        help="Outline/border color (default: black).",
-    )
-    p_clip.add_argument(
-        "--outline-width",
-        type=int,
-        default=7,
-        help="Outline thickness in pixels (default: 7 - thicker for better pop and contrast).",
-    )
-    p_clip.add_argument(
-        "--shadow-depth",
-        type=int,
-        default=3,
-        help="Shadow depth in pixels (default: 3 - deeper for 3D effect).",
-    )
-    p_clip.add_argument(
-        "--no-glow",
-        action="store_false",
-        dest="glow",
-        help="Disable glow effect on text (enabled by default for modern aesthetic).",
-    )
-    p_clip.add_argument(
-        "--aspect-ratio",
-        choices=["9:16", "1:1", "16:9"],
-        default="9:16",
-        help="Output aspect ratio: 9:16 (Shorts/Reels/TikTok), 1:1 (Instagram), 16:9 (YouTube) (default: 9:16).",
+        default="clips,podcast,business,mindset,self improvement",
+        help="Comma-separated base tags (LLM context only).",
     )
-    # Brand template options
-    p_clip.add_argument(
-        "--logo",
-        type=str,
-        default=None,
-        help="Path to logo image file (PNG with transparency recommended).",
+    parser.add_argument(
+        "--skip-llm",
+        action="store_true",
+        help="Skip LLM metadata enhancement.",
     )
-    p_clip.add_argument(
-        "--logo-position",
-        choices=["top-left", "top-right", "bottom-left", "bottom-right", "center"],
-        default="top-right",
-        help="Logo position on video (default: top-right).",
+    parser.add_argument(
+        "--skip-upload",
+        action="store_true",
+        help="Skip YouTube upload.",
     )
-    p_clip.add_argument(
-        "--logo-size",
+    parser.add_argument(
+        "--sleep-between-uploads",
         type=int,
-        default=15,
-        help="Logo size as percentage of video width, 5-50 (default: 15).",
-    )
-    p_clip.add_argument(
-        "--logo-opacity",
-        type=float,
-        default=1.0,
-        help="Logo opacity, 0.0-1.0 (default: 1.0).",
-    )
-    p_clip.add_argument(
-        "--intro",
-        type=str,
-        default=None,
-        help="Path to intro video clip (will be prepended to each clip).",
+        default=5,
+        help="Seconds between uploads (default: 5).",
     )
-    p_clip.add_argument(
-        "--outro",
-        type=str,
+
+
+def _add_clip_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'clip' subcommand."""
+    _add_source_args(parser)
+    _add_style_args(parser)
+    _add_brand_args(parser)
+    parser.add_argument(
+        "--cloud-provider",
+        choices=["s3", "cloudinary"],
         default=None,
-        help="Path to outro video clip (will be appended to each clip).",
+        help="Upload each clip to cloud storage as soon as it is encoded (overlaps encoding and upload).",
     )
-    p_clip.set_defaults(func=cmd_clip_only)
 
-    # enhance
-    p_enhance = subparsers.add_parser(
-        "enhance", help="Only run LLM metadata enhancement on existing manifest."
-    )
-    p_enhance.add_argument("video_id", help="Video ID folder under clips_output/<video_id>/")
-    p_enhance.add_argument(
+
+def _add_enhance_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'enhance' subcommand."""
+    parser.add_argument("video_id", help="Video ID folder under clips_output/<video_id>/")
+    parser.add_argument(
         "--positioning",
         type=str,
         default=(
@@ -540,209 +569,282 @@ def build_parser() -> argparse.ArgumentParser:
         ),
         help="Channel positioning string for LLM prompts.",
     )
-    p_enhance.add_argument(
+    parser.add_argument(
         "--tags",
         type=str,
         default="clips,podcast,business,mindset,self improvement",
         help="Comma-separated base tags (LLM context only).",
     )
-    p_enhance.add_argument(
+    parser.add_argument(
         "--start-index",
         type=int,
         default=1,
         help="Start from this clip_index (1-based).",
     )
-    p_enhance.add_argument(
+    parser.add_argument(
         "--max-clips",
         type=int,
         default=None,
         help="Limit number of clips to enhance.",
     )
-    p_enhance.set_defaults(func=cmd_enhance)
 
-    # upload
-    p_upload = subparsers.add_parser(
-        "upload", help="Only upload existing clips using manifest."
-    )
-    p_upload.add_argument("video_id", help="Video ID folder under clips_output/<video_id>/")
-    p_upload.add_argument(
+
+def _add_upload_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'upload' subcommand."""
+    parser.add_argument("video_id", help="Video ID folder under clips_output/<video_id>/")
+    parser.add_argument(
         "--privacy",
         choices=["public", "unlisted", "private"],
         default="unlisted",
         help="YouTube privacy for uploads (default: unlisted).",
     )
-    p_upload.add_argument(
+    parser.add_argument(
         "--start-index",
         type=int,
         default=1,
         help="Start from this clip_index (1-based).",
     )
-    p_upload.add_argument(
+    parser.add_argument(
         "--max-clips",
         type=int,
         default=None,
         help="Limit number of clips to upload.",
     )
-    p_upload.add_argument(
+    parser.add_argument(
         "--sleep-between-uploads",
         type=int,
         default=5,
         help="Seconds between uploads (default: 5).",
     )
-    p_upload.set_defaults(func=cmd_upload)
 
-    # post - Multi-platform posting
-    p_post = subparsers.add_parser(
-        "post",
-        help="Post clips to multiple social media platforms (YouTube, Instagram, TikTok, etc.)"
-    )
-    p_post.add_argument("video_id", help="Video ID folder under clips_output/<video_id>/")
-    p_post.add_argument(
+
+def _add_post_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'post' subcommand."""
+    parser.add_argument("video_id", help="Video ID folder under clips_output/<video_id>/")
+    parser.add_argument(
         "--platforms",
         type=str,
         default=None,
         help="Comma-separated list of platforms: youtube,instagram,tiktok,twitter,linkedin,facebook (default: all)",
     )
-    p_post.add_argument(
+    parser.add_argument(
         "--privacy",
         type=str,
         default="public",
         help="Privacy setting for platforms that support it (default: public).",
     )
-    p_post.add_argument(
+    parser.add_argument(
         "--start-index",
         type=int,
         default=1,
         help="Start from this clip_index (1-based).",
     )
-    p_post.add_argument(
+    parser.add_argument(
         "--max-clips",
         type=int,
         default=None,
         help="Limit number of clips to post.",
     )
-    p_post.add_argument(
+    parser.add_argument(
         "--sequential",
         action="store_true",
         help="Upload to platforms sequentially instead of in parallel.",
     )
-    p_post.set_defaults(func=cmd_post)
 
-    # platforms - List supported platforms
-    p_platforms = subparsers.add_parser(
-        "platforms",
-        help="List all supported social media platforms and their status."
-    )
-    p_platforms.set_defaults(func=cmd_platforms)
 
-    # thumbnails - Generate thumbnails
-    p_thumbnails = subparsers.add_parser(
-        "thumbnails",
-        help="Generate thumbnails for all clips in a video."
-    )
-    p_thumbnails.add_argument("video_id", help="Video ID folder under clips_output/<video_id>/")
-    p_thumbnails.add_argument(
+def _add_thumbnails_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'thumbnails' subcommand."""
+    parser.add_argument("video_id", help="Video ID folder under clips_output/<video_id>/")
+    parser.add_argument(
         "--logo",
         type=str,
         default=None,
         help="Path to logo image to add as watermark."
     )
-    p_thumbnails.add_argument(
+    parser.add_argument(
         "--timestamp",
         type=float,
         default=3.0,
         help="Seconds into clip to extract frame (default: 3.0)."
     )
-    p_thumbnails.set_defaults(func=cmd_thumbnails)
 
-    # cloud-upload - Upload to cloud storage
-    p_cloud = subparsers.add_parser(
-        "cloud-upload",
-        help="Upload clips to cloud storage (S3 or Cloudinary)."
-    )
-    p_cloud.add_argument("video_id", help="Video ID folder")
-    p_cloud.add_argument(
+
+def _add_cloud_upload_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'cloud-upload' subcommand."""
+    parser.add_argument("video_id", help="Video ID folder")
+    parser.add_argument(
         "--provider",
         choices=["s3", "cloudinary"],
         default="s3",
         help="Cloud storage provider (default: s3)."
     )
-    p_cloud.add_argument(
+    parser.add_argument(
         "--start-index",
         type=int,
         default=1,
         help="Start from this clip index."
     )
-    p_cloud.add_argument(
+    parser.add_argument(
         "--max-clips",
         type=int,
         default=None,
         help="Maximum clips to upload."
     )
-    p_cloud.set_defaults(func=cmd_cloud_upload)
 
-    # schedule - Schedule automated posting
-    p_schedule = subparsers.add_parser(
-        "schedule",
-        help="Schedule clips for automated posting at optimal times."
-    )
-    p_schedule.add_argument("video_id", help="Video ID folder")
-    p_schedule.add_argument(
+
+def _add_schedule_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'schedule' subcommand."""
+    parser.add_argument("video_id", help="Video ID folder")
+    parser.add_argument(
         "--start-time",
         type=str,
         default=None,
         help="Start time (ISO format: 2024-01-01T12:00:00). Default: 1 hour from now."
     )
-    p_schedule.add_argument(
+    parser.add_argument(
         "--interval",
         type=int,
         default=12,
         help="Hours between posts (default: 12)."
     )
-    p_schedule.add_argument(
+    parser.add_argument(
         "--platforms",
         type=str,
         default=None,
         help="Comma-separated platforms (default: all)."
     )
-    p_schedule.set_defaults(func=cmd_schedule)
 
-    # schedule-list - List scheduled posts
-    p_schedule_list = subparsers.add_parser(
-        "schedule-list",
-        help="List upcoming scheduled posts."
-    )
-    p_schedule_list.add_argument(
+
+def _add_schedule_list_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'schedule-list' subcommand."""
+    parser.add_argument(
         "--limit",
         type=int,
         default=20,
         help="Maximum posts to show (default: 20)."
     )
-    p_schedule_list.set_defaults(func=cmd_schedule_list)
 
-    # schedule-run - Process pending posts
-    p_schedule_run = subparsers.add_parser(
-        "schedule-run",
-        help="Process pending scheduled posts (run with cron)."
-    )
-    p_schedule_run.add_argument(
+
+def _add_schedule_run_args(parser: argparse.ArgumentParser) -> None:
+    """Arguments for the 'schedule-run' subcommand."""
+    parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Show what would be posted without actually posting."
     )
-    p_schedule_run.set_defaults(func=cmd_schedule_run)
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Posts uploaded at once (default: 4)."
+    )
+
+
+# Subcommand name -> (help, argument registration, handler)
+SUBCOMMANDS = {
+    "run": ("Download → clip → LLM metadata → upload.", _add_run_args, cmd_run),
+    "clip": ("Only download and generate clips + manifest.", _add_clip_args, cmd_clip_only),
+    "enhance": ("Only run LLM metadata enhancement on existing manifest.", _add_enhance_args, cmd_enhance),
+    "upload": ("Only upload existing clips using manifest.", _add_upload_args, cmd_upload),
+    "post": ("Post clips to multiple social media platforms (YouTube, Instagram, TikTok, etc.)", _add_post_args, cmd_post),
+    "platforms": ("List all supported social media platforms and their status.", None, cmd_platforms),
+    "thumbnails": ("Generate thumbnails for all clips in a video.", _add_thumbnails_args, cmd_thumbnails),
+    "cloud-upload": ("Upload clips to cloud storage (S3 or Cloudinary).", _add_cloud_upload_args, cmd_cloud_upload),
+    "schedule": ("Schedule clips for automated posting at optimal times.", _add_schedule_args, cmd_schedule),
+    "schedule-list": ("List upcoming scheduled posts.", _add_schedule_list_args, cmd_schedule_list),
+    "schedule-run": ("Process pending scheduled posts (run with cron).", _add_schedule_run_args, cmd_schedule_run),
+    "schedule-stats": ("Show scheduling statistics.", None, cmd_schedule_stats),
+}
+
+
+def _build_subcommand_parser(
+    parser: argparse.ArgumentParser,
+    configure,
+    handler,
+) -> argparse.ArgumentParser:
+    """Register a subcommand's arguments and handler on its parser."""
+    if configure is not None:
+        configure(parser)
+    parser.set_defaults(func=handler)
+    return parser
 
-    # schedule-stats - Show statistics
-    p_schedule_stats = subparsers.add_parser(
-        "schedule-stats",
-        help="Show scheduling statistics."
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the full parser with every subcommand (used for --help and errors)."""
+    parser = argparse.ArgumentParser(
+        prog="clipsmachine",
+        description="Automated YouTube clips generator/uploader.",
     )
-    p_schedule_stats.set_defaults(func=cmd_schedule_stats)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (help_text, configure, handler) in SUBCOMMANDS.items():
+        _build_subcommand_parser(subparsers.add_parser(name, help=help_text), configure, handler)
 
     return parser
 
 
-def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
+def _identity(value):
+    """Module-level stand-in for argparse's default type converter, which is a closure and can't be pickled."""
+    return value
+
+
+def _cached_subcommand_parser(name: str, configure, handler) -> argparse.ArgumentParser:
+    """
+    Build the parser for one subcommand, optionally via an on-disk pickle cache.
+
+    The cache is only used with CLIPSMACHINE_PARSER_CACHE=1. Entries live in
+    the per-user cache directory and are keyed by cli.py's mtime, so editing
+    this file invalidates them. Any cache failure falls back to building.
+
+    Args:
+        name: Subcommand name
+        configure: Argument registration function, or None
+        handler: cmd_* function to dispatch to
+
+    Returns:
+        Parser for the subcommand
+    """
+    def build() -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser(prog=f"clipsmachine {name}", description=SUBCOMMANDS[name][0])
+        return _build_subcommand_parser(parser, configure, handler)
+
+    if os.getenv("CLIPSMACHINE_PARSER_CACHE") != "1":
+        return build()
+
+    import pickle
+    from .brand_cache import cache_dir
+
+    parser_dir = cache_dir("parser")
+    cache_path = os.path.join(parser_dir, f"{name}-{os.stat(__file__).st_mtime_ns}.pkl")
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+
+    parser = build()
+    parser.register('type', None, _identity)
+    try:
+        os.makedirs(parser_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(parser, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+        print(f"[cli] Warning: Could not cache parser for '{name}': {e}")
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Fast path: build only the parser for the requested subcommand
+    entry = SUBCOMMANDS.get(argv[0]) if argv else None
+    if entry is None:
+        args = build_parser().parse_args(argv)
+    else:
+        _, configure, handler = entry
+        args = _cached_subcommand_parser(argv[0], configure, handler).parse_args(argv[1:])
+        args.command = argv[0]
     args.func(args)
@@ -4,23 +4,210 @@ Upload videos to S3, Cloudinary, or other cloud storage for Instagram/TikTok pos
 """
 
 import os
+import re
 import json
-from typing import Optional, Dict, Any
+import queue
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, Iterable, Set, List
 from pathlib import Path
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .log import get_logger
+from .manifest_io import read_manifest, index_clips
+from .retry import call_with_retry
+
+log = get_logger(__name__)
+
+
+# Read size for upload sources; the SDK defaults (8-64 KB) mean many small reads per clip
+UPLOAD_READ_BUFFER = 1024 * 1024
+
+# HTTP connections kept alive per storage client (covers 16 clips x multipart parts)
+UPLOAD_POOL_SIZE = 64
+
+# Object URLs: virtual-hosted (bucket.s3.region.amazonaws.com/key) or
+# path-style (s3.region.amazonaws.com/bucket/key) S3, and Cloudinary delivery
+# URLs (res.cloudinary.com/cloud/video/upload/v123/folder/file.mp4)
+_S3_VIRTUAL_URL_RE = re.compile(
+    r"^https?://(?P<bucket>[^/]+?)\.s3(?:[.-][^/]+)?\.amazonaws\.com/(?P<key>[^?#]+)"
+)
+_S3_PATH_URL_RE = re.compile(
+    r"^https?://s3(?:[.-][^/]+)?\.amazonaws\.com/(?P<bucket>[^/]+)/(?P<key>[^?#]+)"
+)
+_CLOUDINARY_URL_RE = re.compile(
+    r"/(?P<resource_type>image|video|raw)/upload/(?:.*?/)?v\d+/(?P<public_id>[^?#]+?)(?:\.[A-Za-z0-9]+)?(?:[?#].*)?$"
+)
+
+# Keys per S3 DeleteObjects request / public IDs per Cloudinary delete_resources
+# and resources_by_ids call
+S3_DELETE_BATCH = 1000
+CLOUDINARY_DELETE_BATCH = 100
+CLOUDINARY_LOOKUP_BATCH = 100
+
+
+def _prefetch_upload_source(path: str) -> None:
+    """
+    Ask the kernel to start reading an upload source into the page cache.
+
+    Uploads read the file sequentially (S3 part threads read disjoint ranges),
+    so an async WILLNEED readahead lets disk reads overlap the first network
+    round trips. No-op where posix_fadvise is unavailable.
+
+    Args:
+        path: File about to be uploaded
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _list_file_names(directory: str) -> Set[str]:
+    """
+    List the names of regular files in a directory with a single scandir.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Set of file names (empty if the directory does not exist)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+@lru_cache(maxsize=None)
+def _get_s3_client(config_file: str) -> Tuple[Any, str, Any]:
+    """
+    Build the S3 client for a config file once per process.
+
+    boto3 clients are thread-safe, so every S3Storage (and upload thread)
+    reading the same config shares one client.
+
+    Args:
+        config_file: Absolute path to the S3 JSON config
+
+    Returns:
+        (s3_client, bucket_name, transfer_config)
+    """
+    try:
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config as BotoConfig
+
+        with open(config_file, 'r') as f:
+            config = json.load(f)
+
+        bucket_name = config.get("bucket_name")
+
+        # Enough pooled connections for concurrent clips x multipart parts,
+        # so parallel uploads reuse TLS sessions instead of reconnecting.
+        # Credentials are bound to one session/client shared by every thread,
+        # with SigV4 and virtual-hosted addressing pinned up front (matching
+        # the bucket.s3.region URLs built below) so requests are signed the
+        # same way every time instead of being resolved per endpoint.
+        session = boto3.session.Session(
+            aws_access_key_id=config.get("aws_access_key_id"),
+            aws_secret_access_key=config.get("aws_secret_access_key"),
+            region_name=config.get("region", "us-east-1"),
+        )
+        s3_client = session.client(
+            's3',
+            config=BotoConfig(
+                signature_version="s3v4",
+                s3={"addressing_style": "virtual"},
+                max_pool_connections=UPLOAD_POOL_SIZE,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            ),
+        )
+
+        # Clips are often tens to hundreds of MB: split into 8 MB parts,
+        # upload up to 10 of them at once and read the file in 1 MB chunks
+        transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=10,
+            use_threads=True,
+            io_chunksize=UPLOAD_READ_BUFFER,
+        )
+
+        log.info(f"[S3] Initialized with bucket: {bucket_name}")
+        return s3_client, bucket_name, transfer_config
+
+    except ImportError:
+        log.error("[S3] boto3 not installed. Install: pip install boto3")
+        raise
+    except Exception as e:
+        log.error(f"[S3] Initialization failed: {e}")
+        raise
+
+
+@lru_cache(maxsize=None)
+def _get_cloudinary(config_file: str) -> Any:
+    """
+    Configure the cloudinary module from a config file once per process.
+
+    Args:
+        config_file: Absolute path to the Cloudinary JSON config
+
+    Returns:
+        The configured cloudinary module
+    """
+    try:
+        import cloudinary
+        import cloudinary.uploader
+
+        with open(config_file, 'r') as f:
+            config = json.load(f)
+
+        cloudinary.config(
+            cloud_name=config.get("cloud_name"),
+            api_key=config.get("api_key"),
+            api_secret=config.get("api_secret")
+        )
+
+        log.info(f"[Cloudinary] Initialized")
+        return cloudinary
+
+    except ImportError:
+        log.error("[Cloudinary] cloudinary not installed. Install: pip install cloudinary")
+        raise
+    except Exception as e:
+        log.error(f"[Cloudinary] Initialization failed: {e}")
+        raise
 
 
 class CloudStorage(ABC):
     """Abstract base class for cloud storage providers."""
 
+    # Whether the provider's client already retries failed requests itself;
+    # CloudStorageManager then makes one attempt per file instead of stacking
+    # its own retries on top
+    retries_internally = False
+
     @abstractmethod
-    def upload(self, file_path: str, public: bool = True) -> str:
+    def upload(self, file_path: str, public: bool = True, folder: str = "clips") -> str:
         """
         Upload file to cloud storage.
 
         Args:
             file_path: Path to file to upload
             public: Make file publicly accessible
+            folder: Folder to upload into
 
         Returns:
             Public URL of uploaded file
@@ -40,10 +227,42 @@ class CloudStorage(ABC):
         """
         pass
 
+    def delete_many(self, urls: Iterable[str]) -> int:
+        """
+        Delete several files from cloud storage.
+
+        Providers with a bulk delete API override this to use fewer requests.
+
+        Args:
+            urls: URLs of files to delete
+
+        Returns:
+            Number of files deleted
+        """
+        return sum(1 for url in urls if self.delete(url))
+
+    def find_uploaded(self, files: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Find local files that are already stored remotely with the same size.
+
+        Providers that can look objects up cheaply override this so re-runs
+        skip files a previous (possibly interrupted) run already uploaded.
+
+        Args:
+            files: (file_path, folder) pairs, as they would be passed to upload()
+
+        Returns:
+            Dict mapping file_path to the existing public URL
+        """
+        return {}
+
 
 class S3Storage(CloudStorage):
     """AWS S3 storage implementation."""
 
+    # botocore retries each request (and each multipart part) with backoff
+    retries_internally = True
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize S3 storage.
@@ -59,35 +278,16 @@ class S3Storage(CloudStorage):
         self.config_file = config_path or "s3_config.json"
         self.s3_client = None
         self.bucket_name = None
+        self.transfer_config = None
 
         if os.path.exists(self.config_file):
             self._initialize()
 
     def _initialize(self):
-        """Initialize S3 client."""
-        try:
-            import boto3
-
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-
-            self.bucket_name = config.get("bucket_name")
-
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=config.get("aws_access_key_id"),
-                aws_secret_access_key=config.get("aws_secret_access_key"),
-                region_name=config.get("region", "us-east-1")
-            )
-
-            print(f"[S3] Initialized with bucket: {self.bucket_name}")
-
-        except ImportError:
-            print("[S3] boto3 not installed. Install: pip install boto3")
-            raise
-        except Exception as e:
-            print(f"[S3] Initialization failed: {e}")
-            raise
+        """Initialize S3 client (shared by every S3Storage using the same config file)."""
+        self.s3_client, self.bucket_name, self.transfer_config = _get_s3_client(
+            os.path.abspath(self.config_file)
+        )
 
     def upload(self, file_path: str, public: bool = True, folder: str = "clips") -> str:
         """
@@ -104,7 +304,9 @@ class S3Storage(CloudStorage):
         if not self.s3_client:
             raise RuntimeError("S3 not initialized. Check config file.")
 
-        if not os.path.exists(file_path):
+        try:
+            file_size = os.path.getsize(file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         # Generate S3 key (path in bucket)
@@ -116,25 +318,38 @@ class S3Storage(CloudStorage):
         if public:
             extra_args['ACL'] = 'public-read'
 
-        print(f"[S3] Uploading {file_name} to s3://{self.bucket_name}/{s3_key}")
+        log.info(f"[S3] Uploading {file_name} to s3://{self.bucket_name}/{s3_key}")
+        _prefetch_upload_source(file_path)
 
         try:
-            self.s3_client.upload_file(
-                file_path,
-                self.bucket_name,
-                s3_key,
-                ExtraArgs=extra_args
-            )
+            if file_size < self.transfer_config.multipart_threshold:
+                # Small files (thumbnails): one PutObject streamed straight from
+                # the open file, skipping the transfer manager's worker threads
+                # and chunk buffers
+                with open(file_path, "rb", buffering=UPLOAD_READ_BUFFER) as f:
+                    self.s3_client.put_object(
+                        Bucket=self.bucket_name,
+                        Key=s3_key,
+                        Body=f,
+                        **extra_args,
+                    )
+            else:
+                self.s3_client.upload_file(
+                    file_path,
+                    self.bucket_name,
+                    s3_key,
+                    ExtraArgs=extra_args,
+                    Config=self.transfer_config,
+                )
 
             # Generate public URL
-            region = self.s3_client.meta.region_name
-            url = f"https://{self.bucket_name}.s3.{region}.amazonaws.com/{s3_key}"
+            url = self._object_url(s3_key)
 
-            print(f"[S3] Uploaded: {url}")
+            log.info(f"[S3] Uploaded: {url}")
             return url
 
         except Exception as e:
-            print(f"[S3] Upload failed: {e}")
+            log.error(f"[S3] Upload failed: {e}")
             raise
 
     def delete(self, url: str) -> bool:
@@ -142,19 +357,98 @@ class S3Storage(CloudStorage):
         if not self.s3_client:
             return False
 
-        try:
-            # Extract key from URL
-            # URL format: https://bucket.s3.region.amazonaws.com/key
-            key = url.split(f"{self.bucket_name}.s3.")[-1].split('/', 1)[-1]
+        key = self._key_from_url(url)
+        if key is None:
+            log.error(f"[S3] Delete failed: not an object URL in bucket {self.bucket_name}: {url}")
+            return False
 
+        try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
-            print(f"[S3] Deleted: {key}")
+            log.info(f"[S3] Deleted: {key}")
             return True
 
         except Exception as e:
-            print(f"[S3] Delete failed: {e}")
+            log.error(f"[S3] Delete failed: {e}")
             return False
 
+    def delete_many(self, urls: Iterable[str]) -> int:
+        """Delete files from S3 with one DeleteObjects request per 1000 keys."""
+        if not self.s3_client:
+            return 0
+
+        keys = []
+        for url in urls:
+            key = self._key_from_url(url)
+            if key is None:
+                log.warning(f"[S3] Delete skipped: not an object URL in bucket {self.bucket_name}: {url}")
+            else:
+                keys.append(key)
+
+        deleted = 0
+        for start in range(0, len(keys), S3_DELETE_BATCH):
+            batch = keys[start:start + S3_DELETE_BATCH]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except Exception as e:
+                log.error(f"[S3] Batch delete failed: {e}")
+                continue
+
+            errors = response.get("Errors", [])
+            for error in errors:
+                log.error(f"[S3] Delete failed: {error.get('Key')}: {error.get('Message')}")
+            deleted += len(batch) - len(errors)
+
+        log.info(f"[S3] Deleted {deleted}/{len(keys)} objects")
+        return deleted
+
+    def find_uploaded(self, files: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+        """HEAD the candidate keys concurrently; a matching ContentLength counts as uploaded."""
+        if not self.s3_client:
+            return {}
+
+        files = list(files)
+        if not files:
+            return {}
+
+        def head(file_path: str, folder: str) -> Optional[str]:
+            s3_key = f"{folder}/{Path(file_path).name}"
+            try:
+                response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            except Exception:
+                # 404 (not uploaded yet) or a transient error: upload it
+                return None
+            if response.get("ContentLength") != os.path.getsize(file_path):
+                return None
+            return self._object_url(s3_key)
+
+        found = {}
+        with ThreadPoolExecutor(max_workers=min(UPLOAD_POOL_SIZE, len(files))) as executor:
+            future_to_path = {
+                executor.submit(head, file_path, folder): file_path
+                for file_path, folder in files
+            }
+            for future in as_completed(future_to_path):
+                url = future.result()
+                if url:
+                    found[future_to_path[future]] = url
+
+        return found
+
+    def _object_url(self, s3_key: str) -> str:
+        """Public URL of an object in this bucket."""
+        region = self.s3_client.meta.region_name
+        return f"https://{self.bucket_name}.s3.{region}.amazonaws.com/{s3_key}"
+
+    def _key_from_url(self, url: str) -> Optional[str]:
+        """Extract the object key from a URL in this bucket (None if it isn't one)."""
+        match = _S3_VIRTUAL_URL_RE.match(url) or _S3_PATH_URL_RE.match(url)
+        if not match or match["bucket"] != self.bucket_name:
+            return None
+        return match["key"]
+
 
 class CloudinaryStorage(CloudStorage):
     """Cloudinary storage implementation."""
@@ -177,29 +471,8 @@ class CloudinaryStorage(CloudStorage):
             self._initialize()
 
     def _initialize(self):
-        """Initialize Cloudinary."""
-        try:
-            import cloudinary
-            import cloudinary.uploader
-
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-
-            cloudinary.config(
-                cloud_name=config.get("cloud_name"),
-                api_key=config.get("api_key"),
-                api_secret=config.get("api_secret")
-            )
-
-            self.cloudinary = cloudinary
-            print(f"[Cloudinary] Initialized")
-
-        except ImportError:
-            print("[Cloudinary] cloudinary not installed. Install: pip install cloudinary")
-            raise
-        except Exception as e:
-            print(f"[Cloudinary] Initialization failed: {e}")
-            raise
+        """Initialize Cloudinary (configured once per config file)."""
+        self.cloudinary = _get_cloudinary(os.path.abspath(self.config_file))
 
     def upload(self, file_path: str, public: bool = True, folder: str = "clips") -> str:
         """
@@ -220,23 +493,25 @@ class CloudinaryStorage(CloudStorage):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         file_name = Path(file_path).stem
-        print(f"[Cloudinary] Uploading {file_name}...")
+        log.info(f"[Cloudinary] Uploading {file_name}...")
+        _prefetch_upload_source(file_path)
 
         try:
-            result = self.cloudinary.uploader.upload(
-                file_path,
-                resource_type="video",
-                folder=folder,
-                public_id=file_name,
-                overwrite=True,
-            )
+            with open(file_path, "rb", buffering=UPLOAD_READ_BUFFER) as f:
+                result = self.cloudinary.uploader.upload(
+                    f,
+                    resource_type="video",
+                    folder=folder,
+                    public_id=file_name,
+                    overwrite=True,
+                )
 
             url = result.get("secure_url")
-            print(f"[Cloudinary] Uploaded: {url}")
+            log.info(f"[Cloudinary] Uploaded: {url}")
             return url
 
         except Exception as e:
-            print(f"[Cloudinary] Upload failed: {e}")
+            log.error(f"[Cloudinary] Upload failed: {e}")
             raise
 
     def delete(self, url: str) -> bool:
@@ -244,24 +519,88 @@ class CloudinaryStorage(CloudStorage):
         if not self.cloudinary:
             return False
 
-        try:
-            # Extract public_id from URL
-            # URL format: https://res.cloudinary.com/cloud/video/upload/v123/folder/file.mp4
-            parts = url.split('/upload/')[-1].split('/')
-            public_id = '/'.join(parts[1:]).rsplit('.', 1)[0]
+        match = _CLOUDINARY_URL_RE.search(url)
+        if not match:
+            log.error(f"[Cloudinary] Delete failed: not a Cloudinary asset URL: {url}")
+            return False
 
-            self.cloudinary.uploader.destroy(public_id, resource_type="video")
-            print(f"[Cloudinary] Deleted: {public_id}")
+        public_id = match["public_id"]
+        try:
+            self.cloudinary.uploader.destroy(public_id, resource_type=match["resource_type"])
+            log.info(f"[Cloudinary] Deleted: {public_id}")
             return True
 
         except Exception as e:
-            print(f"[Cloudinary] Delete failed: {e}")
+            log.error(f"[Cloudinary] Delete failed: {e}")
             return False
 
+    def delete_many(self, urls: Iterable[str]) -> int:
+        """Delete files from Cloudinary with one Admin API call per 100 assets."""
+        if not self.cloudinary:
+            return 0
+
+        import cloudinary.api
+
+        # delete_resources takes a single resource type per call
+        public_ids_by_type: Dict[str, List[str]] = {}
+        for url in urls:
+            match = _CLOUDINARY_URL_RE.search(url)
+            if not match:
+                log.warning(f"[Cloudinary] Delete skipped: not a Cloudinary asset URL: {url}")
+                continue
+            public_ids_by_type.setdefault(match["resource_type"], []).append(match["public_id"])
+
+        deleted = 0
+        for resource_type, public_ids in public_ids_by_type.items():
+            for start in range(0, len(public_ids), CLOUDINARY_DELETE_BATCH):
+                batch = public_ids[start:start + CLOUDINARY_DELETE_BATCH]
+                try:
+                    result = cloudinary.api.delete_resources(batch, resource_type=resource_type)
+                except Exception as e:
+                    log.error(f"[Cloudinary] Batch delete failed: {e}")
+                    continue
+                deleted += sum(1 for status in result.get("deleted", {}).values() if status == "deleted")
+
+        log.info(f"[Cloudinary] Deleted {deleted} assets")
+        return deleted
+
+    def find_uploaded(self, files: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+        """Look candidate public IDs up in batches of 100; a matching byte size counts as uploaded."""
+        if not self.cloudinary:
+            return {}
+
+        import cloudinary.api
+
+        # Same public_id scheme as upload(): folder/stem
+        path_by_public_id = {
+            f"{folder}/{Path(file_path).stem}": file_path
+            for file_path, folder in files
+        }
+        public_ids = list(path_by_public_id)
+
+        found = {}
+        for start in range(0, len(public_ids), CLOUDINARY_LOOKUP_BATCH):
+            batch = public_ids[start:start + CLOUDINARY_LOOKUP_BATCH]
+            try:
+                result = cloudinary.api.resources_by_ids(batch, resource_type="video")
+            except Exception as e:
+                log.warning(f"[Cloudinary] Lookup failed, uploading everything: {e}")
+                continue
+
+            for resource in result.get("resources", []):
+                file_path = path_by_public_id.get(resource.get("public_id"))
+                if file_path and resource.get("bytes") == os.path.getsize(file_path):
+                    found[file_path] = resource.get("secure_url")
+
+        return found
+
 
 class CloudStorageManager:
     """Manage multiple cloud storage providers."""
 
+    # Remote folder per upload kind
+    FOLDERS = {"video": "clips", "thumbnail": "thumbnails"}
+
     def __init__(self, provider: str = "s3"):
         """
         Initialize cloud storage manager.
@@ -280,11 +619,11 @@ class CloudStorageManager:
 
     def upload_clip(self, video_path: str) -> str:
         """Upload video clip and return public URL."""
-        return self.storage.upload(video_path)
+        return self.storage.upload(video_path, folder=self.FOLDERS["video"])
 
     def upload_thumbnail(self, thumbnail_path: str) -> str:
         """Upload thumbnail and return public URL."""
-        return self.storage.upload(thumbnail_path, folder="thumbnails")
+        return self.storage.upload(thumbnail_path, folder=self.FOLDERS["thumbnail"])
 
     def upload_clips_for_video(
         self,
@@ -292,15 +631,26 @@ class CloudStorageManager:
         clips_output_root: str = "clips_output",
         start_index: int = 1,
         max_clips: Optional[int] = None,
+        max_workers: int = 16,
+        max_attempts: int = 3,
+        skip_existing: bool = True,
     ) -> Dict[int, Dict[str, str]]:
         """
         Upload all clips and thumbnails for a video.
 
+        Videos and thumbnails are uploaded concurrently; the storage client is
+        shared by all workers. Files already stored remotely with the same
+        size (e.g. from an interrupted earlier run) are not uploaded again.
+
         Args:
             video_id: Video ID
             clips_output_root: Root output directory
             start_index: Start from this clip index
             max_clips: Maximum clips to upload
+            max_workers: Maximum concurrent uploads
+            max_attempts: Attempts per file before giving up (ignored for
+                providers that retry internally, like S3)
+            skip_existing: Reuse remote copies of unchanged files instead of re-uploading
 
         Returns:
             Dict mapping clip_index to URLs dict with 'video' and 'thumbnail' keys
@@ -309,67 +659,168 @@ class CloudStorageManager:
         if not os.path.exists(manifest_path):
             raise FileNotFoundError(f"Manifest not found: {manifest_path}")
 
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manifest = read_manifest(manifest_path)
 
         # Filter clips
-        manifest.sort(key=lambda c: int(c.get("clip_index", 0)))
         clips_to_upload = [
-            c for c in manifest
-            if int(c.get("clip_index", 0)) >= start_index
+            (clip_index, c) for clip_index, c in index_clips(manifest)
+            if clip_index >= start_index
         ]
 
         if max_clips:
             clips_to_upload = clips_to_upload[:max_clips]
 
-        print(f"\n[CloudStorage] Uploading {len(clips_to_upload)} clips to {self.provider.upper()}")
+        log.info(f"\n[CloudStorage] Uploading {len(clips_to_upload)} clips to {self.provider.upper()}")
 
-        uploaded_urls = {}
+        # One directory listing each instead of a stat per clip and thumbnail
+        clips_dir = os.path.join(clips_output_root, video_id, "clips")
+        thumbnails_dir = os.path.join(clips_output_root, video_id, "thumbnails")
+        clip_names = _list_file_names(clips_dir)
+        thumbnail_names = _list_file_names(thumbnails_dir)
 
-        for clip in clips_to_upload:
-            clip_index = int(clip.get("clip_index", 0))
+        # One task per object: (clip_index, kind) -> path
+        tasks = {}
+        for clip_index, clip in clips_to_upload:
             file_name = clip.get("file_name")
-            file_path = os.path.join(clips_output_root, video_id, "clips", file_name)
+            file_path = os.path.join(clips_dir, file_name)
 
-            if not os.path.exists(file_path):
-                print(f"[CloudStorage] Warning: Clip not found: {file_path}")
+            if file_name not in clip_names:
+                log.warning(f"[CloudStorage] Warning: Clip not found: {file_path}")
                 continue
 
-            try:
-                # Upload video
-                video_url = self.upload_clip(file_path)
-
-                # Upload thumbnail if exists
-                thumbnail_path = os.path.join(
-                    clips_output_root,
-                    video_id,
-                    "thumbnails",
-                    f"thumbnail_{clip_index:02d}.jpg"
-                )
+            tasks[(clip_index, "video")] = file_path
 
-                thumbnail_url = None
-                if os.path.exists(thumbnail_path):
-                    thumbnail_url = self.upload_thumbnail(thumbnail_path)
+            # Upload thumbnail if exists
+            thumbnail_name = f"thumbnail_{clip_index:02d}.jpg"
+            if thumbnail_name in thumbnail_names:
+                tasks[(clip_index, "thumbnail")] = os.path.join(thumbnails_dir, thumbnail_name)
 
-                uploaded_urls[clip_index] = {
-                    "video": video_url,
-                    "thumbnail": thumbnail_url
-                }
+        existing = {}
+        if skip_existing and tasks:
+            existing = self.storage.find_uploaded(
+                (path, self.FOLDERS[kind]) for (_, kind), path in tasks.items()
+            )
+            if existing:
+                log.info(f"[CloudStorage] {len(existing)} files already uploaded, skipping")
 
-                print(f"[CloudStorage] ✅ Clip #{clip_index} uploaded")
+        return self._run_uploads(
+            ((clip_index, kind, path) for (clip_index, kind), path in tasks.items()),
+            max_workers=min(max_workers, max(1, len(tasks) - len(existing))),
+            max_attempts=max_attempts,
+            existing=existing,
+        )
 
-            except Exception as e:
-                print(f"[CloudStorage] ❌ Clip #{clip_index} failed: {e}")
+    def upload_from_queue(
+        self,
+        clip_queue: "queue.Queue[Optional[Tuple[int, str, Optional[str]]]]",
+        max_workers: int = 16,
+        max_attempts: int = 3,
+    ) -> Dict[int, Dict[str, str]]:
+        """
+        Upload clips as a producer (e.g. the encoder) hands them over.
+
+        Each queue item is (clip_index, video_path, thumbnail_path or None);
+        put None to signal that no more clips are coming. Uploads start as
+        soon as an item arrives, so encoding the next clip overlaps
+        uploading the previous ones. Returns once the queue is closed and
+        every upload has finished.
+
+        Args:
+            clip_queue: Queue of clips to upload, terminated by None
+            max_workers: Maximum concurrent uploads
+            max_attempts: Attempts per file before giving up (ignored for
+                providers that retry internally, like S3)
+
+        Returns:
+            Dict mapping clip_index to URLs dict with 'video' and 'thumbnail' keys
+        """
+        def tasks():
+            for clip_index, video_path, thumbnail_path in iter(clip_queue.get, None):
+                yield clip_index, "video", video_path
+                if thumbnail_path:
+                    yield clip_index, "thumbnail", thumbnail_path
+
+        return self._run_uploads(tasks(), max_workers=max_workers, max_attempts=max_attempts)
+
+    def _upload_with_retry(self, kind: str, path: str, max_attempts: int) -> str:
+        """
+        Upload one file, retrying with jittered exponential backoff (2, 4, 8... up to 30 seconds).
+
+        Providers whose client retries on its own get a single attempt, so
+        retries happen in one layer only.
+        """
+        upload = self.upload_clip if kind == "video" else self.upload_thumbnail
+        return call_with_retry(
+            upload,
+            path,
+            max_attempts=1 if self.storage.retries_internally else max_attempts,
+            delay=2.0,
+            max_delay=30.0,
+            jitter=1.0,
+            label="CloudStorage",
+        )
+
+    def _run_uploads(
+        self,
+        tasks: Iterable[Tuple[int, str, str]],
+        max_workers: int,
+        max_attempts: int,
+        existing: Optional[Dict[str, str]] = None,
+    ) -> Dict[int, Dict[str, str]]:
+        """
+        Upload (clip_index, kind, path) tasks on a thread pool as they are produced.
+
+        Paths in existing (path -> URL) are reused without uploading. A clip
+        counts as uploaded only if its video and thumbnail both made it.
+        """
+        existing = existing or {}
+        order: Dict[int, None] = {}
+        results: Dict[int, Dict[str, str]] = {}
+        errors: Dict[int, Exception] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_task = {}
+            for clip_index, kind, path in tasks:
+                order.setdefault(clip_index)
+                if path in existing:
+                    results.setdefault(clip_index, {})[kind] = existing[path]
+                    continue
+                future = executor.submit(self._upload_with_retry, kind, path, max_attempts)
+                future_to_task[future] = (clip_index, kind)
+
+            for future in as_completed(future_to_task):
+                clip_index, kind = future_to_task[future]
+                try:
+                    results.setdefault(clip_index, {})[kind] = future.result()
+                except Exception as e:
+                    errors.setdefault(clip_index, e)
+
+        uploaded_urls = {}
+        for clip_index in order:
+            if clip_index in errors:
+                log.error(f"[CloudStorage] ❌ Clip #{clip_index} failed: {errors[clip_index]}")
+                continue
+
+            uploaded_urls[clip_index] = {
+                "video": results[clip_index]["video"],
+                "thumbnail": results[clip_index].get("thumbnail"),
+            }
+            log.info(f"[CloudStorage] ✅ Clip #{clip_index} uploaded")
 
         return uploaded_urls
 
     def cleanup(self, urls: Dict[int, Dict[str, str]]) -> None:
-        """Delete uploaded files from cloud storage."""
-        for clip_index, url_dict in urls.items():
-            try:
-                if url_dict.get("video"):
-                    self.storage.delete(url_dict["video"])
-                if url_dict.get("thumbnail"):
-                    self.storage.delete(url_dict["thumbnail"])
-            except Exception as e:
-                print(f"[CloudStorage] Cleanup failed for clip {clip_index}: {e}")
+        """Delete uploaded files from cloud storage (batched where the provider supports it)."""
+        to_delete = [
+            url
+            for url_dict in urls.values()
+            for url in (url_dict.get("video"), url_dict.get("thumbnail"))
+            if url
+        ]
+        if not to_delete:
+            return
+
+        try:
+            self.storage.delete_many(to_delete)
+        except Exception as e:
+            log.error(f"[CloudStorage] Cleanup failed: {e}")
@@ -1,31 +1,80 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 
-# Root for all generated assets
-OUTPUT_ROOT = os.getenv("CLIPSMACHINE_OUTPUT_ROOT", "clips_output")
 
-# Clip length settings (in seconds)
-MIN_CLIP_SEC = int(os.getenv("CLIPSMACHINE_MIN_CLIP_SEC", "40"))
-TARGET_CLIP_SEC = int(os.getenv("CLIPSMACHINE_TARGET_CLIP_SEC", "90"))
-MAX_CLIP_SEC = int(os.getenv("CLIPSMACHINE_MAX_CLIP_SEC", "180"))
-MAX_CLIPS_PER_VIDEO = int(os.getenv("CLIPSMACHINE_MAX_CLIPS_PER_VIDEO", "20"))
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """ClipsMachine settings, read from CLIPSMACHINE_* environment variables."""
 
-# YouTube upload defaults
-DEFAULT_PRIVACY = os.getenv("CLIPSMACHINE_DEFAULT_PRIVACY", "unlisted")  # public/unlisted/private
-CATEGORY_ID = os.getenv("CLIPSMACHINE_CATEGORY_ID", "27")  # 27 = Education, 24 = Entertainment
+    # Root for all generated assets
+    output_root: str
 
-# OAuth files
-CLIENT_SECRET_FILE = os.getenv("CLIPSMACHINE_CLIENT_SECRET_FILE", "client_secret.json")
-TOKEN_FILE = os.getenv("CLIPSMACHINE_TOKEN_FILE", "token.json")
+    # Clip length settings (in seconds)
+    min_clip_sec: int
+    target_clip_sec: int
+    max_clip_sec: int
+    max_clips_per_video: int
 
-# LLM
-OPENAI_MODEL = os.getenv("CLIPSMACHINE_OPENAI_MODEL", "gpt-4o-mini")
-MAX_LLM_RETRIES = int(os.getenv("CLIPSMACHINE_MAX_LLM_RETRIES", "3"))
-LLM_SLEEP_BETWEEN_CALLS = float(os.getenv("CLIPSMACHINE_LLM_SLEEP_BETWEEN", "1"))
+    # YouTube upload defaults
+    default_privacy: str  # public/unlisted/private
+    category_id: str  # 27 = Education, 24 = Entertainment
 
-# Subtitles
-ENABLE_SUBTITLES = os.getenv("CLIPSMACHINE_ENABLE_SUBTITLES", "true").lower() == "true"
-MAX_SUBTITLE_WORDS = int(os.getenv("CLIPSMACHINE_MAX_SUBTITLE_WORDS", "8"))  # Max key words per clip
+    # OAuth files
+    client_secret_file: str
+    token_file: str
 
-# Subtitle types: "keywords", "transcription", or "both"
-SUBTITLE_TYPE = os.getenv("CLIPSMACHINE_SUBTITLE_TYPE", "transcription")
-WORDS_PER_SUBTITLE_LINE = int(os.getenv("CLIPSMACHINE_WORDS_PER_LINE", "3"))  # For transcription subtitles
+    # LLM
+    openai_model: str
+    max_llm_retries: int
+    llm_max_concurrency: int  # Parallel LLM calls in enhance
+
+    # Subtitles
+    enable_subtitles: bool
+    max_subtitle_words: int  # Max key words per clip
+
+    # Subtitle types: "keywords", "transcription", or "both"
+    subtitle_type: str
+    words_per_subtitle_line: int  # For transcription subtitles
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Read settings from the environment once per process.
+
+    Returns:
+        Settings
+    """
+    return Settings(
+        output_root=os.getenv("CLIPSMACHINE_OUTPUT_ROOT", "clips_output"),
+        min_clip_sec=int(os.getenv("CLIPSMACHINE_MIN_CLIP_SEC", "40")),
+        target_clip_sec=int(os.getenv("CLIPSMACHINE_TARGET_CLIP_SEC", "90")),
+        max_clip_sec=int(os.getenv("CLIPSMACHINE_MAX_CLIP_SEC", "180")),
+        max_clips_per_video=int(os.getenv("CLIPSMACHINE_MAX_CLIPS_PER_VIDEO", "20")),
+        default_privacy=os.getenv("CLIPSMACHINE_DEFAULT_PRIVACY", "unlisted"),
+        category_id=os.getenv("CLIPSMACHINE_CATEGORY_ID", "27"),
+        client_secret_file=os.getenv("CLIPSMACHINE_CLIENT_SECRET_FILE", "client_secret.json"),
+        token_file=os.getenv("CLIPSMACHINE_TOKEN_FILE", "token.json"),
+        openai_model=os.getenv("CLIPSMACHINE_OPENAI_MODEL", "gpt-4o-mini"),
+        max_llm_retries=int(os.getenv("CLIPSMACHINE_MAX_LLM_RETRIES", "3")),
+        llm_max_concurrency=int(os.getenv("CLIPSMACHINE_LLM_MAX_CONCURRENCY", "8")),
+        enable_subtitles=os.getenv("CLIPSMACHINE_ENABLE_SUBTITLES", "true").lower() == "true",
+        max_subtitle_words=int(os.getenv("CLIPSMACHINE_MAX_SUBTITLE_WORDS", "8")),
+        subtitle_type=os.getenv("CLIPSMACHINE_SUBTITLE_TYPE", "transcription"),
+        words_per_subtitle_line=int(os.getenv("CLIPSMACHINE_WORDS_PER_LINE", "3")),
+    )
+
+
+# Backward-compatible module-level names (OUTPUT_ROOT, MAX_CLIP_SEC, ...)
+_SETTING_NAMES = {field.upper(): field for field in Settings.__slots__}
+
+
+def __getattr__(name: str):
+    if name in _SETTING_NAMES:
+        return getattr(get_settings(), _SETTING_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SETTING_NAMES))
@@ -0,0 +1,67 @@
+"""
+Persistent cache for YouTube lookups (transcripts).
+
+Re-running the pipeline on a video it has already seen skips the network.
+Uses diskcache when it is installed; without it the decorated functions
+simply run every time.
+"""
+
+import os
+from functools import lru_cache, wraps
+from typing import Callable, Optional, TypeVar
+
+from .config import OUTPUT_ROOT
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+T = TypeVar('T')
+
+CACHE_DIR = os.path.join(OUTPUT_ROOT, ".cache")
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> Optional["Cache"]:
+    """
+    Open the shared on-disk cache.
+
+    Returns:
+        diskcache.Cache under OUTPUT_ROOT/.cache, or None if diskcache isn't installed
+    """
+    if Cache is None:
+        return None
+    return Cache(CACHE_DIR)
+
+
+def disk_memoize(expire: float, tag: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorator to memoize a function's results on disk.
+
+    Exceptions are not cached, so failed lookups are retried on the next call.
+
+    Args:
+        expire: Seconds before a cached result is fetched again
+        tag: diskcache tag, so one kind of entry can be evicted together
+            (e.g. get_cache().evict("transcript"))
+
+    Example:
+        @disk_memoize(expire=7 * 86400, tag="transcript")
+        def get_transcript(video_id):
+            ...
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @lru_cache(maxsize=1)
+        def memoized() -> Callable[..., T]:
+            cache = get_cache()
+            if cache is None:
+                return func
+            return cache.memoize(name=f"{func.__module__}.{func.__qualname__}", expire=expire, tag=tag)(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            return memoized()(*args, **kwargs)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,101 @@
+"""
+Process-wide cache of ffprobe results.
+
+Intro/outro assets are the same files for every clip in a batch, so they are
+probed once and the parsed JSON is reused. Entries are keyed on the file's
+mtime and size so a replaced asset is probed again. Keyframe timestamps of
+source videos are cached the same way.
+"""
+
+import os
+import json
+import subprocess
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+
+@lru_cache(maxsize=256)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Run ffprobe once for a given (path, mtime, size) and parse its JSON."""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-of", "json",
+        "-show_streams",
+        "-show_format",
+        path,
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def probe(path: str) -> Dict[str, Any]:
+    """
+    Probe a media file with ffprobe, caching the result per file version.
+
+    Args:
+        path: Path to media file
+
+    Returns:
+        Parsed ffprobe JSON with 'streams' and 'format' keys. Treat as read-only;
+        the same dict is returned to every caller.
+    """
+    st = os.stat(path)
+    return _probe_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=16)
+def _keyframes_cached(path: str, mtime_ns: int, size: int) -> Tuple[float, ...]:
+    """List video keyframe timestamps once for a given (path, mtime, size)."""
+    # Packet flags mark keyframes without decoding any frames
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        path,
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+    times = []
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(",")
+        if "K" in flags and pts_time not in ("", "N/A"):
+            times.append(float(pts_time))
+    return tuple(sorted(times))
+
+
+def keyframe_times(path: str) -> Tuple[float, ...]:
+    """
+    Timestamps (seconds) of the video keyframes in a media file, cached per file version.
+
+    Args:
+        path: Path to media file
+
+    Returns:
+        Sorted keyframe timestamps (empty if the file has no video stream)
+    """
+    st = os.stat(path)
+    return _keyframes_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def nearest_keyframe(keyframes: Tuple[float, ...], t: float, tolerance: float) -> Optional[float]:
+    """
+    Find the keyframe closest to a timestamp.
+
+    Args:
+        keyframes: Sorted keyframe timestamps from keyframe_times()
+        t: Timestamp in seconds
+        tolerance: Maximum distance in seconds
+
+    Returns:
+        Keyframe timestamp within tolerance of t, or None
+    """
+    i = bisect_left(keyframes, t)
+    candidates = keyframes[max(i - 1, 0):i + 1]
+    if not candidates:
+        return None
+    best = min(candidates, key=lambda k: abs(k - t))
+    return best if abs(best - t) <= tolerance else None
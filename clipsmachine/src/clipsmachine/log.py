@@ -0,0 +1,56 @@
+"""
+Logging for ClipsMachine's concurrent code paths (cloud and platform uploads, LLM calls).
+
+Worker threads only put records on a queue; a single listener thread formats
+and writes them to stdout, so upload and LLM workers don't contend on the
+stdout lock. Messages keep the "[Module] ..." format used by print() elsewhere.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+ROOT_LOGGER = "clipsmachine"
+
+_listener = None
+
+
+def _install_queue_handler() -> None:
+    """Route the clipsmachine logger through a queue drained by a background thread."""
+    global _listener
+
+    root = logging.getLogger(ROOT_LOGGER)
+    if _listener is not None or root.handlers:
+        return
+
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # Flush anything still queued when the process exits
+    atexit.register(_listener.stop)
+
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    root.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger under the clipsmachine namespace.
+
+    Args:
+        name: Module name (e.g. __name__)
+
+    Returns:
+        Logger whose records are written by the shared queue listener
+    """
+    _install_queue_handler()
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + "."):
+        name = f"{ROOT_LOGGER}.{name}"
+    return logging.getLogger(name)
@@ -0,0 +1,99 @@
+"""
+Manifest JSON reading and writing for ClipsMachine.
+
+Uses orjson when it is installed (several times faster on manifests with long
+transcript previews) and falls back to the stdlib json module otherwise.
+Both paths read and write the same UTF-8, 2-space-indented format.
+
+Parsed manifests are cached per file version (mtime and size), so several
+passes over the same video in one process (enhance, thumbnails, uploads)
+parse manifest.json once.
+"""
+
+import os
+import json
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=32)
+def _read_manifest_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a manifest once for a given (path, mtime, size)."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_manifest(path: str) -> Any:
+    """
+    Load a manifest JSON file.
+
+    Args:
+        path: Path to manifest.json
+
+    Returns:
+        Parsed manifest (list of clip dicts). The list and clip dicts are
+        fresh copies callers may sort and update; nested values are shared
+        with the cache, so replace them rather than mutating in place.
+    """
+    st = os.stat(path)
+    manifest = _read_manifest_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    if isinstance(manifest, list):
+        return [dict(clip) if isinstance(clip, dict) else clip for clip in manifest]
+    return manifest
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize dataclass instances for the stdlib json fallback."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_manifest(path: str, manifest: Any) -> None:
+    """
+    Write a manifest JSON file (UTF-8, indented by 2 spaces).
+
+    Args:
+        path: Path to manifest.json
+        manifest: Manifest data to serialize; dataclass instances (e.g. ClipInfo)
+            are written as objects without converting them to dicts first
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False, default=_json_default)
+
+    # A rewrite within the filesystem's mtime granularity could keep the same
+    # (mtime, size) key, so drop cached versions rather than rely on it
+    _read_manifest_cached.cache_clear()
+
+
+def index_clips(manifest: List[Dict[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Sort a manifest by clip_index (in place) and pair each clip with its index.
+
+    Each clip_index is converted to int once, so callers don't re-coerce it
+    for sorting, filtering and lookups.
+
+    Args:
+        manifest: Manifest clip dicts (sorted in place)
+
+    Returns:
+        List of (clip_index, clip) tuples in manifest order
+    """
+    indexed = [(int(clip.get("clip_index", 0)), clip) for clip in manifest]
+    indexed.sort(key=lambda item: item[0])
+    manifest[:] = [clip for _, clip in indexed]
+    return indexed
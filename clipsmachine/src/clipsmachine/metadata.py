@@ -1,18 +1,22 @@
 import os
 import json
-import time
 from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from openai import OpenAI
-
+from .log import get_logger
+from .manifest_io import read_manifest, write_manifest, index_clips
+from .openai_client import get_openai_client, TRANSIENT_OPENAI_ERRORS
+from .retry import call_with_retry
 from .config import (
     OUTPUT_ROOT,
     OPENAI_MODEL,
     MAX_LLM_RETRIES,
-    LLM_SLEEP_BETWEEN_CALLS,
+    LLM_MAX_CONCURRENCY,
 )
 from .virality_score import calculate_virality_score, get_virality_label
 
+log = get_logger(__name__)
+
 
 def _manifest_path(video_id: str) -> str:
     return os.path.join(OUTPUT_ROOT, video_id, "manifest.json")
@@ -22,15 +26,13 @@ def load_manifest(video_id: str) -> List[Dict[str, Any]]:
     path = _manifest_path(video_id)
     if not os.path.exists(path):
         raise FileNotFoundError(f"Manifest not found at {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_manifest(path)
 
 
 def save_manifest(video_id: str, manifest: List[Dict[str, Any]]) -> None:
     path = _manifest_path(video_id)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
-    print(f"[metadata] Updated manifest saved to {path}")
+    write_manifest(path, manifest)
+    log.info(f"[metadata] Updated manifest saved to {path}")
 
 
 def call_llm(prompt: str) -> str:
@@ -39,33 +41,32 @@ def call_llm(prompt: str) -> str:
     if not os.getenv("OPENAI_API_KEY"):
         raise RuntimeError("OPENAI_API_KEY environment variable not set.")
 
-    client = OpenAI()  # Uses environment variable automatically
-
-    last_exc: Exception | None = None
-    for attempt in range(1, MAX_LLM_RETRIES + 1):
-        try:
-            resp = client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are an expert YouTube title and description writer "
-                            "for a clips channel. You ONLY reply with strict JSON."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.7,
-            )
-            return resp.choices[0].message.content
-        except Exception as e:
-            last_exc = e
-            print(f"[metadata] LLM call failed (attempt {attempt}): {e}")
-            time.sleep(2 * attempt)
-
-    assert last_exc is not None
-    raise last_exc
+    client = get_openai_client()
+
+    # Retry transient failures only (network, rate limits, 5xx) with capped,
+    # jittered exponential backoff: ~1s, 2s, 4s... up to 30s
+    resp = call_with_retry(
+        client.chat.completions.create,
+        model=OPENAI_MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "You are an expert YouTube title and description writer "
+                    "for a clips channel. You ONLY reply with strict JSON."
+                ),
+            },
+            {"role": "user", "content": prompt},
+        ],
+        temperature=0.7,
+        max_attempts=MAX_LLM_RETRIES,
+        delay=1.0,
+        max_delay=30.0,
+        jitter=1.0,
+        retry_on=TRANSIENT_OPENAI_ERRORS,
+        label="metadata",
+    )
+    return resp.choices[0].message.content
 
 
 def enhance_single_clip(
@@ -124,7 +125,7 @@ No extra commentary.
     try:
         data = json.loads(cleaned)
     except json.JSONDecodeError:
-        print("[metadata] WARNING: JSON parse failed; using fallback.")
+        log.warning("[metadata] WARNING: JSON parse failed; using fallback.")
         data = {
             "title": original_title,
             "description": raw.strip(),
@@ -142,7 +143,7 @@ No extra commentary.
         duration = clip.get("duration", 0)
         clip_index = clip.get("clip_index", 0)
 
-        print(f"[metadata] Calculating virality score for clip #{clip_index}...")
+        log.info(f"[metadata] Calculating virality score for clip #{clip_index}...")
         virality_data = calculate_virality_score(full_text, duration, clip_index)
 
         clip["virality_score"] = virality_data["virality_score"]
@@ -154,7 +155,7 @@ No extra commentary.
             "insights": virality_data["insights"],
         }
 
-        print(
+        log.info(
             f"[metadata] Virality score: {virality_data['virality_score']}/100 "
             f"({get_virality_label(virality_data['virality_score'])})"
         )
@@ -174,31 +175,31 @@ def enhance_manifest(
     if not manifest:
         raise RuntimeError("Manifest is empty.")
 
-    manifest.sort(key=lambda c: int(c.get("clip_index", 0)))
+    indexed = index_clips(manifest)
+    to_update = [(idx, c) for idx, c in indexed if idx >= start_index][:max_clips]
 
-    to_update = [
-        c for c in manifest if int(c.get("clip_index", 0)) >= start_index
-    ]
-    if max_clips is not None:
-        to_update = to_update[:max_clips]
-
-    print(f"[metadata] Enhancing {len(to_update)} clips for video {video_id}.")
+    log.info(f"[metadata] Enhancing {len(to_update)} clips for video {video_id}.")
 
     # Build index map for O(1) lookups instead of O(n) searches
-    clip_index_to_position = {
-        int(entry.get("clip_index", 0)): i
-        for i, entry in enumerate(manifest)
-    }
-
-    for clip in to_update:
-        idx = int(clip.get("clip_index", 0))
-        print(f"[metadata] Enhancing clip #{idx}…")
-        enhanced = enhance_single_clip(clip, channel_positioning, base_tags, enable_virality_score)
+    clip_index_to_position = {idx: i for i, (idx, _) in enumerate(indexed)}
+
+    # Clips are independent network-bound calls: run them concurrently and let
+    # call_llm back off on rate limits instead of sleeping between calls
+    with ThreadPoolExecutor(max_workers=max(1, min(LLM_MAX_CONCURRENCY, len(to_update)))) as executor:
+        future_to_index = {}
+        for idx, clip in to_update:
+            log.info(f"[metadata] Enhancing clip #{idx}…")
+            future = executor.submit(
+                enhance_single_clip, clip, channel_positioning, base_tags, enable_virality_score
+            )
+            future_to_index[future] = idx
 
-        # O(1) lookup instead of O(n) search
-        if idx in clip_index_to_position:
-            manifest[clip_index_to_position[idx]] = enhanced
+        for future in as_completed(future_to_index):
+            idx = future_to_index[future]
+            enhanced = future.result()
 
-        time.sleep(LLM_SLEEP_BETWEEN_CALLS)
+            # O(1) lookup instead of O(n) search
+            if idx in clip_index_to_position:
+                manifest[clip_index_to_position[idx]] = enhanced
 
     save_manifest(video_id, manifest)
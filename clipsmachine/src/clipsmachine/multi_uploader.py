@@ -4,11 +4,11 @@ Upload clips to multiple social media platforms simultaneously.
 """
 
 import os
-import json
 import time
 from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from .manifest_io import read_manifest, index_clips
 from .platforms import (
     get_platform,
     get_all_platforms,
@@ -39,6 +39,23 @@ class MultiPlatformUploader:
             except Exception as e:
                 print(f"[MultiUploader] Warning: Failed to initialize {name}: {e}")
 
+    def authenticate_all(self) -> Dict[str, bool]:
+        """
+        Authenticate every initialized platform that isn't yet.
+
+        Call before uploading from several threads, so each platform's
+        authentication (OAuth prompt, token refresh) runs once up front.
+
+        Returns:
+            Dict mapping platform name to authentication success
+        """
+        results = {}
+        for name, platform in self.platforms.items():
+            if not platform.is_authenticated():
+                print(f"\n[{platform.display_name}] Authenticating...")
+            results[name] = platform.ensure_authenticated()
+        return results
+
     def upload_single(
         self,
         platform_name: str,
@@ -71,10 +88,20 @@ class MultiPlatformUploader:
 
         platform = self.platforms[platform_name]
 
+        # Pre-flight: reject files over the platform's size/duration limits
+        # before authenticating or sending any bytes
+        valid, error = platform.validate_video(video_path)
+        if not valid:
+            return UploadResult(
+                success=False,
+                platform=platform.display_name,
+                error=error
+            )
+
         # Authenticate if needed
         if not platform.is_authenticated():
             print(f"\n[{platform.display_name}] Authenticating...")
-            if not platform.authenticate():
+            if not platform.ensure_authenticated():
                 return UploadResult(
                     success=False,
                     platform=platform.display_name,
@@ -196,7 +223,8 @@ class MultiPlatformUploader:
             clips_output_root: Root directory for clips output
             start_index: Start from this clip index
             max_clips: Maximum number of clips to upload
-            parallel_platforms: Upload to platforms in parallel
+            parallel_platforms: Upload to platforms in parallel, each platform
+                working through the clips independently
             **kwargs: Platform-specific options
 
         Returns:
@@ -207,14 +235,12 @@ class MultiPlatformUploader:
         if not os.path.exists(manifest_path):
             raise FileNotFoundError(f"Manifest not found: {manifest_path}")
 
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manifest = read_manifest(manifest_path)
 
         # Filter clips
-        manifest.sort(key=lambda c: int(c.get("clip_index", 0)))
         clips_to_upload = [
-            c for c in manifest
-            if int(c.get("clip_index", 0)) >= start_index
+            (clip_index, c) for clip_index, c in index_clips(manifest)
+            if clip_index >= start_index
         ]
 
         if max_clips:
@@ -223,10 +249,8 @@ class MultiPlatformUploader:
         print(f"\n[MultiUploader] Uploading {len(clips_to_upload)} clips to {len(platforms)} platforms")
         print(f"[MultiUploader] Platforms: {', '.join(platforms)}")
 
-        results_by_clip = {}
-
-        for clip in clips_to_upload:
-            clip_index = int(clip.get("clip_index", 0))
+        jobs = []
+        for clip_index, clip in clips_to_upload:
             title = clip.get("title", f"Clip #{clip_index}")
             description = clip.get("description", "")
             file_name = clip.get("file_name")
@@ -238,6 +262,49 @@ class MultiPlatformUploader:
                 words = description.split()
                 tags = [word.lstrip('#') for word in words if word.startswith('#')]
 
+            jobs.append((clip_index, file_path, title, description, tags))
+
+        results_by_clip: Dict[int, List[UploadResult]] = {job[0]: [] for job in jobs}
+
+        if parallel_platforms:
+            # One lane per platform working through the clips in order: a slow
+            # platform no longer holds back the others, and there is no
+            # per-clip barrier or fixed delay between clips
+            def run_lane(platform_name: str) -> None:
+                for clip_index, file_path, title, description, tags in jobs:
+                    if not os.path.exists(file_path):
+                        result = UploadResult(
+                            success=False,
+                            platform=platform_name,
+                            error=f"Video file not found: {file_path}"
+                        )
+                    else:
+                        try:
+                            result = self.upload_single(
+                                platform_name,
+                                file_path,
+                                title,
+                                description,
+                                tags,
+                                **kwargs
+                            )
+                        except Exception as e:
+                            result = UploadResult(
+                                success=False,
+                                platform=platform_name,
+                                error=str(e)
+                            )
+
+                    results_by_clip[clip_index].append(result)
+                    print(f"  [Clip #{clip_index}] {result}")
+
+            with ThreadPoolExecutor(max_workers=max(1, len(platforms))) as executor:
+                for future in [executor.submit(run_lane, platform) for platform in platforms]:
+                    future.result()
+
+            return results_by_clip
+
+        for clip_index, file_path, title, description, tags in jobs:
             print(f"\n{'='*60}")
             print(f"[MultiUploader] Clip #{clip_index}: {title[:50]}")
             print(f"{'='*60}")
@@ -248,7 +315,7 @@ class MultiPlatformUploader:
                 title=title,
                 description=description,
                 tags=tags,
-                parallel=parallel_platforms,
+                parallel=False,
                 **kwargs
             )
 
@@ -0,0 +1,27 @@
+"""
+Shared OpenAI client for ClipsMachine.
+
+Building a client resolves credentials and sets up an HTTP connection pool,
+so one instance is created per process and reused by every LLM and Whisper call.
+"""
+
+from functools import lru_cache
+
+from openai import OpenAI, APIConnectionError, RateLimitError, InternalServerError
+
+# Errors worth retrying: network failures/timeouts, rate limits and 5xx responses
+TRANSIENT_OPENAI_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Get the process-wide OpenAI client, creating it on first use.
+
+    The SDK reads OPENAI_API_KEY from the environment; callers check it is
+    set before asking for a client.
+
+    Returns:
+        OpenAI client
+    """
+    return OpenAI()
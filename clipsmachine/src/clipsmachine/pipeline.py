@@ -1,19 +1,18 @@
 import os
 import re
-import json
 import subprocess
+import threading
 import time
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Callable, TypeVar
-from functools import wraps
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Tuple, TypeVar
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from tqdm import tqdm
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 import yt_dlp
 
-# Type variable for retry decorator
-T = TypeVar('T')
-
 from .progress import (
     console,
     print_header,
@@ -33,68 +32,55 @@ from .config import (
     MAX_CLIP_SEC,
     MAX_CLIPS_PER_VIDEO,
 )
+from .disk_cache import disk_memoize
+from .ffprobe_cache import probe, keyframe_times, nearest_keyframe
+from .manifest_io import write_manifest
+from .retry import retry_on_failure
 from .subtitles import generate_subtitles_for_clip
 from .whisper_transcribe import generate_whisper_subtitles_for_clip
 from .subtitle_styles import create_subtitle_style, style_to_force_style
 from .brand_templates import (
     BrandTemplate,
-    create_logo_overlay_filter,
-    requires_concat,
-    build_concat_file_list,
     validate_template,
+    prepare_logo_overlay,
+    hw_accel_input_args,
+    HW_DOWNLOAD_FILTER,
+    ffmpeg_has_encoder,
+    requires_concat,
+    concat_intro_outro,
 )
 
 
-def retry_on_failure(max_attempts: int = 3, delay: float = 2.0, backoff: float = 2.0):
-    """
-    Decorator to retry a function on failure with exponential backoff.
-
-    Args:
-        max_attempts: Maximum number of attempts
-        delay: Initial delay between retries in seconds
-        backoff: Multiplier for delay after each retry
-
-    Example:
-        @retry_on_failure(max_attempts=3, delay=1.0, backoff=2.0)
-        def download_file(url):
-            # Will retry up to 3 times with delays: 1s, 2s, 4s
-            ...
-    """
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            current_delay = delay
-            last_exception = None
-
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt == max_attempts:
-                        # Last attempt failed, raise the exception
-                        raise
-
-                    print(f"[retry] {func.__name__} failed (attempt {attempt}/{max_attempts}): {e}")
-                    print(f"[retry] Retrying in {current_delay:.1f}s...")
-                    time.sleep(current_delay)
-                    current_delay *= backoff
-
-            # This should never be reached, but just in case
-            raise last_exception
-
-        return wrapper
-    return decorator
-
-
 YDL_OPTS = {
     "format": "mp4/bestaudio/best",
     "outtmpl": "%(id)s.%(ext)s",
     "quiet": True,
     "no_warnings": True,
+    "concurrent_fragment_downloads": 4,
+}
+
+# YoutubeDL instances aren't thread-safe; downloads and lookups take turns
+_ydl_lock = threading.Lock()
+
+
+# Clip boundaries move to a keyframe at most this far away (seconds), so cuts
+# can start on a keyframe
+KEYFRAME_SNAP_TOLERANCE = 0.75
+
+# A cut starts "on" a keyframe if it is within this many seconds of one
+KEYFRAME_EPSILON = 0.01
+
+# Output dimensions per aspect ratio
+ASPECT_RATIOS = {
+    "9:16": {"width": 1080, "height": 1920, "ratio": 9/16},  # Vertical (Shorts/Reels/TikTok)
+    "1:1": {"width": 1080, "height": 1080, "ratio": 1},      # Square (Instagram)
+    "16:9": {"width": 1920, "height": 1080, "ratio": 16/9},  # Horizontal (YouTube)
 }
 
 
+T = TypeVar('T')
+
+
 @dataclass
 class ClipInfo:
     clip_index: int
@@ -108,23 +94,32 @@ class ClipInfo:
     original_video_url: str
 
 
+# Directories ensure_dir has already created (or found) in this process
+_dirs_made: set[str] = set()
+
+
 def ensure_dir(path: str) -> None:
+    if path in _dirs_made:
+        return
     os.makedirs(path, exist_ok=True)
+    _dirs_made.add(path)
+
+
+# Line breaks in transcript text become spaces
+_NEWLINE_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+# watch?v=ID, youtu.be/ID and shorts/ID URLs
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/|shorts/)([^?&/]+)")
 
 
 def extract_video_id(url: str) -> str:
-    patterns = [
-        r"v=([^&]+)",
-        r"youtu.be/([^?&]+)",
-        r"shorts/([^?&]+)",
-    ]
-    for p in patterns:
-        m = re.search(p, url)
-        if m:
-            return m.group(1)
+    m = _VIDEO_ID_RE.search(url)
+    if m:
+        return m.group(1)
     return url.rstrip("/").split("/")[-1]
 
 
+@lru_cache(maxsize=2048)
 def human_time(seconds: float) -> str:
     seconds = int(seconds)
     h = seconds // 3600
@@ -135,22 +130,98 @@ def human_time(seconds: float) -> str:
     return f"{m:02d}:{s:02d}"
 
 
+# Cached transcript lookups (transcripts rarely change)
+TRANSCRIPT_CACHE_SEC = 7 * 86400
+
+# yt-dlp leftovers that aren't a finished download
+_PARTIAL_DOWNLOAD_SUFFIXES = (".part", ".ytdl", ".temp")
+
+
+def _find_downloaded(workdir: str, video_id: str) -> str | None:
+    """Path of a finished download of video_id in workdir, if there is one."""
+    prefix = f"{video_id}."
+    try:
+        with os.scandir(workdir) as it:
+            for entry in it:
+                if (
+                    entry.name.startswith(prefix)
+                    and not entry.name.endswith(_PARTIAL_DOWNLOAD_SUFFIXES)
+                    and entry.is_file()
+                    and entry.stat().st_size > 0
+                ):
+                    return entry.path
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def _is_readable_video(path: str) -> bool:
+    """Whether ffprobe can read a video stream and a duration from the file."""
+    try:
+        info = probe(path)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return False
+    has_video = any(st.get("codec_type") == "video" for st in info.get("streams", []))
+    return has_video and bool(info.get("format", {}).get("duration"))
+
+
+def _raw_dir(video_id: str) -> str:
+    """Directory a video's source download lives in (OUTPUT_ROOT/<id>/raw)."""
+    return os.path.join(OUTPUT_ROOT, video_id, "raw")
+
+
+@lru_cache(maxsize=1)
+def _get_ydl() -> yt_dlp.YoutubeDL:
+    """
+    YoutubeDL shared by every download in the process, so extractors and the
+    HTTP session are set up once. The output template puts each video in its
+    own raw directory (see _raw_dir). Use it while holding _ydl_lock.
+    """
+    ydl_opts = dict(YDL_OPTS)
+    ydl_opts["paths"] = {"home": OUTPUT_ROOT}
+    ydl_opts["outtmpl"] = os.path.join("%(id)s", "raw", "%(id)s.%(ext)s")
+    return yt_dlp.YoutubeDL(ydl_opts)
+
+
+def _reusable_download(workdir: str, video_id: str) -> str | None:
+    """Existing download of video_id from an earlier run, if it is intact."""
+    existing = _find_downloaded(workdir, video_id)
+    if existing:
+        if _is_readable_video(existing):
+            return existing
+        # Truncated or corrupt: yt-dlp would skip it as already downloaded
+        print(f"[pipeline] Warning: {existing} is not a readable video, downloading again")
+        os.remove(existing)
+    return None
+
+
 @retry_on_failure(max_attempts=3, delay=2.0, backoff=2.0)
-def download_video(url: str, workdir: str) -> str:
-    ensure_dir(workdir)
+def download_video(url: str) -> str:
+    """
+    Download a video into its raw directory, reusing an intact earlier download.
+
+    Args:
+        url: YouTube video URL
+
+    Returns:
+        Path to the downloaded file
+    """
     video_id = extract_video_id(url)
-    output_template = os.path.join(workdir, f"{video_id}.%(ext)s")
+    workdir = _raw_dir(video_id)
+    ensure_dir(workdir)
 
-    ydl_opts = dict(YDL_OPTS)
-    ydl_opts["outtmpl"] = output_template
+    existing = _reusable_download(workdir, video_id)
+    if existing:
+        return existing
 
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(url, download=True)
-        ext = info.get("ext", "mp4")
+    with _ydl_lock:
+        info = _get_ydl().extract_info(url, download=True)
+    ext = info.get("ext", "mp4")
 
     return os.path.join(workdir, f"{video_id}.{ext}")
 
 
+@disk_memoize(expire=TRANSCRIPT_CACHE_SEC, tag="transcript")
 @retry_on_failure(max_attempts=3, delay=1.0, backoff=2.0)
 def get_transcript(video_id: str) -> List[Dict[str, Any]]:
     try:
@@ -172,81 +243,107 @@ def get_transcript(video_id: str) -> List[Dict[str, Any]]:
         raise RuntimeError("No transcript available for this video.") from e
 
 
-def build_clips_from_transcript(
+def iter_clips_from_transcript(
     transcript: List[Dict[str, Any]],
     min_len: int = MIN_CLIP_SEC,
     target_len: int = TARGET_CLIP_SEC,
     max_len: int = MAX_CLIP_SEC,
     max_clips: int = MAX_CLIPS_PER_VIDEO,
-) -> List[Dict[str, Any]]:
-    segments: List[Dict[str, Any]] = []
+    keyframes: Tuple[float, ...] | None = None,
+    snap_tolerance: float = KEYFRAME_SNAP_TOLERANCE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Group consecutive transcript entries into clip segments, yielding each as soon as it is complete.
+
+    Segments refer to their entries by index ("i0"/"i1", a slice of
+    transcript) instead of holding copies.
+
+    Args:
+        transcript: Transcript entries with 'start', 'duration' and 'text'
+        min_len: Minimum length of the final (leftover) segment in seconds
+        target_len: A segment ends once it reaches this length
+        max_len: Segments are cut off at this length
+        max_clips: Maximum number of segments
+        keyframes: Optional sorted keyframe timestamps of the source video
+        snap_tolerance: Move boundaries onto a keyframe at most this far away
+
+    Yields:
+        {"start", "end", "text", "i0", "i1"} dicts
+    """
+    def make_segment(i0: int, i1: int, seg_start: float, seg_end: float) -> Dict[str, Any]:
+        if keyframes:
+            # Snap boundaries onto nearby keyframes so cuts can seek (or copy) exactly
+            start = nearest_keyframe(keyframes, seg_start, snap_tolerance)
+            end = nearest_keyframe(keyframes, seg_end, snap_tolerance)
+            if start is not None and start < seg_end:
+                seg_start = start
+            if end is not None and end > seg_start:
+                seg_end = end
+
+        text = " ".join(e["text"].translate(_NEWLINE_TABLE).strip() for e in transcript[i0:i1])
+        return {"start": seg_start, "end": seg_end, "text": text.strip(), "i0": i0, "i1": i1}
+
+    count = 0
+    current_i0 = None
     current_start = None
-    current_text: List[str] = []
-    current_transcript_entries: List[Dict[str, Any]] = []
     current_end = None
 
-    for entry in transcript:
-        start = entry["start"]
-        duration = entry["duration"]
-        text = entry["text"].replace("\n", " ").strip()
+    for i, entry in enumerate(transcript):
+        if count >= max_clips:
+            return
 
-        if current_start is None:
-            current_start = start
-            current_text = []
-            current_transcript_entries = []
+        if current_i0 is None:
+            current_i0 = i
+            current_start = entry["start"]
 
-        current_text.append(text)
-        current_transcript_entries.append(entry)
-        current_end = start + duration
+        current_end = entry["start"] + entry["duration"]
         current_duration = current_end - current_start
 
         if current_duration >= target_len:
             if current_duration > max_len:
                 current_end = current_start + max_len
-                current_duration = max_len
-
-            segments.append(
-                {
-                    "start": current_start,
-                    "end": current_end,
-                    "text": " ".join(current_text).strip(),
-                    "transcript_entries": current_transcript_entries,
-                }
-            )
-            current_start = None
-            current_text = []
-            current_transcript_entries = []
-            current_end = None
 
-        if len(segments) >= max_clips:
-            break
+            yield make_segment(current_i0, i + 1, current_start, current_end)
+            count += 1
+            current_i0 = None
 
-    if current_start is not None and current_end is not None:
+    if current_i0 is not None and count < max_clips:
         tail_duration = current_end - current_start
-        if tail_duration >= min_len and len(segments) < max_clips:
-            segments.append(
-                {
-                    "start": current_start,
-                    "end": current_end,
-                    "text": " ".join(current_text).strip(),
-                    "transcript_entries": current_transcript_entries,
-                }
-            )
+        if tail_duration >= min_len:
+            yield make_segment(current_i0, len(transcript), current_start, current_end)
 
-    return segments
+
+def build_clips_from_transcript(
+    transcript: List[Dict[str, Any]],
+    min_len: int = MIN_CLIP_SEC,
+    target_len: int = TARGET_CLIP_SEC,
+    max_len: int = MAX_CLIP_SEC,
+    max_clips: int = MAX_CLIPS_PER_VIDEO,
+    keyframes: Tuple[float, ...] | None = None,
+    snap_tolerance: float = KEYFRAME_SNAP_TOLERANCE,
+) -> List[Dict[str, Any]]:
+    """
+    All clip segments of a transcript (see iter_clips_from_transcript).
+
+    Returns:
+        List of {"start", "end", "text", "i0", "i1"} dicts
+    """
+    return list(iter_clips_from_transcript(
+        transcript, min_len, target_len, max_len, max_clips, keyframes, snap_tolerance,
+    ))
+
+
+# First sentence end, for titles
+_SENTENCE_END = re.compile(r"[.!?]")
 
 
 def generate_title(clip_text: str, index: int) -> str:
-    cleaned = clip_text.replace("\n", " ").strip()
+    cleaned = clip_text.translate(_NEWLINE_TABLE).strip()
     if not cleaned:
         return f"Clip #{index}"
 
-    ends = [cleaned.find(sep) for sep in [".", "!", "?"]]
-    ends = [i for i in ends if i != -1]
-    if ends:
-        first_sentence_end = min(ends)
-    else:
-        first_sentence_end = min(len(cleaned), 80)
+    match = _SENTENCE_END.search(cleaned)
+    first_sentence_end = match.start() if match else min(len(cleaned), 80)
 
     base = cleaned[:first_sentence_end].strip()
     if len(base) < 20:
@@ -274,6 +371,214 @@ def generate_description(
     return "\n".join(lines)
 
 
+# Concurrent clip encoding: target threads per ffmpeg process, and the cap on
+# simultaneous NVENC sessions (consumer GPUs allow 3-5)
+FFMPEG_THREADS_PER_JOB = 4
+NVENC_MAX_SESSIONS = 3
+
+# Clips cut from one decode of the source in single-pass mode; each one keeps
+# an encoder open for the whole pass
+SINGLE_PASS_BATCH_SIZE = 4
+
+# Audio encoding for every clip
+AUDIO_ENCODER_ARGS = ["-c:a", "aac", "-b:a", "128k", "-ar", "44100"]
+
+# Video quality for short social clips: veryfast at CRF 20 looks like medium
+# at CRF 23 at several times the speed
+X264_PRESET = "veryfast"
+X264_CRF = "20"
+NVENC_CQ = "22"
+
+# Put the moov atom first so uploads and players can start streaming early
+MP4_OUTPUT_ARGS = ["-movflags", "+faststart"]
+
+# Video encoders for cut_clip_ffmpeg/process_video; "auto" picks NVENC when a GPU can use it
+VIDEO_ENCODERS = ("auto", "libx264", "h264_nvenc", "hevc_nvenc")
+
+
+@lru_cache(maxsize=None)
+def nvenc_usable(encoder: str = "h264_nvenc") -> bool:
+    """
+    Check whether an NVENC encoder actually works here, once per process.
+
+    FFmpeg builds often list NVENC encoders on machines without an NVIDIA GPU,
+    so a listed encoder is confirmed with a tiny test encode.
+
+    Args:
+        encoder: NVENC encoder name ("h264_nvenc" or "hevc_nvenc")
+
+    Returns:
+        True if FFmpeg can encode with it
+    """
+    if not ffmpeg_has_encoder(encoder):
+        return False
+
+    try:
+        subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-v", "error",
+                "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                "-c:v", encoder, "-f", "null", "-",
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        )
+        return True
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def resolve_video_encoder(encoder: str = "auto") -> str:
+    """
+    Resolve the requested video encoder to one that works on this machine.
+
+    Args:
+        encoder: "auto", "libx264", "h264_nvenc" or "hevc_nvenc"
+
+    Returns:
+        Encoder name; "auto" and unavailable NVENC encoders fall back to libx264
+    """
+    if encoder not in VIDEO_ENCODERS:
+        raise ValueError(f"Unsupported encoder: {encoder}. Choose from: {list(VIDEO_ENCODERS)}")
+
+    if encoder == "auto":
+        return "h264_nvenc" if nvenc_usable("h264_nvenc") else "libx264"
+
+    if encoder != "libx264" and not nvenc_usable(encoder):
+        print(f"[pipeline] Warning: {encoder} not available, encoding with libx264")
+        return "libx264"
+
+    return encoder
+
+
+def _video_encoder_args(encoder: str, gpu_frames: bool = False) -> List[str]:
+    """
+    FFmpeg video encoding arguments for a resolved encoder.
+
+    Args:
+        encoder: Result of resolve_video_encoder()
+        gpu_frames: Frames arrive as CUDA frames (GPU logo overlay); -pix_fmt
+            would force a download, and they are already nv12
+
+    Returns:
+        Arguments starting with -c:v
+    """
+    if encoder == "libx264":
+        return [
+            "-c:v", "libx264",
+            "-preset", X264_PRESET,
+            "-crf", X264_CRF,
+            "-profile:v", "high",
+            "-level", "4.2",
+            "-pix_fmt", "yuv420p",
+        ]
+
+    args = [
+        "-c:v", encoder,
+        "-preset", "p4",
+        "-tune", "hq",
+        "-rc", "vbr",
+        "-cq", NVENC_CQ,
+        "-b:v", "0",
+        "-maxrate", "8M",
+        "-bufsize", "16M",
+    ]
+    if encoder == "h264_nvenc":
+        args.extend(["-profile:v", "high", "-level", "4.2"])
+    else:
+        args.extend(["-profile:v", "main"])
+    if not gpu_frames:
+        args.extend(["-pix_fmt", "yuv420p"])
+    return args
+
+
+@lru_cache(maxsize=8)
+def _aspect_filters(aspect_ratio: str) -> Tuple[Tuple[str, ...], int]:
+    """Aspect-ratio conversion filters and output width, built once per ratio."""
+    if aspect_ratio not in ASPECT_RATIOS:
+        raise ValueError(f"Unsupported aspect ratio: {aspect_ratio}. Choose from: {list(ASPECT_RATIOS.keys())}")
+
+    config = ASPECT_RATIOS[aspect_ratio]
+    target_width = config["width"]
+    target_height = config["height"]
+
+    # Strategy: scale to cover the target dimensions, then crop the overflow
+    # around the centre (one scale pass, no per-frame expressions)
+    filters = (
+        f"scale={target_width}:{target_height}:force_original_aspect_ratio=increase:flags=bicubic",
+        f"crop={target_width}:{target_height}",
+    )
+    return filters, target_width
+
+
+@lru_cache(maxsize=32)
+def _force_style(style_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Subtitle force_style string for a style config (as sorted items), built once per style."""
+    return style_to_force_style(create_subtitle_style(**dict(style_items)))
+
+
+def _clip_video_filters(
+    aspect_ratio: str,
+    subtitle_file: str | None = None,
+    style_config: Dict[str, Any] | None = None,
+) -> Tuple[List[str], int]:
+    """
+    Build the aspect-ratio conversion (and subtitle burn-in) filter chain for a clip.
+
+    Args:
+        aspect_ratio: Output aspect ratio ("9:16", "1:1" or "16:9")
+        subtitle_file: Optional path to an existing ASS subtitle file to burn in
+        style_config: Optional style configuration dict for subtitle styling
+
+    Returns:
+        (filters, target_width)
+    """
+    base_filters, target_width = _aspect_filters(aspect_ratio)
+    video_filters = list(base_filters)
+
+    # Add subtitles filter if provided
+    if subtitle_file:
+        force_style = _force_style(tuple(sorted((style_config or {}).items())))
+        video_filters.append(
+            f"subtitles={subtitle_file}:force_style='{force_style}'"
+        )
+
+    return video_filters, target_width
+
+
+def _starts_on_keyframe(input_video: str, start: float) -> bool:
+    """Whether a cut at start begins exactly on a video keyframe."""
+    try:
+        keyframes = keyframe_times(input_video)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return nearest_keyframe(keyframes, start, KEYFRAME_EPSILON) is not None
+
+
+def _matches_output_format(input_video: str, aspect_ratio: str) -> bool:
+    """
+    Whether the source streams already are what a re-encode would produce.
+
+    That means H.264 video at exactly the target size for aspect_ratio and
+    AAC 44.1 kHz audio (or no audio), so a stream copy gives the same
+    output format as every other path.
+    """
+    try:
+        streams = probe(input_video).get("streams", [])
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    target = ASPECT_RATIOS.get(aspect_ratio)
+    video = next((st for st in streams if st.get("codec_type") == "video"), None)
+    audio = next((st for st in streams if st.get("codec_type") == "audio"), None)
+    if target is None or video is None:
+        return False
+    if (video.get("codec_name"), video.get("width"), video.get("height")) != ("h264", target["width"], target["height"]):
+        return False
+    return audio is None or (audio.get("codec_name"), str(audio.get("sample_rate"))) == ("aac", "44100")
+
+
 def cut_clip_ffmpeg(
     input_video: str,
     start: float,
@@ -283,6 +588,8 @@ def cut_clip_ffmpeg(
     style_config: Dict[str, Any] | None = None,
     aspect_ratio: str = "9:16",
     brand_template: BrandTemplate | None = None,
+    encoder: str = "auto",
+    threads: int | None = None,
 ) -> None:
     """
     Cut a clip from the input video, convert to specified aspect ratio, and optionally burn in subtitles and branding.
@@ -292,95 +599,99 @@ def cut_clip_ffmpeg(
     - 1:1 (1080x1080) - Instagram posts
     - 16:9 (1920x1080) - Traditional YouTube videos
 
+    When the clip starts on a keyframe, needs no subtitles or branding, and
+    the source already is H.264/AAC at the target size, the streams are
+    copied without re-encoding.
+
     Args:
         input_video: Path to source video
         start: Start time in seconds
         end: End time in seconds
         output_path: Where to save the clip
-        subtitle_file: Optional path to ASS subtitle file to burn in
+        subtitle_file: Optional path to an existing ASS subtitle file to burn in
         style_config: Optional style configuration dict for subtitle styling
         aspect_ratio: Output aspect ratio (default: "9:16")
         brand_template: Optional BrandTemplate for logo overlays and intro/outro
+        encoder: Video encoder - "auto" (NVENC if usable, else libx264),
+            "libx264", "h264_nvenc" or "hevc_nvenc"
+        threads: Threads for this ffmpeg's filters and encoder (None = ffmpeg
+            default); set when several clips encode at once
     """
     duration = max(end - start, 1.0)
+    has_subtitles = bool(subtitle_file)
+    on_keyframe = _starts_on_keyframe(input_video, start)
+
+    if on_keyframe and not has_subtitles and brand_template is None and _matches_output_format(input_video, aspect_ratio):
+        # Nothing to change in the picture: copy the streams, no decode/encode
+        cmd = [
+            "ffmpeg", "-y",
+            "-fflags", "+genpts",
+            "-ss", str(start),
+            "-i", input_video,
+            "-t", str(duration),
+            "-map", "0:v:0",
+            "-map", "0:a:0?",
+            "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
+            *MP4_OUTPUT_ARGS,
+            output_path,
+        ]
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
 
-    # Define target dimensions based on aspect ratio
-    aspect_configs = {
-        "9:16": {"width": 1080, "height": 1920, "ratio": 9/16},  # Vertical (Shorts/Reels/TikTok)
-        "1:1": {"width": 1080, "height": 1080, "ratio": 1},      # Square (Instagram)
-        "16:9": {"width": 1920, "height": 1080, "ratio": 16/9},  # Horizontal (YouTube)
-    }
-
-    if aspect_ratio not in aspect_configs:
-        raise ValueError(f"Unsupported aspect ratio: {aspect_ratio}. Choose from: {list(aspect_configs.keys())}")
-
-    config = aspect_configs[aspect_ratio]
-    target_width = config["width"]
-    target_height = config["height"]
-    target_ratio = config["ratio"]
-
-    # Build video filter for aspect ratio conversion
-    # Strategy: Scale and crop to target dimensions while maintaining center focus
-    video_filters = [
-        # Scale to fit within target dimensions, maintaining aspect ratio
-        f"scale='if(gt(iw/ih,{target_ratio}),{target_width},-2)':'if(gt(iw/ih,{target_ratio}),-2,{target_height})'",
-        # Pad to exactly target dimensions if needed (center the content)
-        f"pad={target_width}:{target_height}:(ow-iw)/2:(oh-ih)/2:black",
-        # If source is wider than target, crop instead
-        f"crop='if(gt(iw/ih,{target_ratio}),ih*{target_ratio},iw)':'if(gt(iw/ih,{target_ratio}),ih,iw/{target_ratio})'",
-        # Final scale to ensure exact dimensions
-        f"scale={target_width}:{target_height}",
-    ]
+    video_encoder = resolve_video_encoder(encoder)
+    use_nvenc = video_encoder != "libx264"
 
-    # Add subtitles filter if provided
-    if subtitle_file and os.path.exists(subtitle_file):
-        # Create style from config for force_style parameter
-        if style_config is None:
-            style_config = {}
+    video_filters, target_width = _clip_video_filters(aspect_ratio, subtitle_file, style_config)
 
-        subtitle_style = create_subtitle_style(**style_config)
-        force_style = style_to_force_style(subtitle_style)
+    # Add logo input if brand template with logo is provided
+    logo_overlay = None
+    if brand_template and brand_template.logo_path:
+        logo_overlay = prepare_logo_overlay(brand_template, target_width, base_label="base")
 
-        video_filters.append(
-            f"subtitles={subtitle_file}:force_style='{force_style}'"
-        )
+    # CUDA overlay frames can go straight into NVENC without a download
+    gpu_frames = bool(logo_overlay and logo_overlay.hw_accel == "cuda" and use_nvenc)
 
     # Build FFmpeg command
-    cmd = [
-        "ffmpeg",
-        "-y",
+    cmd = ["ffmpeg", "-y"]
+    if threads:
+        cmd.extend(["-filter_threads", str(threads), "-filter_complex_threads", str(threads)])
+    if logo_overlay:
+        cmd.extend(hw_accel_input_args(logo_overlay.hw_accel))
+    if use_nvenc:
+        # Decode on the GPU too; frames come back to system memory for the
+        # CPU scale/pad/crop/subtitles chain (one download per frame)
+        cmd.extend(["-hwaccel", "cuda"])
+    if on_keyframe:
+        # Start decoding at the keyframe itself; nothing to discard before it
+        cmd.append("-noaccurate_seek")
+    cmd.extend([
         "-ss",
         str(start),
         "-i",
         input_video,
-    ]
+    ])
 
-    # Add logo input if brand template with logo is provided
-    use_filter_complex = False
-    if brand_template and brand_template.logo_path:
-        validate_template(brand_template)
-        cmd.extend(["-i", brand_template.logo_path])
-        use_filter_complex = True
+    if logo_overlay:
+        cmd.extend(["-i", logo_overlay.input_path])
 
     cmd.extend(["-t", str(duration)])
 
     # Build filter string (either -vf or -filter_complex)
-    if use_filter_complex:
+    if logo_overlay:
         # Use filter_complex for logo overlay
         # First apply aspect ratio conversion, then overlay logo
         vf_base = ",".join(video_filters)
 
-        # Create logo overlay filter
-        logo_filter = create_logo_overlay_filter(
-            brand_template.logo_path,
-            brand_template.logo_position,
-            brand_template.logo_size,
-            brand_template.logo_opacity,
-            target_width,
-        )
+        if logo_overlay.pre_filter:
+            vf_base = f"{vf_base},{logo_overlay.pre_filter}"
 
-        # Combine: [0:v] aspect conversion [out]; [out][1:v overlay with logo]
-        filter_complex = f"[0:v]{vf_base}[base];{logo_filter}"
+        # Combine: [0:v] aspect conversion [base]; [base][1:v overlay with logo]
+        filter_complex = f"[0:v]{vf_base}[base];{logo_overlay.filter}"
+
+        # GPU overlay output stays on the device when a GPU encoder takes it
+        if logo_overlay.hw_accel and not gpu_frames:
+            filter_complex = f"{filter_complex},{HW_DOWNLOAD_FILTER}"
 
         cmd.extend(["-filter_complex", filter_complex])
     else:
@@ -389,31 +700,440 @@ def cut_clip_ffmpeg(
         cmd.extend(["-vf", vf_string])
 
     # Add encoding options
-    cmd.extend([
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "23",
-        "-profile:v",
-        "high",
-        "-level",
-        "4.2",
-        "-pix_fmt",
-        "yuv420p",
-        "-c:a",
-        "aac",
-        "-b:a",
-        "128k",
+    cmd.extend(_video_encoder_args(video_encoder, gpu_frames))
+    if threads:
+        cmd.extend(["-threads", str(threads)])
+    cmd.extend(AUDIO_ENCODER_ARGS)
+    cmd.extend(["-avoid_negative_ts", "make_zero", *MP4_OUTPUT_ARGS, output_path])
+
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def cut_all_clips_ffmpeg(
+    input_video: str,
+    clips: List[Tuple[float, float, str, str | None]],
+    style_config: Dict[str, Any] | None = None,
+    aspect_ratio: str = "9:16",
+    brand_template: BrandTemplate | None = None,
+    encoder: str = "auto",
+    threads: int | None = None,
+) -> None:
+    """
+    Cut several clips from one decode of the source video.
+
+    A single ffmpeg seeks to the first clip, decodes up to the end of the last
+    one and splits that span into one trimmed, converted (and subtitled/
+    branded) branch per clip, each with its own output file. Keep batches
+    small: every output holds an open encoder (and NVENC session) for the
+    whole run.
+
+    Args:
+        input_video: Path to source video
+        clips: (start, end, output_path, subtitle_file or None) per clip
+        style_config: Optional style configuration dict for subtitle styling
+        aspect_ratio: Output aspect ratio (default: "9:16")
+        brand_template: Optional BrandTemplate for logo overlays
+        encoder: Video encoder, as for cut_clip_ffmpeg
+        threads: Thread budget for this ffmpeg, split between the encoders
+            (None = ffmpeg default)
+    """
+    if not clips:
+        return
+
+    video_encoder = resolve_video_encoder(encoder)
+    use_nvenc = video_encoder != "libx264"
+    has_audio = any(
+        stream.get("codec_type") == "audio"
+        for stream in probe(input_video).get("streams", [])
+    )
+    span_start = min(start for start, _, _, _ in clips)
+    span_end = max(start + max(end - start, 1.0) for start, end, _, _ in clips)
+    count = len(clips)
+    with_logo = bool(brand_template and brand_template.logo_path)
+
+    graph = ["[0:v]split=" + str(count) + "".join(f"[v{i}]" for i in range(count))]
+    if has_audio:
+        graph.append("[0:a]asplit=" + str(count) + "".join(f"[a{i}]" for i in range(count)))
+    if with_logo:
+        graph.append("[1:v]split=" + str(count) + "".join(f"[logo{i}]" for i in range(count)))
+
+    hw_accel = None
+    outputs = []
+    for i, (start, end, output_path, subtitle_file) in enumerate(clips):
+        # Times are relative to the input seek point
+        clip_start = start - span_start
+        clip_end = clip_start + max(end - start, 1.0)
+
+        video_filters, target_width = _clip_video_filters(aspect_ratio, subtitle_file, style_config)
+        chain = f"[v{i}]trim=start={clip_start}:end={clip_end},setpts=PTS-STARTPTS," + ",".join(video_filters)
+
+        gpu_frames = False
+        if with_logo:
+            logo_overlay = prepare_logo_overlay(
+                brand_template, target_width, base_label=f"base{i}", logo_label=f"logo{i}"
+            )
+            hw_accel = logo_overlay.hw_accel
+            gpu_frames = logo_overlay.hw_accel == "cuda" and use_nvenc
+            if logo_overlay.pre_filter:
+                chain = f"{chain},{logo_overlay.pre_filter}"
+            chain = f"{chain}[base{i}];{logo_overlay.filter}"
+            if logo_overlay.hw_accel and not gpu_frames:
+                chain = f"{chain},{HW_DOWNLOAD_FILTER}"
+        graph.append(f"{chain}[out{i}]")
+
+        output_args = ["-map", f"[out{i}]"]
+        if has_audio:
+            graph.append(f"[a{i}]atrim=start={clip_start}:end={clip_end},asetpts=PTS-STARTPTS[aout{i}]")
+            output_args.extend(["-map", f"[aout{i}]"])
+        output_args.extend(_video_encoder_args(video_encoder, gpu_frames))
+        if threads:
+            # The encoders run side by side, so they share the thread budget
+            output_args.extend(["-threads", str(max(1, threads // count))])
+        if has_audio:
+            output_args.extend(AUDIO_ENCODER_ARGS)
+        output_args.extend(MP4_OUTPUT_ARGS)
+        output_args.append(output_path)
+        outputs.append(output_args)
+
+    cmd = ["ffmpeg", "-y"]
+    if threads:
+        cmd.extend(["-filter_threads", str(threads), "-filter_complex_threads", str(threads)])
+    cmd.extend(hw_accel_input_args(hw_accel))
+    if use_nvenc:
+        cmd.extend(["-hwaccel", "cuda"])
+    # Bound the input to the batch's span so decoding stops after the last clip
+    # instead of running on to the end of the source
+    cmd.extend(["-ss", str(span_start), "-t", str(span_end - span_start), "-i", input_video])
+    if with_logo:
+        cmd.extend(["-i", logo_overlay.input_path])
+    cmd.extend(["-filter_complex", ";".join(graph)])
+    for output_args in outputs:
+        cmd.extend(output_args)
+
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def cut_audio_ffmpeg(
+    input_video: str,
+    start: float,
+    end: float,
+    output_path: str,
+) -> None:
+    """
+    Cut a clip's audio as 16 kHz mono WAV (what Whisper works on).
+
+    Much cheaper than encoding the video just to transcribe it, and the
+    timing matches a clip cut with cut_clip_ffmpeg over the same range.
+
+    Args:
+        input_video: Path to source video
+        start: Start time in seconds
+        end: End time in seconds
+        output_path: Where to save the WAV file
+    """
+    duration = max(end - start, 1.0)
+
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-ss",
+        str(start),
+        "-i",
+        input_video,
+        "-t",
+        str(duration),
+        # Only the first audio stream; video/subtitle/data streams are not decoded
+        "-map",
+        "0:a:0",
+        "-vn",
+        "-sn",
+        "-dn",
+        "-ac",
+        "1",
         "-ar",
-        "44100",
+        "16000",
+        "-c:a",
+        "pcm_s16le",
+        "-f",
+        "wav",
         output_path,
-    ])
+    ]
 
     subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
+def _encode_concurrency(clip_count: int, encoder: str, max_workers: int | None = None) -> Tuple[int, int]:
+    """
+    Decide how many clips to encode at once and how many threads each ffmpeg gets.
+
+    Args:
+        clip_count: Number of clips to encode
+        encoder: Resolved video encoder
+        max_workers: Explicit limit on concurrent clips (None = automatic)
+
+    Returns:
+        (workers, threads_per_ffmpeg), with workers x threads ~= CPU cores
+    """
+    cpu_count = os.cpu_count() or 1
+
+    if max_workers is None:
+        max_workers = max(1, cpu_count // FFMPEG_THREADS_PER_JOB)
+        if encoder != "libx264":
+            # Consumer NVIDIA GPUs allow only a few concurrent NVENC sessions
+            max_workers = min(max_workers, NVENC_MAX_SESSIONS)
+
+    workers = max(1, min(clip_count, max_workers))
+    threads = max(1, cpu_count // workers)
+    return workers, threads
+
+
+def _clip_subtitles(
+    seg: Dict[str, Any],
+    idx: int,
+    *,
+    transcript: List[Dict[str, Any]],
+    video_path: str,
+    subtitles_dir: str,
+    subtitle_type: str,
+    style_config: Dict[str, Any],
+) -> str | None:
+    """
+    Generate the subtitle file for one segment.
+
+    Failures are logged and yield None, so the clip is still cut without subtitles.
+
+    Returns:
+        Path to the ASS subtitle file, or None
+    """
+    start = seg["start"]
+    end = seg["end"]
+    text = seg["text"]
+    transcript_entries = transcript[seg["i0"]:seg["i1"]]
+
+    subtitle_file = None
+    try:
+        if subtitle_type == "keywords" and transcript_entries:
+            # Key word overlays using LLM, timed from the clip start
+            adjusted_entries = [
+                {"start": max(0, entry["start"] - start), "duration": entry["duration"], "text": entry["text"]}
+                for entry in transcript_entries
+            ]
+
+            subtitle_file = generate_subtitles_for_clip(
+                transcript_segment=adjusted_entries,
+                full_text=text,
+                output_dir=subtitles_dir,
+                clip_index=idx,
+            )
+        elif subtitle_type in ("transcription", "both"):
+            if subtitle_type == "both":
+                # Generate both types - this is advanced, for now just use transcription
+                print(f"[pipeline] 'both' subtitle type not fully implemented yet, using transcription")
+
+            # Full transcription using Whisper. Whisper only needs the
+            # audio, so cut just that instead of encoding the clip twice
+            audio_path = os.path.join(subtitles_dir, f"audio_{idx:02d}.wav")
+            cut_audio_ffmpeg(video_path, start, end, audio_path)
+            try:
+                subtitle_file = generate_whisper_subtitles_for_clip(
+                    video_path=video_path,
+                    output_dir=subtitles_dir,
+                    clip_index=idx,
+                    subtitle_format="ass",
+                    style_config=style_config,
+                    audio_path=audio_path,
+                )
+            finally:
+                try:
+                    os.remove(audio_path)
+                except OSError as e:
+                    print(f"[pipeline] Warning: Could not remove temp file {audio_path}: {e}")
+
+    except (FileNotFoundError, RuntimeError, OSError, subprocess.CalledProcessError) as e:
+        print(f"[pipeline] Warning: Subtitle generation failed for clip #{idx}: {e}")
+        subtitle_file = None
+    except Exception as e:
+        # Unexpected error - log and continue but warn more severely
+        print(f"[pipeline] ERROR: Unexpected error during subtitle generation for clip #{idx}: {type(e).__name__}: {e}")
+        subtitle_file = None
+
+    return subtitle_file
+
+
+def _finish_clip(
+    seg: Dict[str, Any],
+    idx: int,
+    cut_path: str,
+    output_path: str,
+    *,
+    url: str,
+    clips_dir: str,
+    brand_template: BrandTemplate | None,
+) -> ClipInfo:
+    """
+    Add intro/outro to a cut clip (if the template has them) and describe it.
+
+    Returns:
+        ClipInfo for the finished clip
+    """
+    start = seg["start"]
+    end = seg["end"]
+    text = seg["text"]
+
+    if cut_path != output_path:
+        concat_intro_outro(cut_path, brand_template, output_path, clips_dir, validated=True)
+        try:
+            os.remove(cut_path)
+        except OSError as e:
+            print(f"[pipeline] Warning: Could not remove temp file {cut_path}: {e}")
+
+    title = generate_title(text, idx)
+    description = generate_description(url, start, end, text)
+
+    clip_info = ClipInfo(
+        clip_index=idx,
+        start=start,
+        end=end,
+        duration=end - start,
+        title=title,
+        description=description,
+        text_preview=text[:300],
+        file_name=os.path.basename(output_path),
+        original_video_url=url,
+    )
+
+    return clip_info
+
+
+def _clip_paths(video_id: str, idx: int, clips_dir: str, brand_template: BrandTemplate | None) -> Tuple[str, str]:
+    """
+    Paths for one clip: where ffmpeg cuts it, and the finished file.
+
+    With intro/outro, the main body is cut to a temp file and stream-copy
+    concatenated afterwards.
+
+    Returns:
+        (cut_path, output_path)
+    """
+    file_name = f"{video_id}_clip_{idx:02d}.mp4"
+    output_path = os.path.join(clips_dir, file_name)
+    if brand_template is not None and requires_concat(brand_template):
+        return os.path.join(clips_dir, f"body_{file_name}"), output_path
+    return output_path, output_path
+
+
+def _process_one_clip(
+    seg: Dict[str, Any],
+    idx: int,
+    *,
+    url: str,
+    transcript: List[Dict[str, Any]],
+    video_id: str,
+    video_path: str,
+    clips_dir: str,
+    subtitles_dir: str,
+    enable_subtitles: bool,
+    subtitle_type: str,
+    style_config: Dict[str, Any],
+    aspect_ratio: str,
+    brand_template: BrandTemplate | None,
+    encoder: str,
+    threads: int | None,
+) -> Tuple[str, ClipInfo]:
+    """
+    Generate subtitles for one segment, cut and brand the clip.
+
+    Runs on process_video's worker pool; every file it writes is named after
+    the clip index, so clips don't collide. Arguments are as for process_video
+    and cut_clip_ffmpeg.
+
+    Returns:
+        (output_path, clip_info)
+    """
+    subtitle_file = None
+    if enable_subtitles:
+        subtitle_file = _clip_subtitles(
+            seg, idx, transcript=transcript, video_path=video_path, subtitles_dir=subtitles_dir,
+            subtitle_type=subtitle_type, style_config=style_config,
+        )
+
+    cut_path, output_path = _clip_paths(video_id, idx, clips_dir, brand_template)
+
+    # Cut the clip once, burning in subtitles if any were generated
+    cut_clip_ffmpeg(video_path, seg["start"], seg["end"], cut_path, subtitle_file, style_config=style_config, aspect_ratio=aspect_ratio, brand_template=brand_template, encoder=encoder, threads=threads)
+
+    clip_info = _finish_clip(seg, idx, cut_path, output_path, url=url, clips_dir=clips_dir, brand_template=brand_template)
+    return output_path, clip_info
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group an iterable into lists of up to size items, lazily."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _max_clip_count(transcript: List[Dict[str, Any]], target_len: int = TARGET_CLIP_SEC, max_clips: int = MAX_CLIPS_PER_VIDEO) -> int:
+    """Upper bound on the number of segments iter_clips_from_transcript yields."""
+    if not transcript:
+        return 1
+    span = transcript[-1]["start"] + transcript[-1]["duration"] - transcript[0]["start"]
+    # Every segment but the last covers at least target_len seconds
+    return max(1, min(max_clips, int(span // target_len) + 1))
+
+
+def _process_single_clip(batch: List[Tuple[int, Dict[str, Any]]], **clip_kwargs) -> List[Tuple[str, ClipInfo]]:
+    """Run _process_one_clip for a one-clip batch (same shape as _process_clip_batch)."""
+    return [_process_one_clip(seg, idx, **clip_kwargs) for idx, seg in batch]
+
+
+def _process_clip_batch(
+    batch: List[Tuple[int, Dict[str, Any]]],
+    *,
+    url: str,
+    transcript: List[Dict[str, Any]],
+    video_id: str,
+    video_path: str,
+    clips_dir: str,
+    subtitles_dir: str,
+    enable_subtitles: bool,
+    subtitle_type: str,
+    style_config: Dict[str, Any],
+    aspect_ratio: str,
+    brand_template: BrandTemplate | None,
+    encoder: str,
+    threads: int | None,
+) -> List[Tuple[str, ClipInfo]]:
+    """
+    Like _process_one_clip, but cut a batch of clips from one decode of the source.
+
+    Args:
+        batch: (clip_index, segment) pairs, in source order
+
+    Returns:
+        (output_path, clip_info) per clip
+    """
+    cuts = []
+    paths = []
+    for idx, seg in batch:
+        subtitle_file = None
+        if enable_subtitles:
+            subtitle_file = _clip_subtitles(
+                seg, idx, transcript=transcript, video_path=video_path, subtitles_dir=subtitles_dir,
+                subtitle_type=subtitle_type, style_config=style_config,
+            )
+        cut_path, output_path = _clip_paths(video_id, idx, clips_dir, brand_template)
+        cuts.append((seg["start"], seg["end"], cut_path, subtitle_file))
+        paths.append((cut_path, output_path))
+
+    cut_all_clips_ffmpeg(video_path, cuts, style_config=style_config, aspect_ratio=aspect_ratio, brand_template=brand_template, encoder=encoder, threads=threads)
+
+    return [
+        (output_path, _finish_clip(seg, idx, cut_path, output_path, url=url, clips_dir=clips_dir, brand_template=brand_template))
+        for (idx, seg), (cut_path, output_path) in zip(batch, paths)
+    ]
+
+
 def process_video(
     url: str,
     enable_subtitles: bool = True,
@@ -421,6 +1141,10 @@ def process_video(
     style_config: Dict[str, Any] | None = None,
     aspect_ratio: str = "9:16",
     brand_template: BrandTemplate | None = None,
+    on_clip_ready: Callable[[str, ClipInfo], None] | None = None,
+    encoder: str = "auto",
+    max_workers: int | None = None,
+    single_pass: bool = False,
 ) -> List[ClipInfo]:
     """
     Process a YouTube video: download, generate clips, and optionally add subtitles and branding.
@@ -432,16 +1156,30 @@ def process_video(
         style_config: Optional style configuration dict for subtitle styling
         aspect_ratio: Output aspect ratio - "9:16" (Shorts), "1:1" (Instagram), "16:9" (YouTube) (default: "9:16")
         brand_template: Optional BrandTemplate for logo overlays and intro/outro
+        on_clip_ready: Optional callback(output_path, clip_info) run as soon as
+            each clip is written, e.g. to start uploading it while the next encodes
+        encoder: Video encoder - "auto" (NVENC if usable, else libx264),
+            "libx264", "h264_nvenc" or "hevc_nvenc"
+        max_workers: Clips to encode concurrently (default: one per
+            FFMPEG_THREADS_PER_JOB cores, at most NVENC_MAX_SESSIONS with NVENC).
+            on_clip_ready is called from this thread, in completion order
+        single_pass: Cut neighbouring clips in batches, decoding each stretch
+            of the source once per batch instead of once per clip
 
     Returns:
-        List of ClipInfo objects
+        List of ClipInfo objects (in clip order)
     """
     if style_config is None:
         style_config = {}
+    if brand_template is not None:
+        # Fail before downloading anything; clips below skip the existence re-checks
+        validate_template(brand_template)
+    # Resolve (and probe NVENC) once, not per clip
+    video_encoder = resolve_video_encoder(encoder)
     start_time = time.time()
     video_id = extract_video_id(url)
     video_dir = os.path.join(OUTPUT_ROOT, video_id)
-    raw_dir = os.path.join(video_dir, "raw")
+    raw_dir = _raw_dir(video_id)
     clips_dir = os.path.join(video_dir, "clips")
     subtitles_dir = os.path.join(video_dir, "subtitles")
 
@@ -457,148 +1195,100 @@ def process_video(
     print_info(f"Video ID: {video_id}")
     print_info(f"Subtitle Type: {subtitle_type if enable_subtitles else 'None'}")
     print_info(f"Aspect Ratio: {aspect_ratio}")
+    print_info(f"Encoder: {video_encoder}")
     console.print()
 
-    with console.status("[bold cyan]Downloading video...", spinner="dots"):
-        video_path = download_video(url, raw_dir)
+    # Download the video and fetch the transcript at the same time; they
+    # wait on different endpoints
+    def download_and_index() -> Tuple[str, Tuple[float, ...]]:
+        path = download_video(url)
+        # Keyframe listing overlaps the transcript fetch when that is slower
+        return path, keyframe_times(path)
+
+    with console.status("[bold cyan]Downloading video and fetching transcript...", spinner="dots"):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            download = executor.submit(download_and_index)
+            transcript_future = executor.submit(get_transcript, video_id)
+            video_path, keyframes = download.result()
+            transcript = transcript_future.result()
     print_success(f"Downloaded video")
-
-    # Fetch transcript
-    with console.status("[bold cyan]Fetching transcript...", spinner="dots"):
-        transcript = get_transcript(video_id)
     print_success(f"Fetched transcript ({len(transcript)} entries)")
-
-    # Build segments
-    with console.status("[bold cyan]Building clip segments...", spinner="dots"):
-        segments = build_clips_from_transcript(transcript)
-    if not segments:
-        raise RuntimeError("No segments generated – adjust clip settings.")
-
-    print_success(f"Generated {len(segments)} clip segments")
     console.print()
+
+    # Segments are submitted as the transcript scan yields them, so the
+    # first clip starts encoding before the rest are found
+    numbered = enumerate(iter_clips_from_transcript(transcript, keyframes=keyframes), start=1)
+    if single_pass:
+        # One ffmpeg per batch; with NVENC a batch already uses every session
+        batch_size = NVENC_MAX_SESSIONS if video_encoder != "libx264" else SINGLE_PASS_BATCH_SIZE
+        jobs = _batched(numbered, batch_size)
+        if video_encoder != "libx264":
+            max_workers = 1
+        run_job = _process_clip_batch
+    else:
+        batch_size = 1
+        jobs = ([item] for item in numbered)
+        run_job = _process_single_clip
+
+    # Jobs are independent: run several at once, splitting the cores
+    # between the concurrent ffmpeg processes. The pool is sized before the
+    # segments exist, from an upper bound on their number
+    expected_clips = _max_clip_count(transcript)
+    workers, threads = _encode_concurrency(-(-expected_clips // batch_size), video_encoder, max_workers)
+    clip_kwargs = dict(
+        url=url,
+        transcript=transcript,
+        video_id=video_id,
+        video_path=video_path,
+        clips_dir=clips_dir,
+        subtitles_dir=subtitles_dir,
+        enable_subtitles=enable_subtitles,
+        subtitle_type=subtitle_type,
+        style_config=style_config,
+        aspect_ratio=aspect_ratio,
+        brand_template=brand_template,
+        encoder=video_encoder,
+        threads=threads,
+    )
     clips: List[ClipInfo] = []
 
     # Process clips with progress bar
-    print_info("Processing clips...")
+    print_info(f"Processing clips ({workers} {'batches' if single_pass else 'clips'} at a time)...")
     with create_progress_bar() as progress:
-        task = progress.add_task("[cyan]Generating clips...", total=len(segments))
+        task = progress.add_task("[cyan]Generating clips...", total=expected_clips)
 
-        for idx, seg in enumerate(segments, start=1):
-            start = seg["start"]
-            end = seg["end"]
-            text = seg["text"]
-            duration = end - start
-            transcript_entries = seg.get("transcript_entries", [])
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            segment_count = 0
+            for job in jobs:
+                futures.append(executor.submit(run_job, job, **clip_kwargs))
+                segment_count += len(job)
+            if not segment_count:
+                raise RuntimeError("No segments generated – adjust clip settings.")
 
-            file_name = f"{video_id}_clip_{idx:02d}.mp4"
-            output_path = os.path.join(clips_dir, file_name)
+            progress.update(task, total=segment_count)
+            print_success(f"Generated {segment_count} clip segments")
 
-            progress.update(task, description=f"[cyan]Processing clip #{idx}/{len(segments)}...")
+            for future in as_completed(futures):
+                for output_path, clip_info in future.result():
+                    clips.append(clip_info)
+                    if on_clip_ready is not None:
+                        on_clip_ready(output_path, clip_info)
 
-            # Generate subtitles if enabled
-            subtitle_file = None
-            if enable_subtitles:
-                try:
-                    if subtitle_type == "keywords" and transcript_entries:
-                        # Key word overlays using LLM
-                        adjusted_entries = []
-                        for entry in transcript_entries:
-                            adjusted_entry = entry.copy()
-                            adjusted_entry["start"] = max(0, entry["start"] - start)
-                            adjusted_entries.append(adjusted_entry)
-
-                        subtitle_file = generate_subtitles_for_clip(
-                            transcript_segment=adjusted_entries,
-                            full_text=text,
-                            output_dir=subtitles_dir,
-                            clip_index=idx,
-                        )
-                    elif subtitle_type == "transcription":
-                        # Full transcription using Whisper
-                        # Need to cut the clip first, then transcribe it
-                        temp_clip_path = os.path.join(clips_dir, f"temp_{file_name}")
-                        cut_clip_ffmpeg(video_path, start, end, temp_clip_path, subtitle_file=None, style_config=style_config, aspect_ratio=aspect_ratio, brand_template=brand_template)
-
-                        subtitle_file = generate_whisper_subtitles_for_clip(
-                            video_path=temp_clip_path,
-                            output_dir=subtitles_dir,
-                            clip_index=idx,
-                            subtitle_format="ass",
-                            style_config=style_config,
-                        )
-
-                        # Remove temp clip, will regenerate with subtitles
-                        try:
-                            os.remove(temp_clip_path)
-                        except OSError as e:
-                            print(f"[pipeline] Warning: Could not remove temp file {temp_clip_path}: {e}")
-
-                    elif subtitle_type == "both":
-                        # Generate both types - this is advanced, for now just use transcription
-                        print(f"[pipeline] 'both' subtitle type not fully implemented yet, using transcription")
-                        temp_clip_path = os.path.join(clips_dir, f"temp_{file_name}")
-                        cut_clip_ffmpeg(video_path, start, end, temp_clip_path, subtitle_file=None, style_config=style_config, aspect_ratio=aspect_ratio, brand_template=brand_template)
-
-                        subtitle_file = generate_whisper_subtitles_for_clip(
-                            video_path=temp_clip_path,
-                            output_dir=subtitles_dir,
-                            clip_index=idx,
-                            subtitle_format="ass",
-                            style_config=style_config,
-                        )
-
-                        try:
-                            os.remove(temp_clip_path)
-                        except OSError as e:
-                            print(f"[pipeline] Warning: Could not remove temp file {temp_clip_path}: {e}")
-
-                except (FileNotFoundError, RuntimeError, OSError, subprocess.CalledProcessError) as e:
-                    print(f"[pipeline] Warning: Subtitle generation failed for clip #{idx}: {e}")
-                    subtitle_file = None
-                except Exception as e:
-                    # Unexpected error - log and continue but warn more severely
-                    print(f"[pipeline] ERROR: Unexpected error during subtitle generation for clip #{idx}: {type(e).__name__}: {e}")
-                    subtitle_file = None
-
-            # Cut the clip with optional subtitles
-            # For transcription, we already cut a temp clip above, so only cut with subtitles
-            if subtitle_type == "transcription" or subtitle_type == "both":
-                if subtitle_file and os.path.exists(subtitle_file):
-                    cut_clip_ffmpeg(video_path, start, end, output_path, subtitle_file, style_config=style_config, aspect_ratio=aspect_ratio, brand_template=brand_template)
-                else:
-                    cut_clip_ffmpeg(video_path, start, end, output_path, subtitle_file=None, style_config=style_config, aspect_ratio=aspect_ratio, brand_template=brand_template)
-            else:
-                # For keywords or no subtitles
-                cut_clip_ffmpeg(video_path, start, end, output_path, subtitle_file, style_config=style_config, aspect_ratio=aspect_ratio, brand_template=brand_template)
-
-            title = generate_title(text, idx)
-            description = generate_description(url, start, end, text)
-
-            clip_info = ClipInfo(
-                clip_index=idx,
-                start=start,
-                end=end,
-                duration=duration,
-                title=title,
-                description=description,
-                text_preview=text[:300],
-                file_name=file_name,
-                original_video_url=url,
-            )
-            clips.append(clip_info)
+                    progress.update(task, description=f"[cyan]Finished clip #{clip_info.clip_index}/{segment_count}...")
+                    progress.advance(task)
 
-            progress.advance(task)
+    clips.sort(key=lambda c: c.clip_index)
 
     # Save manifest
     manifest_path = os.path.join(video_dir, "manifest.json")
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump([asdict(c) for c in clips], f, indent=2, ensure_ascii=False)
+    write_manifest(manifest_path, clips)
 
     # Print summary
     elapsed_time = time.time() - start_time
     console.print()
     print_success(f"All clips processed!")
-    print_summary_table([asdict(c) for c in clips], subtitle_type if enable_subtitles else None)
+    print_summary_table([vars(c) for c in clips], subtitle_type if enable_subtitles else None)
     print_completion_message(video_id, len(clips), elapsed_time)
 
     print_info(f"Output: {clips_dir}")
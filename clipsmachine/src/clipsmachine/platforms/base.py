@@ -3,15 +3,32 @@ Base platform interface for multi-platform social media uploads.
 All platform implementations inherit from this base class.
 """
 
+import hashlib
+import json
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from ..brand_cache import cache_root
+from ..ffprobe_cache import probe
+from ..log import get_logger
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = get_logger(__name__)
+
+
+@dataclass(frozen=True)
 class PlatformConfig:
-    """Configuration for a social media platform."""
+    """Configuration for a social media platform (shared by all instances; read-only)."""
 
     # Video specifications
     max_duration: int  # seconds
@@ -42,6 +59,7 @@ class UploadResult:
     url: Optional[str] = None
     error: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    rate_limited: bool = False  # Not attempted; the platform's rate limit was reached
 
     def __str__(self) -> str:
         if self.success:
@@ -49,6 +67,189 @@ class UploadResult:
         return f"❌ {self.platform}: {self.error}"
 
 
+def create_http_session(pool_maxsize: int = 16):
+    """
+    requests.Session with keep-alive connection pooling and retries.
+
+    Platforms that talk to a REST API reuse one session, so calls after the
+    first skip the TCP/TLS handshake. Idempotent requests are retried on
+    connection errors, 429 and 5xx responses (POSTs are not).
+
+    Size pool_maxsize to at least the number of threads sharing the session:
+    beyond it urllib3 opens throwaway connections (a new handshake each time)
+    instead of reusing pooled ones.
+
+    Args:
+        pool_maxsize: Connections kept open per host
+
+    Returns:
+        Configured requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def load_json_config(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a platform's JSON config/credentials file.
+
+    Opens the file directly (no separate existence check), so a missing file
+    costs one failed open rather than a stat plus an open.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed config, or None if the file doesn't exist
+    """
+    try:
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _load_json_config_cached(path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Parse a config file once for a given (path, mtime, size)."""
+    return load_json_config(path)
+
+
+@lru_cache(maxsize=256)
+def _format_hashtags_cached(tags: tuple[str, ...], max_hashtags: int) -> str:
+    """
+    Format tags as hashtags, cached since a batch reuses one tag list across clips and platforms.
+
+    Args:
+        tags: Tag strings
+        max_hashtags: Maximum number of hashtags to keep
+
+    Returns:
+        Space-separated hashtag string
+    """
+    # Take only max allowed hashtags, then remove existing # symbols and spaces
+    return ' '.join(f"#{tag.strip().lstrip('#').replace(' ', '')}" for tag in tags[:max_hashtags])
+
+
+def response_json(response) -> Any:
+    """
+    Parse an HTTP response body as JSON.
+
+    Uses orjson on the raw bytes when it is installed (skipping requests'
+    charset detection), else response.json().
+
+    Args:
+        response: requests.Response
+
+    Returns:
+        Parsed JSON
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def save_json_config(path: str, config: Dict[str, Any]) -> None:
+    """
+    Atomically rewrite a platform's JSON config/credentials file.
+
+    Args:
+        path: Path to the JSON file
+        config: Config to write
+    """
+    # Unique per writer, so concurrent saves never share a temp file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w') as f:
+            json.dump(config, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+# Remember a successful token check for this long (seconds)
+TOKEN_VALIDATION_TTL = 3600
+
+# Longest an upload waits for its platform's rate limit before giving up
+RATE_LIMIT_MAX_WAIT = 60.0
+
+
+def _token_cache_file() -> str:
+    """File of last successful validation times per token hash, resolved when used."""
+    return os.path.join(cache_root(), "tokens.json")
+
+
+def _token_key(platform: str, token: str) -> str:
+    """Cache key for a token; only a hash is stored, never the token itself."""
+    return hashlib.blake2b(f"{platform}:{token}".encode(), digest_size=16).hexdigest()
+
+
+def token_recently_validated(platform: str, token: str) -> bool:
+    """
+    Check whether a token passed validation within TOKEN_VALIDATION_TTL.
+
+    Args:
+        platform: Platform name
+        token: Access token
+
+    Returns:
+        True if the validation call can be skipped
+    """
+    cache = load_json_config(_token_cache_file()) or {}
+    return cache.get(_token_key(platform, token), 0) > time.time() - TOKEN_VALIDATION_TTL
+
+
+def mark_token_validated(platform: str, token: str) -> None:
+    """
+    Record a successful token validation (expired entries are dropped).
+
+    Args:
+        platform: Platform name
+        token: Access token
+    """
+    now = time.time()
+    cache_file = _token_cache_file()
+    try:
+        cache = load_json_config(cache_file) or {}
+        cache = {k: t for k, t in cache.items() if t > now - TOKEN_VALIDATION_TTL}
+        cache[_token_key(platform, token)] = now
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        save_json_config(cache_file, cache)
+    except (OSError, ValueError) as e:
+        log.warning(f"[Platform] Warning: Could not update token cache: {e}")
+
+
+@lru_cache(maxsize=128)
+def _probe_duration(path: str, mtime_ns: int, size: int) -> Optional[float]:
+    """Duration of a media file in seconds (None if ffprobe can't tell), once per file version."""
+    try:
+        return float(probe(path)["format"]["duration"])
+    except Exception:
+        return None
+
+
 class Platform(ABC):
     """Abstract base class for all social media platforms."""
 
@@ -61,6 +262,10 @@ class Platform(ABC):
         """
         self.config_path = config_path
         self._authenticated = False
+        self._session = None
+        # One instance may serve several upload threads (see scheduler)
+        self._auth_lock = threading.Lock()
+        self._session_lock = threading.Lock()
 
     @property
     @abstractmethod
@@ -114,6 +319,29 @@ class Platform(ABC):
         """
         pass
 
+    def acquire_upload_slot(self) -> Optional[UploadResult]:
+        """
+        Take one upload from the platform's rate limit (see rate_limit.py).
+
+        Call right before the upload request itself, so uploads that fail
+        earlier (or never reach the API) don't use up the saved budget.
+
+        Returns:
+            Failed UploadResult if no upload frees up within
+            RATE_LIMIT_MAX_WAIT, or None if the upload can go ahead
+        """
+        from .rate_limit import get_rate_limiter
+
+        limiter = get_rate_limiter(self.name, self.config)
+        if limiter is None or limiter.acquire(timeout=RATE_LIMIT_MAX_WAIT):
+            return None
+        return UploadResult(
+            success=False,
+            platform=self.display_name,
+            error="Rate limit reached; try again later",
+            rate_limited=True,
+        )
+
     def validate_video(self, video_path: str) -> tuple[bool, Optional[str]]:
         """
         Validate video meets platform requirements.
@@ -126,15 +354,16 @@ class Platform(ABC):
         """
         path = Path(video_path)
 
-        # Check file exists
-        if not path.exists():
+        # Check file exists (one stat for existence, size and the probe cache key)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return False, f"Video file not found: {video_path}"
 
         # Check file size
-        file_size = path.stat().st_size
-        if file_size > self.config.max_file_size:
+        if st.st_size > self.config.max_file_size:
             max_mb = self.config.max_file_size / (1024 * 1024)
-            actual_mb = file_size / (1024 * 1024)
+            actual_mb = st.st_size / (1024 * 1024)
             return False, f"File too large: {actual_mb:.1f}MB (max: {max_mb:.1f}MB)"
 
         # Check format
@@ -143,6 +372,15 @@ class Platform(ABC):
             formats = ", ".join(self.config.supported_formats)
             return False, f"Unsupported format: {extension} (supported: {formats})"
 
+        # Check duration (cached per file version, failed probes included, so
+        # checking the same clip for several platforms probes it once)
+        duration = _probe_duration(str(path.resolve()), st.st_mtime_ns, st.st_size)
+        if duration is not None:
+            if duration > self.config.max_duration:
+                return False, f"Video too long: {duration:.1f}s (max: {self.config.max_duration}s)"
+            if duration < self.config.min_duration:
+                return False, f"Video too short: {duration:.1f}s (min: {self.config.min_duration}s)"
+
         return True, None
 
     def validate_metadata(
@@ -186,15 +424,100 @@ class Platform(ABC):
         Returns:
             Formatted hashtag string
         """
-        # Remove existing # symbols and spaces
-        clean_tags = [tag.strip().lstrip('#').replace(' ', '') for tag in tags]
+        return _format_hashtags_cached(tuple(tags), self.config.max_hashtags)
+
+    def build_caption(
+        self,
+        text: str,
+        tags: Optional[list[str]],
+        limit: int,
+        separator: str = "\n\n",
+    ) -> str:
+        """
+        Append hashtags to a caption without exceeding a length limit.
+
+        Each part is cut to the room left for it before joining, so an
+        over-long caption doesn't build the full concatenation only to slice it.
+
+        Args:
+            text: Caption text
+            tags: List of tags (formatted with format_hashtags)
+            limit: Maximum caption length
+            separator: Text placed between caption and hashtags
+
+        Returns:
+            Caption of at most limit characters
+        """
+        text = text[:limit]
+        remaining = limit - len(text) - len(separator)
+        if not tags or remaining <= 0:
+            return text
+        return f"{text}{separator}{self.format_hashtags(tags)[:remaining]}"
+
+    def _load_config(self, required_keys: list[str], help_url: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Load this platform's config file (self.config_file) and check required keys.
 
-        # Take only max allowed hashtags
-        clean_tags = clean_tags[:self.config.max_hashtags]
+        The parsed file is cached per file version (mtime and size), so
+        authenticating several platforms or re-authenticating doesn't re-read
+        unchanged files. Problems are printed with the platform's name.
 
-        # Format as hashtags
-        return ' '.join(f'#{tag}' for tag in clean_tags)
+        Args:
+            required_keys: Keys that must be present and non-empty
+            help_url: Where to get credentials, printed when the config is unusable
+
+        Returns:
+            Copy of the config dict (safe to modify), or None if it is missing or incomplete
+        """
+        try:
+            st = os.stat(self.config_file)
+            config = _load_json_config_cached(os.path.abspath(self.config_file), st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            config = None
+
+        if config is None:
+            log.error(f"[{self.display_name}] Error: {self.config_file} not found")
+            log.info(f"[{self.display_name}] Create config file with {', '.join(required_keys)}")
+            if help_url:
+                log.info(f"[{self.display_name}] See: {help_url}")
+            return None
+
+        missing = [key for key in required_keys if not config.get(key)]
+        if missing:
+            log.error(f"[{self.display_name}] Error: {' and '.join(missing)} required in config")
+            return None
+
+        return dict(config)
+
+    @property
+    def session(self):
+        """
+        Keep-alive requests session for REST platforms, created on first use.
+
+        requests (and urllib3, certifi, ...) is only imported once a platform
+        actually makes an HTTP call, not when it is registered.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = create_http_session()
+        return self._session
 
     def is_authenticated(self) -> bool:
         """Check if platform is authenticated."""
         return self._authenticated
+
+    def ensure_authenticated(self) -> bool:
+        """
+        Authenticate unless already authenticated.
+
+        Threads sharing the instance wait for one authenticate() call instead
+        of racing each other through OAuth flows and token refreshes.
+
+        Returns:
+            True if authenticated, False otherwise
+        """
+        if self._authenticated:
+            return True
+        with self._auth_lock:
+            return self._authenticated or self.authenticate()
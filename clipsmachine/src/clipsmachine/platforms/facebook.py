@@ -1,8 +1,9 @@
 """Facebook Reels platform implementation."""
-import os
-import json
 from typing import Optional
 from .base import Platform, PlatformConfig, UploadResult
+from ..log import get_logger
+
+log = get_logger(__name__)
 
 
 class FacebookReelsPlatform(Platform):
@@ -20,32 +21,31 @@ class FacebookReelsPlatform(Platform):
     def display_name(self) -> str:
         return "Facebook Reels"
 
+    # Built once per class; config is read for every validation and upload
+    _CONFIG = PlatformConfig(
+        max_duration=90,
+        min_duration=3,
+        aspect_ratio="9:16",
+        max_file_size=1024 * 1024 * 1024,  # 1 GB
+        supported_formats=["mp4", "mov"],
+        max_title_length=0,
+        max_description_length=2200,
+        max_tags=30,
+        max_hashtags=30,
+        requires_auth=True,
+    )
+
     @property
     def config(self) -> PlatformConfig:
-        return PlatformConfig(
-            max_duration=90,
-            min_duration=3,
-            aspect_ratio="9:16",
-            max_file_size=1024 * 1024 * 1024,  # 1 GB
-            supported_formats=["mp4", "mov"],
-            max_title_length=0,
-            max_description_length=2200,
-            max_tags=30,
-            max_hashtags=30,
-            requires_auth=True,
-        )
+        return self._CONFIG
 
     def authenticate(self) -> bool:
         """Authenticate with Facebook Graph API."""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    if config.get("access_token"):
-                        self._authenticated = True
-                        return True
-            print("[Facebook] Config file needed. See: https://developers.facebook.com/")
-            return False
+            if self._load_config(["access_token"], help_url="https://developers.facebook.com/") is None:
+                return False
+            self._authenticated = True
+            return True
         except:
             return False
 
@@ -62,7 +62,7 @@ class FacebookReelsPlatform(Platform):
         if tags:
             caption = f"{description}\n\n{self.format_hashtags(tags)}"
 
-        print(f"[Facebook] Ready to upload: {caption[:50]}...")
+        log.info(f"[Facebook] Ready to upload: {caption[:50]}...")
         return UploadResult(
             success=False,
             platform=self.display_name,
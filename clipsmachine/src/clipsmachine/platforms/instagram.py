@@ -3,13 +3,25 @@ Instagram Reels platform implementation.
 Uploads videos as Instagram Reels using Instagram Graph API.
 """
 
-import os
-import json
 import time
-import requests
 from typing import Optional
 
-from .base import Platform, PlatformConfig, UploadResult
+from .base import (
+    Platform,
+    PlatformConfig,
+    UploadResult,
+    mark_token_validated,
+    response_json,
+    save_json_config,
+    token_recently_validated,
+)
+from ..log import get_logger
+
+log = get_logger(__name__)
+
+
+# Refresh the long-lived access token when it expires within this many seconds
+TOKEN_REFRESH_MARGIN = 7 * 86400
 
 
 class InstagramReelsplatform(Platform):
@@ -17,6 +29,9 @@ class InstagramReelsplatform(Platform):
 
     API_VERSION = "v18.0"
     BASE_URL = f"https://graph.facebook.com/{API_VERSION}"
+    # Instagram-login tokens (IG...) refresh here; Facebook-login tokens
+    # (EAA...) are exchanged at {BASE_URL}/oauth/access_token instead
+    IG_REFRESH_URL = "https://graph.instagram.com/refresh_access_token"
 
     def __init__(self, config_path: Optional[str] = None):
         """
@@ -38,21 +53,24 @@ class InstagramReelsplatform(Platform):
     def display_name(self) -> str:
         return "Instagram Reels"
 
+    # Built once per class; config is read for every validation and upload
+    _CONFIG = PlatformConfig(
+        max_duration=90,  # Instagram Reels max 90 seconds
+        min_duration=1,
+        aspect_ratio="9:16",  # Vertical
+        max_file_size=100 * 1024 * 1024,  # 100 MB recommended
+        supported_formats=["mp4", "mov"],
+        max_title_length=0,  # Reels don't have titles
+        max_description_length=2200,  # Caption limit
+        max_tags=30,
+        max_hashtags=30,
+        requires_auth=True,
+        rate_limit_per_day=25,  # Instagram has strict limits
+    )
+
     @property
     def config(self) -> PlatformConfig:
-        return PlatformConfig(
-            max_duration=90,  # Instagram Reels max 90 seconds
-            min_duration=1,
-            aspect_ratio="9:16",  # Vertical
-            max_file_size=100 * 1024 * 1024,  # 100 MB recommended
-            supported_formats=["mp4", "mov"],
-            max_title_length=0,  # Reels don't have titles
-            max_description_length=2200,  # Caption limit
-            max_tags=30,
-            max_hashtags=30,
-            requires_auth=True,
-            rate_limit_per_day=25,  # Instagram has strict limits
-        )
+        return self._CONFIG
 
     def authenticate(self) -> bool:
         """
@@ -61,44 +79,126 @@ class InstagramReelsplatform(Platform):
         Requires config file with:
         {
             "access_token": "YOUR_INSTAGRAM_ACCESS_TOKEN",
-            "instagram_account_id": "YOUR_INSTAGRAM_BUSINESS_ACCOUNT_ID"
+            "instagram_account_id": "YOUR_INSTAGRAM_BUSINESS_ACCOUNT_ID",
+            "expires_at": 1735689600,  (optional, Unix time the token expires)
+            "app_id": "YOUR_FACEBOOK_APP_ID",  (optional, to refresh Facebook tokens)
+            "app_secret": "YOUR_FACEBOOK_APP_SECRET"
         }
 
+        With expires_at, a token that is not close to expiry is trusted without
+        a validation call, and one expiring within TOKEN_REFRESH_MARGIN is
+        refreshed and written back to the config file. Without it, the token is
+        checked with debug_token and the expiry it reports is saved.
+
         Get these from: https://developers.facebook.com/apps/
         """
         try:
-            if not os.path.exists(self.config_file):
-                print(f"[Instagram] Error: {self.config_file} not found")
-                print("[Instagram] Create config file with access_token and instagram_account_id")
-                print("[Instagram] See: https://developers.facebook.com/docs/instagram-api/getting-started")
+            config = self._load_config(
+                ["access_token", "instagram_account_id"],
+                help_url="https://developers.facebook.com/docs/instagram-api/getting-started",
+            )
+            if config is None:
                 return False
 
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-
-            self.access_token = config.get("access_token")
-            self.instagram_account_id = config.get("instagram_account_id")
+            self.access_token = config["access_token"]
+            self.instagram_account_id = config["instagram_account_id"]
+
+            expires_at = config.get("expires_at")
+            if expires_at:
+                now = time.time()
+                if now >= expires_at:
+                    log.error("[Instagram] Error: access_token expired; generate a new long-lived token")
+                    return False
+                if now >= expires_at - TOKEN_REFRESH_MARGIN:
+                    self._refresh_token(config)
+                self._authenticated = True
+                return True
+
+            # Verify token is valid (at most once per TOKEN_VALIDATION_TTL)
+            if token_recently_validated(self.name, self.access_token):
+                self._authenticated = True
+                return True
+
+            # debug_token returns just validity and expiry (unlike /me)
+            url = f"{self.BASE_URL}/debug_token"
+            params = {"input_token": self.access_token, "access_token": self.access_token}
+            response = self.session.get(url, params=params)
 
-            if not self.access_token or not self.instagram_account_id:
-                print("[Instagram] Error: access_token and instagram_account_id required in config")
+            if response.status_code != 200:
+                log.error(f"[Instagram] Token validation failed: {response.text}")
                 return False
 
-            # Verify token is valid
-            url = f"{self.BASE_URL}/me"
-            params = {"access_token": self.access_token}
-            response = requests.get(url, params=params)
-
-            if response.status_code != 200:
-                print(f"[Instagram] Token validation failed: {response.text}")
+            token_info = response_json(response).get("data", {})
+            if not token_info.get("is_valid"):
+                log.error("[Instagram] Token validation failed: access_token is not valid")
                 return False
 
+            # Save the expiry so later runs check it locally (and refresh in time)
+            if token_info.get("expires_at"):
+                config["expires_at"] = token_info["expires_at"]
+                save_json_config(self.config_file, config)
+
+            mark_token_validated(self.name, self.access_token)
             self._authenticated = True
             return True
 
         except Exception as e:
-            print(f"[Instagram] Authentication failed: {e}")
+            log.error(f"[Instagram] Authentication failed: {e}")
             return False
 
+    def _refresh_token(self, config: dict) -> None:
+        """
+        Exchange the (still valid) long-lived token for a new one and save it.
+
+        Instagram-login tokens use ig_refresh_token; Facebook-login tokens use
+        fb_exchange_token, which needs the app's app_id and app_secret in the
+        config. A failed refresh (error response, connection error, unexpected
+        body) is only logged; the current token keeps working until it expires.
+
+        Args:
+            config: Loaded config dict; updated in place and written back
+        """
+        if self.access_token.startswith("IG"):
+            url = self.IG_REFRESH_URL
+            params = {"grant_type": "ig_refresh_token", "access_token": self.access_token}
+        else:
+            if not config.get("app_id") or not config.get("app_secret"):
+                log.error(
+                    "[Instagram] Error: Cannot refresh Facebook access token without "
+                    "app_id and app_secret in the config; it expires soon"
+                )
+                return
+            url = f"{self.BASE_URL}/oauth/access_token"
+            params = {
+                "grant_type": "fb_exchange_token",
+                "client_id": config["app_id"],
+                "client_secret": config["app_secret"],
+                "fb_exchange_token": self.access_token,
+            }
+
+        try:
+            response = self.session.get(url, params=params)
+            if response.status_code != 200:
+                log.warning(f"[Instagram] Warning: Token refresh failed: {response.text}")
+                return
+
+            data = response_json(response)
+            new_token = data["access_token"]
+            expires_at = int(time.time()) + int(data.get("expires_in", 60 * 86400))
+        except Exception as e:
+            log.warning(f"[Instagram] Warning: Token refresh failed: {e}")
+            return
+
+        self.access_token = new_token
+        config["access_token"] = new_token
+        config["expires_at"] = expires_at
+        try:
+            save_json_config(self.config_file, config)
+        except OSError as e:
+            log.warning(f"[Instagram] Warning: Could not save refreshed token: {e}")
+            return
+        log.info("[Instagram] Refreshed access token")
+
     def upload(
         self,
         video_path: str,
@@ -147,23 +247,19 @@ class InstagramReelsplatform(Platform):
             )
 
         # Format caption with hashtags
-        caption = description
-        if tags:
-            hashtags = self.format_hashtags(tags[:self.config.max_hashtags])
-            caption = f"{description}\n\n{hashtags}"
-
-        caption = caption[:self.config.max_description_length]
+        caption = self.build_caption(description, tags, self.config.max_description_length)
 
         try:
             # Instagram API requires video to be publicly accessible via URL
             # For now, we'll return instructions for manual upload
-            # In production, you'd upload to a hosting service first
+            # In production, you'd upload to a hosting service first and run
+            # the Graph API flow in docs/platform_api_flows.md
 
-            print("[Instagram] Note: Instagram API requires video URL (not local file)")
-            print("[Instagram] Implementation requires:")
-            print("  1. Upload video to public URL (AWS S3, Cloudinary, etc.)")
-            print("  2. Use that URL with Instagram Graph API")
-            print(f"  3. Caption ready: {caption[:50]}...")
+            log.info("[Instagram] Note: Instagram API requires video URL (not local file)")
+            log.info("[Instagram] Implementation requires:")
+            log.info("  1. Upload video to public URL (AWS S3, Cloudinary, etc.)")
+            log.info("  2. Use that URL with Instagram Graph API")
+            log.info(f"  3. Caption ready: {caption[:50]}...")
 
             return UploadResult(
                 success=False,
@@ -171,76 +267,6 @@ class InstagramReelsplatform(Platform):
                 error="Instagram requires video URL. Upload video to public hosting first, then use Instagram Graph API directly."
             )
 
-            # NOTE: Below is the correct API flow once you have a public video URL:
-            #
-            # Step 1: Create media container
-            # create_url = f"{self.BASE_URL}/{self.instagram_account_id}/media"
-            # create_params = {
-            #     "access_token": self.access_token,
-            #     "video_url": video_url,  # Your publicly accessible video URL
-            #     "media_type": "REELS",
-            #     "caption": caption,
-            #     "share_to_feed": share_to_feed,
-            # }
-            # if cover_url:
-            #     create_params["cover_url"] = cover_url
-            #
-            # create_response = requests.post(create_url, params=create_params)
-            # if create_response.status_code != 200:
-            #     return UploadResult(
-            #         success=False,
-            #         platform=self.display_name,
-            #         error=f"Container creation failed: {create_response.text}"
-            #     )
-            #
-            # container_id = create_response.json().get("id")
-            #
-            # # Step 2: Wait for processing (poll status)
-            # for _ in range(60):  # Max 5 minutes
-            #     status_url = f"{self.BASE_URL}/{container_id}"
-            #     status_params = {
-            #         "access_token": self.access_token,
-            #         "fields": "status_code"
-            #     }
-            #     status_response = requests.get(status_url, params=status_params)
-            #     status_code = status_response.json().get("status_code")
-            #
-            #     if status_code == "FINISHED":
-            #         break
-            #     elif status_code == "ERROR":
-            #         return UploadResult(
-            #             success=False,
-            #             platform=self.display_name,
-            #             error="Video processing failed"
-            #         )
-            #     time.sleep(5)
-            #
-            # # Step 3: Publish container
-            # publish_url = f"{self.BASE_URL}/{self.instagram_account_id}/media_publish"
-            # publish_params = {
-            #     "access_token": self.access_token,
-            #     "creation_id": container_id,
-            # }
-            # publish_response = requests.post(publish_url, params=publish_params)
-            #
-            # if publish_response.status_code != 200:
-            #     return UploadResult(
-            #         success=False,
-            #         platform=self.display_name,
-            #         error=f"Publish failed: {publish_response.text}"
-            #     )
-            #
-            # media_id = publish_response.json().get("id")
-            # url = f"https://www.instagram.com/reel/{media_id}"
-            #
-            # return UploadResult(
-            #     success=True,
-            #     platform=self.display_name,
-            #     video_id=media_id,
-            #     url=url,
-            #     metadata={"share_to_feed": share_to_feed}
-            # )
-
         except Exception as e:
             return UploadResult(
                 success=False,
@@ -1,8 +1,9 @@
 """LinkedIn platform implementation."""
-import os
-import json
 from typing import Optional
 from .base import Platform, PlatformConfig, UploadResult
+from ..log import get_logger
+
+log = get_logger(__name__)
 
 
 class LinkedInPlatform(Platform):
@@ -20,32 +21,31 @@ class LinkedInPlatform(Platform):
     def display_name(self) -> str:
         return "LinkedIn"
 
+    # Built once per class; config is read for every validation and upload
+    _CONFIG = PlatformConfig(
+        max_duration=600,  # 10 minutes
+        min_duration=3,
+        aspect_ratio="16:9",
+        max_file_size=200 * 1024 * 1024,
+        supported_formats=["mp4", "mov"],
+        max_title_length=200,
+        max_description_length=3000,
+        max_tags=30,
+        max_hashtags=30,
+        requires_auth=True,
+    )
+
     @property
     def config(self) -> PlatformConfig:
-        return PlatformConfig(
-            max_duration=600,  # 10 minutes
-            min_duration=3,
-            aspect_ratio="16:9",
-            max_file_size=200 * 1024 * 1024,
-            supported_formats=["mp4", "mov"],
-            max_title_length=200,
-            max_description_length=3000,
-            max_tags=30,
-            max_hashtags=30,
-            requires_auth=True,
-        )
+        return self._CONFIG
 
     def authenticate(self) -> bool:
         """Authenticate with LinkedIn API."""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    if config.get("access_token"):
-                        self._authenticated = True
-                        return True
-            print("[LinkedIn] Config file needed. See: https://docs.microsoft.com/en-us/linkedin/")
-            return False
+            if self._load_config(["access_token"], help_url="https://docs.microsoft.com/en-us/linkedin/") is None:
+                return False
+            self._authenticated = True
+            return True
         except:
             return False
 
@@ -58,7 +58,7 @@ class LinkedInPlatform(Platform):
         if not valid:
             return UploadResult(success=False, platform=self.display_name, error=error)
 
-        print(f"[LinkedIn] Ready to upload: {title[:50]}...")
+        log.info(f"[LinkedIn] Ready to upload: {title[:50]}...")
         return UploadResult(
             success=False,
             platform=self.display_name,
@@ -0,0 +1,149 @@
+"""
+Client-side rate limiting for platform uploads.
+
+Each platform's PlatformConfig declares how many uploads it allows per hour
+or day; a token bucket per platform keeps uploads under that budget instead
+of running into 429 responses. Bucket levels are saved to the cache directory
+after every upload, so the budget carries over between runs (schedule-run is
+started by cron, a fresh process each time).
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from ..brand_cache import cache_root
+from ..log import get_logger
+from .base import PlatformConfig, load_json_config, save_json_config
+
+log = get_logger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: up to capacity tokens, refilled continuously."""
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_sec: float,
+        tokens: Optional[float] = None,
+        on_acquire: Optional[Callable[[float], None]] = None,
+    ):
+        """
+        Args:
+            capacity: Maximum burst size (tokens available when full)
+            refill_per_sec: Tokens added per second
+            tokens: Tokens available now (None = full)
+            on_acquire: Called with the remaining tokens after each acquire
+        """
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity if tokens is None else max(0.0, min(capacity, tokens))
+        self._on_acquire = on_acquire
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_sec)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, waiting for the bucket to refill if needed.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait (None = wait as long as needed)
+
+        Returns:
+            True if the tokens were taken, False if that would take longer than timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    remaining = self._tokens
+                    break
+                wait = (tokens - self._tokens) / self.refill_per_sec
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+        if self._on_acquire is not None:
+            self._on_acquire(remaining)
+        return True
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+_state_lock = threading.Lock()
+
+
+def _state_file() -> str:
+    """Saved bucket levels ($XDG_CACHE_HOME/clipsmachine/rate_limits.json)."""
+    return os.path.join(cache_root(), "rate_limits.json")
+
+
+def _saved_tokens(name: str, capacity: float, refill_per_sec: float) -> Optional[float]:
+    """Tokens a platform's bucket holds now, going by its last saved level (None if unknown)."""
+    try:
+        saved = (load_json_config(_state_file()) or {}).get(name)
+    except ValueError:
+        return None
+    if not saved:
+        return None
+    elapsed = max(0.0, time.time() - saved["updated"])
+    return min(capacity, saved["tokens"] + elapsed * refill_per_sec)
+
+
+def _save_tokens(name: str, tokens: float) -> None:
+    """Record a platform's bucket level so the next run starts from it."""
+    path = _state_file()
+    with _state_lock:
+        try:
+            state = load_json_config(path) or {}
+            state[name] = {"tokens": tokens, "updated": time.time()}
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            save_json_config(path, state)
+        except (OSError, ValueError) as e:
+            log.warning(f"[RateLimit] Warning: Could not save rate limit state: {e}")
+
+
+def get_rate_limiter(name: str, config: PlatformConfig) -> Optional[TokenBucket]:
+    """
+    Shared token bucket for a platform's upload limit.
+
+    The bucket starts from the level saved by earlier runs (plus what has
+    refilled since), not full, so a daily limit holds across processes.
+
+    Args:
+        name: Platform name (one bucket per name for the whole process)
+        config: Platform config with rate_limit_per_hour / rate_limit_per_day
+
+    Returns:
+        TokenBucket, or None if the platform declares no limit
+    """
+    if config.rate_limit_per_hour:
+        capacity, period = config.rate_limit_per_hour, 3600
+    elif config.rate_limit_per_day:
+        capacity, period = config.rate_limit_per_day, 86400
+    else:
+        return None
+
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            refill_per_sec = capacity / period
+            bucket = _buckets[name] = TokenBucket(
+                capacity,
+                refill_per_sec,
+                tokens=_saved_tokens(name, capacity, refill_per_sec),
+                on_acquire=lambda remaining: _save_tokens(name, remaining),
+            )
+        return bucket
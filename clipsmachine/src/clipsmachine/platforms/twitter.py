@@ -2,11 +2,11 @@
 Twitter/X platform implementation for video posts.
 """
 
-import os
-import json
-import requests
 from typing import Optional
 from .base import Platform, PlatformConfig, UploadResult
+from ..log import get_logger
+
+log = get_logger(__name__)
 
 
 class TwitterPlatform(Platform):
@@ -25,42 +25,38 @@ class TwitterPlatform(Platform):
     def display_name(self) -> str:
         return "Twitter/X"
 
+    # Built once per class; config is read for every validation and upload
+    _CONFIG = PlatformConfig(
+        max_duration=140,  # 2 minutes 20 seconds
+        min_duration=0.5,
+        aspect_ratio="16:9",  # Landscape preferred
+        max_file_size=512 * 1024 * 1024,  # 512 MB
+        supported_formats=["mp4", "mov"],
+        max_title_length=280,  # Tweet character limit
+        max_description_length=280,
+        max_tags=10,
+        max_hashtags=10,
+        requires_auth=True,
+        rate_limit_per_day=300,
+    )
+
     @property
     def config(self) -> PlatformConfig:
-        return PlatformConfig(
-            max_duration=140,  # 2 minutes 20 seconds
-            min_duration=0.5,
-            aspect_ratio="16:9",  # Landscape preferred
-            max_file_size=512 * 1024 * 1024,  # 512 MB
-            supported_formats=["mp4", "mov"],
-            max_title_length=280,  # Tweet character limit
-            max_description_length=280,
-            max_tags=10,
-            max_hashtags=10,
-            requires_auth=True,
-            rate_limit_per_day=300,
-        )
+        return self._CONFIG
 
     def authenticate(self) -> bool:
         """Authenticate with Twitter API v2."""
         try:
-            if not os.path.exists(self.config_file):
-                print(f"[Twitter] Error: {self.config_file} not found")
-                print("[Twitter] See: https://developer.twitter.com/en/docs/twitter-api")
+            config = self._load_config(["bearer_token"], help_url="https://developer.twitter.com/en/docs/twitter-api")
+            if config is None:
                 return False
 
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-
-            self.bearer_token = config.get("bearer_token")
-            if not self.bearer_token:
-                print("[Twitter] Error: bearer_token required")
-                return False
+            self.bearer_token = config["bearer_token"]
 
             self._authenticated = True
             return True
         except Exception as e:
-            print(f"[Twitter] Auth failed: {e}")
+            log.error(f"[Twitter] Auth failed: {e}")
             return False
 
     def upload(self, video_path: str, title: str, description: str, tags: Optional[list[str]] = None, **kwargs) -> UploadResult:
@@ -73,11 +69,9 @@ class TwitterPlatform(Platform):
             return UploadResult(success=False, platform=self.display_name, error=error)
 
         tweet_text = f"{title}\n\n{description}" if description else title
-        if tags:
-            tweet_text = f"{tweet_text}\n\n{self.format_hashtags(tags)}"
-        tweet_text = tweet_text[:280]
+        tweet_text = self.build_caption(tweet_text, tags, 280)
 
-        print(f"[Twitter] Ready to upload. Tweet: {tweet_text[:50]}...")
+        log.info(f"[Twitter] Ready to upload. Tweet: {tweet_text[:50]}...")
         return UploadResult(
             success=False,
             platform=self.display_name,
@@ -4,7 +4,8 @@ Uploads videos as YouTube Shorts (<60s vertical videos).
 """
 
 import os
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -13,6 +14,28 @@ from googleapiclient.http import MediaFileUpload
 from googleapiclient.errors import HttpError
 
 from .base import Platform, PlatformConfig, UploadResult
+from ..log import get_logger
+
+log = get_logger(__name__)
+
+# Clips up to this size go up in one request; resumable uploads cost an extra
+# round-trip to open the session plus one per chunk
+SINGLE_SHOT_MAX_BYTES = 64 * 1024 * 1024
+
+# Chunk size for larger (resumable) uploads; must be a multiple of 256 KB
+RESUMABLE_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Retries per request (or per resumable chunk) on 5xx, 429 and connection
+# errors, with googleapiclient's randomized exponential backoff. A resumable
+# upload retries only the failed chunk
+UPLOAD_NUM_RETRIES = 5
+
+# Authenticated clients per token file, shared by every platform instance in
+# the process (the scheduler creates new instances per post) so their
+# keep-alive connection is reused. The client's httplib2 transport isn't
+# thread-safe, so each comes with a lock held while it is used
+_clients: Dict[str, Tuple[Any, threading.Lock]] = {}
+_clients_lock = threading.Lock()
 
 
 class YouTubeShortsplatform(Platform):
@@ -31,6 +54,7 @@ class YouTubeShortsplatform(Platform):
         self.client_secret_file = config_path or "client_secret.json"
         self.token_file = "youtube_token.json"
         self.youtube_client = None
+        self._client_lock = None
 
     @property
     def name(self) -> str:
@@ -40,25 +64,36 @@ class YouTubeShortsplatform(Platform):
     def display_name(self) -> str:
         return "YouTube Shorts"
 
+    # Built once per class; config is read for every validation and upload
+    _CONFIG = PlatformConfig(
+        max_duration=60,  # Shorts are <60 seconds
+        min_duration=1,
+        aspect_ratio="9:16",  # Vertical
+        max_file_size=256 * 1024 * 1024,  # 256 MB
+        supported_formats=["mp4", "mov", "avi", "wmv", "flv", "3gp", "webm"],
+        max_title_length=100,
+        max_description_length=5000,
+        max_tags=500,  # Total character limit
+        max_hashtags=15,
+        requires_auth=True,
+        rate_limit_per_day=50,  # Conservative estimate
+    )
+
     @property
     def config(self) -> PlatformConfig:
-        return PlatformConfig(
-            max_duration=60,  # Shorts are <60 seconds
-            min_duration=1,
-            aspect_ratio="9:16",  # Vertical
-            max_file_size=256 * 1024 * 1024,  # 256 MB
-            supported_formats=["mp4", "mov", "avi", "wmv", "flv", "3gp", "webm"],
-            max_title_length=100,
-            max_description_length=5000,
-            max_tags=500,  # Total character limit
-            max_hashtags=15,
-            requires_auth=True,
-            rate_limit_per_day=50,  # Conservative estimate
-        )
+        return self._CONFIG
 
     def authenticate(self) -> bool:
         """Authenticate with YouTube API using OAuth 2.0."""
         try:
+            client_key = os.path.abspath(self.token_file)
+            with _clients_lock:
+                shared = _clients.get(client_key)
+            if shared is not None:
+                self.youtube_client, self._client_lock = shared
+                self._authenticated = True
+                return True
+
             creds = None
 
             # Load existing token
@@ -73,8 +108,8 @@ class YouTubeShortsplatform(Platform):
                     creds.refresh(Request())
                 else:
                     if not os.path.exists(self.client_secret_file):
-                        print(f"[YouTube] Error: {self.client_secret_file} not found")
-                        print("[YouTube] Download OAuth client secrets from Google Cloud Console")
+                        log.error(f"[YouTube] Error: {self.client_secret_file} not found")
+                        log.info("[YouTube] Download OAuth client secrets from Google Cloud Console")
                         return False
 
                     flow = InstalledAppFlow.from_client_secrets_file(
@@ -87,13 +122,21 @@ class YouTubeShortsplatform(Platform):
                     token.write(creds.to_json())
                 os.chmod(self.token_file, 0o600)
 
-            # Build YouTube client
-            self.youtube_client = build("youtube", "v3", credentials=creds)
+            # Build YouTube client (refreshes its token itself from here on)
+            with _clients_lock:
+                if client_key not in _clients:
+                    # Discovery doc bundled with google-api-python-client, not fetched
+                    client = build(
+                        "youtube", "v3", credentials=creds,
+                        static_discovery=True, cache_discovery=False,
+                    )
+                    _clients[client_key] = (client, threading.Lock())
+                self.youtube_client, self._client_lock = _clients[client_key]
             self._authenticated = True
             return True
 
         except Exception as e:
-            print(f"[YouTube] Authentication failed: {e}")
+            log.error(f"[YouTube] Authentication failed: {e}")
             return False
 
     def upload(
@@ -161,6 +204,11 @@ class YouTubeShortsplatform(Platform):
                 error=error
             )
 
+        # Stay under the daily upload quota instead of hitting 403/429s
+        limited = self.acquire_upload_slot()
+        if limited:
+            return limited
+
         # Prepare upload
         try:
             body = {
@@ -179,29 +227,35 @@ class YouTubeShortsplatform(Platform):
                 # Tags are separate from hashtags in description
                 body["snippet"]["tags"] = tags[:30]  # Max 30 tags
 
-            media = MediaFileUpload(
-                video_path,
-                chunksize=-1,
-                resumable=True,
-                mimetype="video/*"
-            )
-
-            request = self.youtube_client.videos().insert(
-                part="snippet,status",
-                body=body,
-                media_body=media,
-            )
+            single_shot = os.path.getsize(video_path) <= SINGLE_SHOT_MAX_BYTES
+            if single_shot:
+                media = MediaFileUpload(video_path, resumable=False, mimetype="video/*")
+            else:
+                media = MediaFileUpload(
+                    video_path,
+                    chunksize=RESUMABLE_CHUNK_SIZE,
+                    resumable=True,
+                    mimetype="video/*"
+                )
 
-            # Execute upload with progress
-            response = None
-            print(f"[YouTube] Uploading {os.path.basename(video_path)}...")
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    print(f"[YouTube] Upload progress: {progress}%", end='\r')
+            log.info(f"[YouTube] Uploading {os.path.basename(video_path)}...")
+            with self._client_lock:
+                request = self.youtube_client.videos().insert(
+                    part="snippet,status",
+                    body=body,
+                    media_body=media,
+                )
 
-            print()  # New line after progress
+                if single_shot:
+                    response = request.execute(num_retries=UPLOAD_NUM_RETRIES)
+                else:
+                    # Execute resumable upload with progress
+                    response = None
+                    while response is None:
+                        status, response = request.next_chunk(num_retries=UPLOAD_NUM_RETRIES)
+                        if status:
+                            progress = int(status.progress() * 100)
+                            log.debug("[YouTube] Upload progress: %d%%", progress)
 
             video_id = response.get("id")
             url = f"https://www.youtube.com/shorts/{video_id}"
@@ -0,0 +1,118 @@
+"""
+Retry helpers for ClipsMachine.
+Exponential backoff (with an optional cap and jitter) shared by downloads,
+LLM calls and cloud uploads.
+"""
+
+import random
+import time
+from functools import wraps
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+from .log import get_logger
+
+log = get_logger(__name__)
+
+# Type variable for retry decorator
+T = TypeVar('T')
+
+
+def call_with_retry(
+    func: Callable[..., T],
+    *args,
+    max_attempts: int = 3,
+    delay: float = 2.0,
+    backoff: float = 2.0,
+    max_delay: Optional[float] = None,
+    jitter: float = 0.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    label: str = "retry",
+    **kwargs,
+) -> T:
+    """
+    Call a function, retrying on failure with exponential backoff.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for func
+        max_attempts: Maximum number of attempts
+        delay: Initial delay between retries in seconds
+        backoff: Multiplier for delay after each retry
+        max_delay: Upper bound for a single delay (None = unbounded)
+        jitter: Up to this many random seconds added to each delay, so
+            concurrent callers don't retry in lockstep
+        retry_on: Exception types that trigger a retry; others propagate
+        label: Log prefix
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Return value of func
+    """
+    current_delay = delay
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except retry_on as e:
+            if attempt == max_attempts:
+                # Last attempt failed, raise the exception
+                raise
+
+            wait = current_delay if max_delay is None else min(current_delay, max_delay)
+            if jitter:
+                wait += random.uniform(0, jitter)
+
+            name = getattr(func, "__name__", "call")
+            log.warning(f"[{label}] {name} failed (attempt {attempt}/{max_attempts}): {e}")
+            log.info(f"[{label}] Retrying in {wait:.1f}s...")
+            time.sleep(wait)
+            current_delay *= backoff
+
+    raise RuntimeError("max_attempts must be at least 1")
+
+
+def retry_on_failure(
+    max_attempts: int = 3,
+    delay: float = 2.0,
+    backoff: float = 2.0,
+    max_delay: Optional[float] = None,
+    jitter: float = 0.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    label: str = "retry",
+):
+    """
+    Decorator to retry a function on failure with exponential backoff.
+
+    Args:
+        max_attempts: Maximum number of attempts
+        delay: Initial delay between retries in seconds
+        backoff: Multiplier for delay after each retry
+        max_delay: Upper bound for a single delay (None = unbounded)
+        jitter: Up to this many random seconds added to each delay
+        retry_on: Exception types that trigger a retry; others propagate
+        label: Log prefix
+
+    Example:
+        @retry_on_failure(max_attempts=3, delay=1.0, backoff=2.0)
+        def download_file(url):
+            # Will retry up to 3 times with delays: 1s, 2s, 4s
+            ...
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            return call_with_retry(
+                func,
+                *args,
+                max_attempts=max_attempts,
+                delay=delay,
+                backoff=backoff,
+                max_delay=max_delay,
+                jitter=jitter,
+                retry_on=retry_on,
+                label=label,
+                **kwargs,
+            )
+
+        return wrapper
+    return decorator
@@ -6,10 +6,16 @@ Queue posts and automatically publish at optimal times.
 import os
 import sqlite3
 import json
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .manifest_io import read_manifest
+
+if TYPE_CHECKING:
+    from .multi_uploader import MultiPlatformUploader
 
 
 @dataclass
@@ -41,14 +47,21 @@ class PostScheduler:
             db_path: Path to SQLite database
         """
         self.db_path = db_path
+        self._lock = threading.Lock()
         self._init_database()
 
     def _init_database(self):
-        """Create database tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        """Open the scheduler's connection and create tables if they don't exist."""
+        # One connection for the scheduler's lifetime, shared by the upload
+        # workers (serialized by self._lock). Autocommit plus WAL with
+        # synchronous=NORMAL makes each small write one cheap transaction
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+
+        self._execute("""
             CREATE TABLE IF NOT EXISTS scheduled_posts (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 video_id TEXT NOT NULL,
@@ -67,21 +80,61 @@ class PostScheduler:
         """)
 
         # Index for efficient queries
-        cursor.execute("""
+        self._execute("""
             CREATE INDEX IF NOT EXISTS idx_scheduled_time
             ON scheduled_posts(scheduled_time, status)
         """)
 
-        cursor.execute("""
+        self._execute("""
             CREATE INDEX IF NOT EXISTS idx_video_clip
             ON scheduled_posts(video_id, clip_index)
         """)
 
-        conn.commit()
-        conn.close()
-
         print(f"[Scheduler] Database initialized: {self.db_path}")
 
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Run one write statement on the shared connection (committed immediately)."""
+        with self._lock:
+            return self._conn.execute(sql, params)
+
+    def _query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Run one query on the shared connection and fetch all rows."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _insert_posts(self, rows: List[tuple]) -> List[int]:
+        """
+        Insert posts in a single transaction (one commit for the whole batch).
+
+        Args:
+            rows: (video_id, clip_index, platforms, scheduled_time, video_url,
+                thumbnail_url, title, description) tuples
+
+        Returns:
+            Post IDs, in row order
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany("""
+                    INSERT INTO scheduled_posts
+                    (video_id, clip_index, platforms, scheduled_time, video_url, thumbnail_url, title, description)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                last_id = self._conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        # The transaction holds the write lock, so AUTOINCREMENT ids are consecutive
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
     def schedule_post(
         self,
         video_id: str,
@@ -109,21 +162,12 @@ class PostScheduler:
         Returns:
             Post ID
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         platforms_str = ','.join(platforms)
         scheduled_time_str = scheduled_time.isoformat()
 
-        cursor.execute("""
-            INSERT INTO scheduled_posts
-            (video_id, clip_index, platforms, scheduled_time, video_url, thumbnail_url, title, description)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (video_id, clip_index, platforms_str, scheduled_time_str, video_url, thumbnail_url, title, description))
-
-        post_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        post_id, = self._insert_posts([
+            (video_id, clip_index, platforms_str, scheduled_time_str, video_url, thumbnail_url, title, description)
+        ])
 
         print(f"[Scheduler] Scheduled post #{post_id}: clip {clip_index} to {platforms_str} at {scheduled_time_str}")
         return post_id
@@ -139,6 +183,10 @@ class PostScheduler:
         """
         Schedule all clips from a video with staggered timing.
 
+        A clip is only scheduled for the platforms it has no pending or posted
+        entry for, so re-running a batch (or adding platforms) doesn't
+        double-post anything.
+
         Args:
             video_id: Video ID
             start_time: When to start posting
@@ -154,8 +202,7 @@ class PostScheduler:
         if not os.path.exists(manifest_path):
             raise FileNotFoundError(f"Manifest not found: {manifest_path}")
 
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manifest = read_manifest(manifest_path)
 
         if platforms is None:
             from .platforms import get_all_platforms
@@ -163,26 +210,41 @@ class PostScheduler:
 
         manifest.sort(key=lambda c: int(c.get("clip_index", 0)))
 
-        post_ids = []
+        # (clip, platform) pairs already pending or posted (one indexed query)
+        # aren't scheduled again; failed ones are, so a re-run retries them
+        existing = {
+            (row[0], name)
+            for row in self._query("""
+                SELECT clip_index, platforms FROM scheduled_posts
+                WHERE video_id = ? AND status != 'failed'
+            """, (video_id,))
+            for name in row[1].split(',')
+        }
+
+        rows = []
+        skipped = []
         current_time = start_time
 
         for clip in manifest:
             clip_index = int(clip.get("clip_index", 0))
+            missing = [name for name in platforms if (clip_index, name) not in existing]
+            if len(missing) < len(platforms):
+                skipped.append(f"{clip_index} ({', '.join(n for n in platforms if n not in missing)})")
+            if not missing:
+                continue
             title = clip.get("title", f"Clip #{clip_index}")
             description = clip.get("description", "")
 
-            post_id = self.schedule_post(
-                video_id=video_id,
-                clip_index=clip_index,
-                platforms=platforms,
-                scheduled_time=current_time,
-                title=title,
-                description=description,
-            )
-
-            post_ids.append(post_id)
+            rows.append((video_id, clip_index, ','.join(missing), current_time.isoformat(), None, None, title, description))
             current_time += timedelta(hours=interval_hours)
 
+        # All clips go in with one transaction instead of a commit per post
+        post_ids = self._insert_posts(rows) if rows else []
+        for post_id, row in zip(post_ids, rows):
+            print(f"[Scheduler] Scheduled post #{post_id}: clip {row[1]} to {row[2]} at {row[3]}")
+
+        if skipped:
+            print(f"[Scheduler] Already scheduled or posted, skipped: clip {'; clip '.join(skipped)}")
         print(f"[Scheduler] Scheduled {len(post_ids)} posts from {start_time} to {current_time}")
         return post_ids
 
@@ -199,20 +261,13 @@ class PostScheduler:
         if before is None:
             before = datetime.now()
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        rows = self._query("""
             SELECT * FROM scheduled_posts
             WHERE status = 'pending'
             AND scheduled_time <= ?
             ORDER BY scheduled_time ASC
         """, (before.isoformat(),))
 
-        rows = cursor.fetchall()
-        conn.close()
-
         posts = []
         for row in rows:
             post = ScheduledPost(
@@ -242,12 +297,9 @@ class PostScheduler:
             post_id: Post ID
             result: Upload result object (will be JSON serialized)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         result_json = json.dumps(result) if result else None
 
-        cursor.execute("""
+        self._execute("""
             UPDATE scheduled_posts
             SET status = 'posted',
                 result = ?,
@@ -255,9 +307,6 @@ class PostScheduler:
             WHERE id = ?
         """, (result_json, post_id))
 
-        conn.commit()
-        conn.close()
-
         print(f"[Scheduler] Marked post #{post_id} as posted")
 
     def mark_failed(self, post_id: int, error: str) -> None:
@@ -268,12 +317,9 @@ class PostScheduler:
             post_id: Post ID
             error: Error message
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         result_json = json.dumps({"error": error})
 
-        cursor.execute("""
+        self._execute("""
             UPDATE scheduled_posts
             SET status = 'failed',
                 result = ?,
@@ -281,17 +327,11 @@ class PostScheduler:
             WHERE id = ?
         """, (result_json, post_id))
 
-        conn.commit()
-        conn.close()
-
         print(f"[Scheduler] Marked post #{post_id} as failed: {error}")
 
     def get_stats(self) -> Dict[str, int]:
         """Get posting statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        rows = self._query("""
             SELECT
                 status,
                 COUNT(*) as count
@@ -299,27 +339,17 @@ class PostScheduler:
             GROUP BY status
         """)
 
-        stats = {row[0]: row[1] for row in cursor.fetchall()}
-        conn.close()
-
-        return stats
+        return {row[0]: row[1] for row in rows}
 
     def list_upcoming(self, limit: int = 10) -> List[ScheduledPost]:
         """List upcoming scheduled posts."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        rows = self._query("""
             SELECT * FROM scheduled_posts
             WHERE status = 'pending'
             ORDER BY scheduled_time ASC
             LIMIT ?
         """, (limit,))
 
-        rows = cursor.fetchall()
-        conn.close()
-
         posts = []
         for row in rows:
             post = ScheduledPost(
@@ -343,50 +373,149 @@ class PostScheduler:
 
     def cancel_post(self, post_id: int) -> bool:
         """Cancel a scheduled post."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        cursor = self._execute("""
             DELETE FROM scheduled_posts
             WHERE id = ? AND status = 'pending'
         """, (post_id,))
 
         deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
 
         if deleted:
             print(f"[Scheduler] Cancelled post #{post_id}")
         return deleted
 
 
+# Due posts uploaded at once by process_pending_posts; per-platform rate
+# limits are enforced by the platforms' token buckets
+POST_WORKERS = 4
+
+
+def _clips_by_index(clips_output_root: str, video_id: str) -> Dict[int, Dict[str, Any]]:
+    """
+    Load a video's manifest as a clip_index -> clip lookup.
+
+    Args:
+        clips_output_root: Root output directory
+        video_id: Video ID folder
+
+    Returns:
+        Dict of clip dicts keyed by int clip_index
+    """
+    manifest_path = os.path.join(clips_output_root, video_id, "manifest.json")
+    return {int(clip.get("clip_index", 0)): clip for clip in read_manifest(manifest_path)}
+
+
+def _process_post(
+    scheduler: PostScheduler,
+    uploader: "MultiPlatformUploader",
+    post: ScheduledPost,
+    clips: Dict[int, Dict[str, Any]],
+    clips_output_root: str,
+) -> str:
+    """
+    Upload one scheduled post to its platforms and record the outcome.
+
+    Platforms that were skipped for their rate limit stay pending for a
+    later run instead of failing the post: the whole post if none was
+    attempted, otherwise as a new post for just those platforms.
+
+    Args:
+        scheduler: PostScheduler instance
+        uploader: Uploader shared by the whole run (covers the post's platforms)
+        post: Due post
+        clips: The post's video manifest, keyed by clip_index (see _clips_by_index)
+        clips_output_root: Root output directory
+
+    Returns:
+        'posted' if at least one platform succeeded, 'deferred' if every
+        platform was rate-limited, else 'failed'
+    """
+    try:
+        # Get clip file path
+        clip = clips.get(post.clip_index)
+        if not clip:
+            raise ValueError(f"Clip {post.clip_index} not found in manifest")
+
+        file_name = clip.get("file_name")
+        file_path = os.path.join(clips_output_root, post.video_id, "clips", file_name)
+
+        # Upload to platforms
+        platforms = post.platforms.split(',')
+        results = uploader.upload_multi(
+            platforms=platforms,
+            video_path=post.video_url or file_path,  # Use cloud URL if available
+            title=post.title or clip.get("title", ""),
+            description=post.description or clip.get("description", ""),
+            parallel=True
+        )
+
+        # A run that is merely early mustn't lose the post to the rate limit
+        limited = [r for r in results if r.rate_limited]
+        if limited and len(limited) == len(results):
+            print(f"[Scheduler] ⏳ Post #{post.id} rate-limited; left pending for a later run")
+            return "deferred"
+        if limited:
+            names = {uploader.platforms[name].display_name: name for name in platforms if name in uploader.platforms}
+            scheduler.schedule_post(
+                post.video_id,
+                post.clip_index,
+                [names[r.platform] for r in limited],
+                datetime.now(),
+                video_url=post.video_url,
+                thumbnail_url=post.thumbnail_url,
+                title=post.title,
+                description=post.description,
+            )
+            results = [r for r in results if not r.rate_limited]
+
+        # Check if any succeeded
+        if any(r.success for r in results):
+            scheduler.mark_posted(post.id, [asdict(r) for r in results])
+            print(f"[Scheduler] ✅ Post #{post.id} completed successfully")
+            return "posted"
+
+        error_msg = "; ".join(r.error for r in results if r.error)
+        scheduler.mark_failed(post.id, error_msg)
+        print(f"[Scheduler] ❌ Post #{post.id} failed: {error_msg}")
+        return "failed"
+
+    except Exception as e:
+        scheduler.mark_failed(post.id, str(e))
+        print(f"[Scheduler] ❌ Post #{post.id} error: {e}")
+        return "failed"
+
+
 def process_pending_posts(
     scheduler: PostScheduler,
     clips_output_root: str = "clips_output",
-    dry_run: bool = False
+    dry_run: bool = False,
+    max_workers: int = POST_WORKERS,
 ) -> Dict[str, int]:
     """
     Process all pending posts that are due.
 
+    Posts are uploaded concurrently (each one's platforms in parallel too);
+    the per-platform token buckets keep bursts within each platform's rate
+    limit.
+
     Args:
         scheduler: PostScheduler instance
         clips_output_root: Root output directory
         dry_run: Don't actually post, just show what would be posted
+        max_workers: Posts uploaded at once
 
     Returns:
-        Dict with 'posted' and 'failed' counts
+        Dict with 'posted', 'failed' and 'deferred' (rate-limited, still pending) counts
     """
-    from .multi_uploader import MultiPlatformUploader
-
     pending = scheduler.get_pending_posts()
 
     if not pending:
         print("[Scheduler] No pending posts to process")
-        return {"posted": 0, "failed": 0}
+        return {"posted": 0, "failed": 0, "deferred": 0}
 
     print(f"\n[Scheduler] Processing {len(pending)} pending posts...")
 
-    stats = {"posted": 0, "failed": 0}
+    stats = {"posted": 0, "failed": 0, "deferred": 0}
 
     for post in pending:
         print(f"\n{'='*60}")
@@ -394,54 +523,46 @@ def process_pending_posts(
         print(f"[Scheduler] Scheduled for: {post.scheduled_time}")
         print(f"[Scheduler] Title: {post.title}")
         print(f"{'='*60}")
-
         if dry_run:
             print("[Scheduler] DRY RUN - Would post now")
-            continue
-
-        try:
-            # Get clip file path
-            manifest_path = os.path.join(clips_output_root, post.video_id, "manifest.json")
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-
-            clip = next((c for c in manifest if int(c.get("clip_index", 0)) == post.clip_index), None)
-            if not clip:
-                raise ValueError(f"Clip {post.clip_index} not found in manifest")
-
-            file_name = clip.get("file_name")
-            file_path = os.path.join(clips_output_root, post.video_id, "clips", file_name)
-
-            # Upload to platforms
-            platforms = post.platforms.split(',')
-            uploader = MultiPlatformUploader(platforms)
-
-            results = uploader.upload_multi(
-                platforms=platforms,
-                video_path=post.video_url or file_path,  # Use cloud URL if available
-                title=post.title or clip.get("title", ""),
-                description=post.description or clip.get("description", ""),
-                parallel=True
-            )
 
-            # Check if any succeeded
-            if any(r.success for r in results):
-                scheduler.mark_posted(post.id, [asdict(r) for r in results])
-                stats["posted"] += 1
-                print(f"[Scheduler] ✅ Post #{post.id} completed successfully")
-            else:
-                error_msg = "; ".join(r.error for r in results if r.error)
-                scheduler.mark_failed(post.id, error_msg)
-                stats["failed"] += 1
-                print(f"[Scheduler] ❌ Post #{post.id} failed: {error_msg}")
-
-        except Exception as e:
-            scheduler.mark_failed(post.id, str(e))
-            stats["failed"] += 1
-            print(f"[Scheduler] ❌ Post #{post.id} error: {e}")
-
-        # Small delay between posts
-        time.sleep(2)
-
-    print(f"\n[Scheduler] Completed: {stats['posted']} posted, {stats['failed']} failed")
+    if not dry_run:
+        # Load each video's manifest once, however many of its clips are due
+        clips_by_video: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        manifest_errors: Dict[str, str] = {}
+        for video_id in dict.fromkeys(post.video_id for post in pending):
+            try:
+                clips_by_video[video_id] = _clips_by_index(clips_output_root, video_id)
+            except Exception as e:
+                manifest_errors[video_id] = str(e)
+
+        # One uploader (platform instances, HTTP sessions, authentication) for
+        # the whole run rather than one per post
+        from .multi_uploader import MultiPlatformUploader
+        uploader = MultiPlatformUploader(
+            list(dict.fromkeys(name for post in pending for name in post.platforms.split(',')))
+        )
+        # Authenticate before the fan-out; the posts' threads then share the
+        # authenticated platforms instead of each starting its own auth
+        uploader.authenticate_all()
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            futures = []
+            for post in pending:
+                if post.video_id in manifest_errors:
+                    error = manifest_errors[post.video_id]
+                    scheduler.mark_failed(post.id, error)
+                    stats["failed"] += 1
+                    print(f"[Scheduler] ❌ Post #{post.id} error: {error}")
+                    continue
+                futures.append(executor.submit(
+                    _process_post, scheduler, uploader, post, clips_by_video[post.video_id], clips_output_root
+                ))
+            for future in as_completed(futures):
+                stats[future.result()] += 1
+
+    print(
+        f"\n[Scheduler] Completed: {stats['posted']} posted, {stats['failed']} failed, "
+        f"{stats['deferred']} deferred"
+    )
     return stats
@@ -9,6 +9,8 @@ from typing import Optional, Tuple
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
 
+from .manifest_io import read_manifest
+
 
 class ThumbnailGenerator:
     """Generate thumbnails from video clips with text overlays."""
@@ -340,14 +342,11 @@ class ThumbnailGenerator:
         Returns:
             Dict mapping clip_index to thumbnail path
         """
-        import json
-
         manifest_path = os.path.join(clips_output_root, video_id, "manifest.json")
         if not os.path.exists(manifest_path):
             raise FileNotFoundError(f"Manifest not found: {manifest_path}")
 
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manifest = read_manifest(manifest_path)
 
         thumbnails_dir = os.path.join(clips_output_root, video_id, "thumbnails")
         os.makedirs(thumbnails_dir, exist_ok=True)
@@ -1,6 +1,5 @@
 import os
 import time
-import json
 from typing import List, Dict, Any
 
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -10,6 +9,7 @@ from googleapiclient.discovery import build, Resource
 from googleapiclient.http import MediaFileUpload
 from googleapiclient.errors import HttpError
 
+from .manifest_io import read_manifest
 from .config import (
     OUTPUT_ROOT,
     DEFAULT_PRIVACY,
@@ -46,7 +46,8 @@ def get_youtube_client() -> Resource:
         # Set secure file permissions (owner read/write only)
         os.chmod(TOKEN_FILE, 0o600)
 
-    return build("youtube", "v3", credentials=creds)
+    # Discovery doc bundled with google-api-python-client, not fetched
+    return build("youtube", "v3", credentials=creds, static_discovery=True, cache_discovery=False)
 
 
 def _manifest_path(video_id: str) -> str:
@@ -58,8 +59,7 @@ def _load_manifest(video_id: str) -> List[Dict[str, Any]]:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Manifest not found at {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_manifest(path)
 
 
 def upload_single_clip(
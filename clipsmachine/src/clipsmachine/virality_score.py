@@ -11,7 +11,11 @@ Analyzes clips to predict their potential virality based on:
 import os
 import json
 from typing import Dict, Any
-from openai import OpenAI
+
+from .log import get_logger
+from .openai_client import get_openai_client
+
+log = get_logger(__name__)
 
 
 def calculate_virality_score(
@@ -53,7 +57,7 @@ def calculate_virality_score(
         }
 
     # OpenAI SDK automatically uses OPENAI_API_KEY environment variable
-    client = OpenAI()
+    client = get_openai_client()
 
     # Construct the prompt
     prompt = f"""You are an expert in viral short-form video content analysis. Analyze this video clip transcript and predict its virality potential.
@@ -111,7 +115,7 @@ Be critical but fair. Most clips should score 40-70. Only truly exceptional clip
         }
 
     except Exception as e:
-        print(f"[virality] Error calculating virality score for clip {clip_index}: {e}")
+        log.error(f"[virality] Error calculating virality score for clip {clip_index}: {e}")
         return {
             "virality_score": 50,
             "hook_strength": 50,
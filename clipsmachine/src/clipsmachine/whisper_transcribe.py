@@ -3,7 +3,7 @@ import subprocess
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-from openai import OpenAI
+from .openai_client import get_openai_client
 from .subtitle_styles import create_subtitle_style, style_to_ass_format
 
 
@@ -53,7 +53,7 @@ def transcribe_with_whisper(audio_path: str) -> Any:
         raise RuntimeError("OPENAI_API_KEY environment variable not set.")
 
     # OpenAI SDK automatically uses OPENAI_API_KEY environment variable
-    client = OpenAI()
+    client = get_openai_client()
 
     print(f"[whisper] Transcribing audio: {audio_path}")
 
@@ -235,6 +235,7 @@ def generate_whisper_subtitles_for_clip(
     subtitle_format: str = "ass",
     words_per_line: int = 3,
     style_config: Optional[Dict[str, Any]] = None,
+    audio_path: Optional[str] = None,
 ) -> str:
     """
     Complete pipeline: extract audio, transcribe with Whisper, generate subtitles.
@@ -246,15 +247,20 @@ def generate_whisper_subtitles_for_clip(
         subtitle_format: "srt" or "ass"
         words_per_line: Words to display per subtitle line
         style_config: Optional style configuration dict
+        audio_path: Audio already cut for this clip (e.g. by
+            pipeline.cut_audio_ffmpeg); skips extraction from video_path and
+            is left for the caller to remove
 
     Returns:
         Path to the generated subtitle file
     """
     print(f"[whisper] Processing clip #{clip_index} for transcription...")
 
-    # Extract audio
-    audio_dir = os.path.join(output_dir, "audio_temp")
-    audio_path = extract_audio_from_clip(video_path, audio_dir)
+    # Extract audio unless the caller already did
+    extracted = audio_path is None
+    if extracted:
+        audio_dir = os.path.join(output_dir, "audio_temp")
+        audio_path = extract_audio_from_clip(video_path, audio_dir)
 
     # Transcribe with Whisper
     transcript = transcribe_with_whisper(audio_path)
@@ -273,9 +279,10 @@ def generate_whisper_subtitles_for_clip(
     print(f"[whisper] Generated subtitle file: {subtitle_path}")
 
     # Clean up audio file
-    try:
-        os.remove(audio_path)
-    except OSError as e:
-        print(f"[whisper] WARNING: Failed to clean up audio file {audio_path}: {e}")
+    if extracted:
+        try:
+            os.remove(audio_path)
+        except OSError as e:
+            print(f"[whisper] WARNING: Failed to clean up audio file {audio_path}: {e}")
 
     return subtitle_path
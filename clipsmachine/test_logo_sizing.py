@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Quick test script to verify on-video logo sizes (logo_target_size).
+"""
+
+import math
+import sys
+from fractions import Fraction
+sys.path.insert(0, 'src')
+
+from clipsmachine.brand_cache import logo_target_size
+
+
+def ffmpeg_minus_two_height(width, logo_width, logo_height):
+    """Height FFmpeg's scale=W:-2 picks: nearest multiple of 2, halves rounded up."""
+    exact = Fraction(width * logo_height, logo_width * 2)
+    return max(math.floor(exact + Fraction(1, 2)) * 2, 2)
+
+
+def test_logo_width_is_multiple_of_16():
+    """Width is the requested percentage of the video, rounded up to a multiple of 16."""
+    for video_width in (1080, 1920, 720):
+        for size_percent in (1, 5, 10, 15, 20, 33, 50, 100):
+            width, _ = logo_target_size(500, 200, video_width, size_percent)
+            requested = video_width * size_percent // 100
+            assert width % 16 == 0, (video_width, size_percent, width)
+            assert requested <= width < requested + 16, (video_width, size_percent, width)
+
+
+def test_logo_height_follows_minus_two():
+    """Height matches scale=W:-2, including odd source heights and exact halves."""
+    for logo_width, logo_height in [(500, 200), (16, 3), (32, 9), (101, 33), (640, 481), (3, 1999)]:
+        for video_width in (1080, 1920):
+            for size_percent in (5, 10, 15, 33):
+                width, height = logo_target_size(logo_width, logo_height, video_width, size_percent)
+                assert height % 2 == 0, (logo_width, logo_height, width, height)
+                assert height == ffmpeg_minus_two_height(width, logo_width, logo_height), (
+                    logo_width, logo_height, width, height
+                )
+
+
+def test_logo_height_never_zero():
+    """Very wide logos still get a 2-pixel height."""
+    assert logo_target_size(5000, 1, 1080, 5) == (64, 2)
+
+
+if __name__ == "__main__":
+    print("\n🎬 ClipsMachine Logo Sizing Test Suite\n")
+
+    results = []
+
+    # Run all tests
+    for test_name, test in [
+        ("Width Multiple of 16", test_logo_width_is_multiple_of_16),
+        ("Height -2 Semantics", test_logo_height_follows_minus_two),
+        ("Minimum Height", test_logo_height_never_zero),
+    ]:
+        try:
+            test()
+            results.append((test_name, True))
+        except AssertionError as e:
+            print(f"{test_name}: {e}")
+            results.append((test_name, False))
+
+    # Summary
+    print("=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    if all(passed for _, passed in results):
+        print("\n🎉 All tests passed!")
+        sys.exit(0)
+    else:
+        print("\n⚠️  Some tests failed. Please review the output above.")
+        sys.exit(1)